@@ -9,6 +9,10 @@ Available apps:
     - task_demo: タスク管理デモ
     - prefecture_demo: 都道府県データデモ
     - edo_recipe_demo: 江戸料理レシピ検索デモ
+    - search_benchmark: レシピ検索ベンチマーク
+    - async_search_benchmark: 非同期レシピ検索ベンチマーク
+    - task_queue_benchmark: タスクキュー（SKIP LOCKED）ベンチマーク
+    - edo_recipe_sync: 江戸料理レシピ差分同期
 """
 
 import os
@@ -55,7 +59,9 @@ def run_app(app_name: str, app_args: list = None) -> None:
     """指定されたアプリケーションを実行"""
     
     # 利用可能なアプリケーション
-    available_apps = ['connection_test', 'task_demo', 'prefecture_demo', 'edo_recipe_demo']
+    available_apps = ['connection_test', 'task_demo', 'prefecture_demo', 'edo_recipe_demo',
+                      'search_benchmark', 'async_search_benchmark', 'task_queue_benchmark',
+                      'edo_recipe_sync']
     
     if app_name not in available_apps:
         print(f"Error: Unknown app '{app_name}'")
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""非同期レシピ検索ベンチマークアプリケーション
+
+同じ検索ワークロード（全文検索・材料検索・複合検索・詳細取得）を、
+2つの方式で同時実行クライアント数 1 / 10 / 100 の場合について実行し、QPSとレイテンシを比較する。
+
+- thread: RecipeSearchService（同期 psycopg2）をスレッドプールから呼び出す従来の方式
+- async:  AsyncRecipeSearchService を1つのイベントループ上のコルーチンから呼び出す方式
+
+両方式とも同じ接続数上限（--pool-size）で計測する。
+同じ検索を繰り返すワークロードのため、検索結果キャッシュ（ResultCache）は無効にしてデータベースの処理を計測する。
+事前に edo_recipe_demo でレシピデータを登録しておくこと。
+
+Usage:
+    python async_search_benchmark.py [--clients 1 10 100] [--requests N] [--pool-size N]
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+import itertools
+import statistics
+from dataclasses import replace
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple, Dict
+
+from common.database_config import DatabaseConfig
+from common.connection_pool import ConnectionPool
+from common.edo_recipe_manager import EdoRecipeManager
+from common.recipe_search_service import RecipeSearchService
+from common.async_recipe_search_service import AsyncRecipeSearchService
+
+
+DEFAULT_CLIENTS = [1, 10, 100]
+
+# ワークロード（メソッド名, 引数）。get_recipe_details の引数は計測前に実在するIDで補う
+WORKLOAD: List[Tuple[str, Tuple]] = [
+    ('search_by_fulltext', ('卵',)),
+    ('search_by_ingredient', ('醤油',)),
+    ('search_combined', ('卵', '塩')),
+    ('search_by_fulltext', ('豆腐',)),
+    ('search_by_ingredient', ('卵',)),
+]
+
+
+def build_requests(recipe_ids: List[int], count: int) -> List[Tuple[str, Tuple]]:
+    """ワークロードと詳細取得を繰り返して count 件のリクエスト列を作成"""
+    calls = list(WORKLOAD) + [('get_recipe_details', (recipe_id,)) for recipe_id in recipe_ids]
+    return [call for call, _ in zip(itertools.cycle(calls), range(count))]
+
+
+def summarize(latencies: List[float], elapsed: float) -> Dict[str, float]:
+    """QPSとレイテンシ（ミリ秒）の中央値・p95を集計"""
+    ordered = sorted(latencies)
+    return {
+        'qps': len(latencies) / elapsed if elapsed > 0 else 0.0,
+        'median': statistics.median(ordered) * 1000,
+        'p95': ordered[max(0, int(len(ordered) * 0.95) - 1)] * 1000,
+    }
+
+
+def run_threaded(service: RecipeSearchService, requests: List[Tuple[str, Tuple]],
+                 clients: int) -> Dict[str, float]:
+    """スレッドプール方式で全リクエストを clients 並列で実行"""
+    def call(request: Tuple[str, Tuple]) -> float:
+        method, args = request
+        started = time.perf_counter()
+        getattr(service, method)(*args)
+        return time.perf_counter() - started
+    
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as executor:
+        latencies = list(executor.map(call, requests))
+    return summarize(latencies, time.perf_counter() - started)
+
+
+async def run_async(service: AsyncRecipeSearchService, requests: List[Tuple[str, Tuple]],
+                    clients: int) -> Dict[str, float]:
+    """asyncio 方式で全リクエストを clients 個のコルーチンから実行"""
+    pending = iter(requests)
+    latencies: List[float] = []
+    
+    async def client() -> None:
+        # 1スレッドで動作するため、共有イテレーターからの取り出しに排他制御は不要
+        for method, args in pending:
+            started = time.perf_counter()
+            await getattr(service, method)(*args)
+            latencies.append(time.perf_counter() - started)
+    
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    return summarize(latencies, time.perf_counter() - started)
+
+
+async def run_async_levels(db_config: DatabaseConfig, requests: List[Tuple[str, Tuple]],
+                           client_levels: List[int]) -> Dict[int, Dict[str, float]]:
+    """asyncio 方式を各クライアント数で計測（プールは全レベルで共有）"""
+    results = {}
+    async with AsyncRecipeSearchService(db_config) as service:
+        # インデックス有無の判定をキャッシュしてから計測する
+        await service.fan_out(service.ngram_index_available(), service.trigram_index_available())
+        for clients in client_levels:
+            results[clients] = await run_async(service, requests, clients)
+    return results
+
+
+def print_results(client_levels: List[int], threaded: Dict[int, Dict], async_results: Dict[int, Dict]) -> None:
+    """方式ごとの計測結果を表形式で表示"""
+    print(f"{'clients':>7} {'thread QPS':>11} {'median/p95 (ms)':>18} {'async QPS':>11} {'median/p95 (ms)':>18} {'ratio':>6}")
+    for clients in client_levels:
+        t, a = threaded[clients], async_results[clients]
+        ratio = a['qps'] / t['qps'] if t['qps'] else 0.0
+        print(f"{clients:>7} {t['qps']:>11.1f} {t['median']:>8.2f} / {t['p95']:>7.2f} "
+              f"{a['qps']:>11.1f} {a['median']:>8.2f} / {a['p95']:>7.2f} {ratio:>5.2f}x")
+
+
+def run_async_search_benchmark(client_levels: List[int], request_count: int, pool_size: int) -> bool:
+    """スレッドプール方式と asyncio 方式の検索QPSを比較
+    
+    Args:
+        client_levels: 同時実行クライアント数のリスト
+        request_count: クライアント数ごとのリクエスト数
+        pool_size: 両方式の接続数上限
+    
+    Returns:
+        実行成功時はTrue、失敗時はFalse
+    """
+    print("=== 非同期レシピ検索ベンチマーク ===\n")
+    
+    # 検索結果キャッシュが効くとプロセス内の辞書参照を計測することになるため、無効にする
+    db_config = replace(DatabaseConfig.from_environment(), pool_max_size=pool_size,
+                        search_cache_max_entries=0)
+    
+    manager = EdoRecipeManager(db_config)
+    if not manager.tables_exist() or manager.get_total_recipes_count() == 0:
+        print("レシピデータがありません。先に edo_recipe_demo を実行してください。")
+        return False
+    
+    service = RecipeSearchService(db_config)
+    random_recipes = service.get_random_recipes(5) or []
+    requests = build_requests([recipe_id for recipe_id, _ in random_recipes], request_count)
+    print(f"リクエスト数: {len(requests):,}件/計測, 接続数上限: {pool_size}\n")
+    
+    # インデックス有無の判定をキャッシュしてから計測する
+    service.ngram_index_available()
+    service.trigram_index_available()
+    
+    threaded = {}
+    for clients in client_levels:
+        print(f"thread: {clients}クライアントで計測中...")
+        threaded[clients] = run_threaded(service, requests, clients)
+    
+    print("async: 計測中...")
+    async_results = asyncio.run(run_async_levels(db_config, requests, client_levels))
+    
+    print()
+    print_results(client_levels, threaded, async_results)
+    print("\n※ thread 方式はクライアント数と同数のスレッドを使用します")
+    
+    # キャッシュのヒットがあれば、データベース以外を計測した結果が混ざっている
+    cache_stats = service.cache_stats()
+    print(f"検索結果キャッシュ: ヒット {cache_stats['hits']}件, ミス {cache_stats['misses']}件, "
+          f"保持 {cache_stats['entries']}件")
+    if cache_stats['hits']:
+        print("⚠ キャッシュにヒットした検索があります（結果はデータベースの処理だけを計測していません）")
+    
+    ConnectionPool.close_shared_pools()
+    print("\n✓ ベンチマーク完了！")
+    return True
+
+
+def main() -> None:
+    """メイン関数"""
+    parser = argparse.ArgumentParser(description='非同期レシピ検索ベンチマーク')
+    parser.add_argument('--clients', type=int, nargs='+', default=DEFAULT_CLIENTS,
+                       help='同時実行クライアント数（デフォルト: 1 10 100）')
+    parser.add_argument('--requests', type=int, default=2000,
+                       help='クライアント数ごとのリクエスト数（デフォルト: 2000）')
+    parser.add_argument('--pool-size', type=int, default=20,
+                       help='両方式の接続数上限（デフォルト: 20）')
+    
+    args = parser.parse_args()
+    
+    if not run_async_search_benchmark(args.clients, args.requests, args.pool_size):
+        print("\nベンチマークの実行に失敗しました。")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
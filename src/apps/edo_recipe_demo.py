@@ -58,28 +58,31 @@ def setup_database_and_load_data(manager: EdoRecipeManager) -> bool:
     json_path = get_json_file_path()
     
     try:
-        # JSONファイル読み込み
-        all_recipes = JsonRecipeLoader.load_edo_recipes_json(json_path)
-        print(f"✓ {len(all_recipes)}件のレシピデータを読み込みました")
+        # 読み込み→フィルタ→変換・バリデーションを遅延評価のパイプラインで連結し、
+        # レシピを1件ずつ一括挿入に流し込む（ファイル全体をメモリに保持しない）
+        counts = {'loaded': 0, 'valid': 0}
         
-        # 有効なレシピのフィルタリング
-        valid_recipes = JsonRecipeLoader.filter_valid_recipes(all_recipes)
-        print(f"✓ {len(valid_recipes)}件の有効なレシピを検出しました")
+        def count(recipes, key):
+            for recipe in recipes:
+                counts[key] += 1
+                yield recipe
         
-        # データベースに挿入
-        print("\nデータベースに挿入中...")
-        success_count = 0
+        def warn_invalid(recipe):
+            print(f"Warning: レシピID {recipe.get('id')} のバリデーションに失敗しました")
         
-        for recipe in valid_recipes:
-            recipe_data = JsonRecipeLoader.extract_recipe_data(recipe)
-            
-            if JsonRecipeLoader.validate_recipe_data(recipe_data):
-                if manager.insert_recipe(recipe_data):
-                    success_count += 1
-            else:
-                print(f"Warning: レシピID {recipe.get('id')} のバリデーションに失敗しました")
+        recipes = count(JsonRecipeLoader.iter_edo_recipes_json(json_path), 'loaded')
+        valid_recipes = count(JsonRecipeLoader.iter_valid_recipes(recipes), 'valid')
+        recipe_data_stream = JsonRecipeLoader.iter_recipe_data(valid_recipes, on_invalid=warn_invalid)
+        
+        # データベースに一括挿入
+        print("\nデータベースに挿入中...")
+        result = manager.insert_recipes_bulk(recipe_data_stream)
+        if result is None:
+            return False
         
-        print(f"✓ {success_count}件のレシピを登録しました\n")
+        print(f"✓ {counts['loaded']}件のレシピデータを読み込みました")
+        print(f"✓ {counts['valid']}件の有効なレシピを検出しました")
+        print(f"✓ {result['inserted']}件のレシピを登録しました\n")
         return True
         
     except (FileNotFoundError, ValueError) as e:
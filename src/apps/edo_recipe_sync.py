@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""江戸料理レシピ差分同期アプリケーション
+
+レシピを1件ずつ RecipeSyncPipeline に流し込み、取得・読み込みと並行してデータベースへ差分反映する。
+内容が変わっていないレシピは書き込まないため、再実行では変更されたレシピだけが更新される。
+
+- スクレイピング（デフォルト）: test_data/edo_ryori/scrape_test.py の EdoRecipeScraper で取得
+  （requests・beautifulsoup4・pandas と、--parser lxml / lxml-direct では lxml が必要。requirements.txt に含まれる）
+- --json: 保存済みのJSONファイル（scrape_test.py の出力形式）から逐次読み込み
+
+Usage:
+    python edo_recipe_sync.py [--num-recipes N] [--workers N] [--rate N] [--cache-dir DIR] [--offline]
+                              [--parser {html.parser,lxml,lxml-direct}] [--parse-workers N]
+    python edo_recipe_sync.py --json test_data/edo_ryori/edo_recipes_all.json [--parse-workers N]
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+from common.database_config import DatabaseConfig
+from common.edo_recipe_manager import EdoRecipeManager
+from common.json_recipe_loader import JsonRecipeLoader
+from common.recipe_sync_pipeline import RecipeSyncPipeline
+
+
+def create_scraper(args: argparse.Namespace):
+    """test_data/edo_ryori のスクレイパーを読み込んで作成
+    
+    Returns:
+        EdoRecipeScraper、必要なパッケージが無い場合はNone
+    """
+    project_root = Path(__file__).parent.parent.parent
+    sys.path.insert(0, str(project_root / "test_data" / "edo_ryori"))
+    try:
+        from scrape_test import EdoRecipeScraper, DEFAULT_BASE_URL
+        # lxml-direct の解析器は EdoRecipeScraper の初期化時に読み込まれる
+        scraper = EdoRecipeScraper(sleep_time=args.sleep_time, base_url=args.base_url or DEFAULT_BASE_URL,
+                                   workers=args.workers, rate=args.rate, cache_dir=args.cache_dir,
+                                   offline=args.offline, parser=args.parser,
+                                   parse_workers=args.parse_workers)
+    except ImportError as e:
+        print(f"スクレイピングに必要なパッケージがありません: {e}")
+        print("pip install -r requirements.txt でインストールするか、"
+              "--parser html.parser（lxml 不要）または --json を指定してください。")
+        return None
+    return scraper
+
+
+def run_edo_recipe_sync(args: argparse.Namespace) -> bool:
+    """レシピを取得・読み込みしながらデータベースへ差分反映
+    
+    Returns:
+        実行成功時（書き込み失敗なし）はTrue、失敗時はFalse
+    """
+    print("=== 江戸料理レシピ差分同期 ===\n")
+    
+    manager = EdoRecipeManager(DatabaseConfig.from_environment())
+    try:
+        # 既存テーブルにも content_hash 列などを追加するため、毎回実行する（IF NOT EXISTS）
+        if not manager.create_tables():
+            return False
+        
+        started = time.perf_counter()
+        with RecipeSyncPipeline(manager, queue_size=args.queue_size,
+                                batch_size=args.batch_size) as pipeline:
+            if args.json:
+                print(f"JSONファイルから読み込み: {args.json}\n")
+                pipeline.submit_all(JsonRecipeLoader.iter_edo_recipes_json(args.json),
+                                    workers=args.parse_workers)
+            else:
+                scraper = create_scraper(args)
+                if scraper is None:
+                    return False
+                num_recipes = None if args.num_recipes == 0 else args.num_recipes
+                scraper.scrape_recipes(num_recipes=num_recipes, on_recipe=pipeline.submit)
+        
+        stats = pipeline.stats()
+        elapsed = time.perf_counter() - started
+        print(f"\n=== 同期結果（{elapsed:.1f}秒） ===")
+        print(f"受付: {stats['submitted']}件（バリデーション失敗: {stats['invalid']}件, "
+              f"キュー満杯で待機: {stats['queue_full_waits']}回）")
+        print(f"新規: {stats['inserted']}件, 更新: {stats['updated']}件, 変更なし: {stats['unchanged']}件, "
+              f"書き込み失敗: {stats['failed']}件（{stats['batches']}バッチ）")
+        return stats['failed'] == 0
+    
+    except (FileNotFoundError, ValueError) as e:
+        print(f"JSONファイルの読み込みに失敗: {e}")
+        return False
+    except RuntimeError as e:
+        # 書き込みスレッドが停止した場合（submit が待ち続けずに送出する）
+        print(f"データベースへの書き込みが停止しました: {e}")
+        return False
+    finally:
+        manager.close()
+
+
+def main() -> None:
+    """メイン関数"""
+    parser = argparse.ArgumentParser(description='江戸料理レシピ差分同期')
+    parser.add_argument('--json', type=str, default=None,
+                       help='スクレイピングせずに読み込むJSONファイル')
+    parser.add_argument('--num-recipes', type=int, default=0,
+                       help='取得するレシピ数（デフォルト: 0 = 全件）')
+    parser.add_argument('--workers', type=int, default=4,
+                       help='並行取得のワーカー数（デフォルト: 4）')
+    parser.add_argument('--rate', type=float, default=None,
+                       help='ホストごとの最大リクエスト数/秒（デフォルト: 1 / --sleep-time）')
+    parser.add_argument('--sleep-time', type=float, default=1.0,
+                       help='リクエスト間隔（秒、デフォルト: 1.0）')
+    parser.add_argument('--base-url', type=str, default=None,
+                       help='レシピ一覧ページのURL（デフォルト: CODHのレシピ一覧）')
+    parser.add_argument('--cache-dir', type=str, default=None,
+                       help='レスポンスキャッシュのディレクトリ')
+    parser.add_argument('--offline', action='store_true', default=False,
+                       help='ネットワークにアクセスせず --cache-dir のページを使用')
+    parser.add_argument('--parser', type=str, default='lxml-direct',
+                       choices=['html.parser', 'lxml', 'lxml-direct'],
+                       help='個別レシピページの解析方式（デフォルト: lxml-direct）')
+    parser.add_argument('--parse-workers', type=int, default=1,
+                       help='解析・変換のプロセス数（デフォルト: 1 = プロセスプールを使わない）')
+    parser.add_argument('--queue-size', type=int, default=100,
+                       help='書き込み待ちのレシピ数の上限（デフォルト: 100）')
+    parser.add_argument('--batch-size', type=int, default=50,
+                       help='1トランザクションで書き込むレシピ数（デフォルト: 50）')
+    
+    args = parser.parse_args()
+    if args.offline and args.cache_dir is None:
+        parser.error("--offline には --cache-dir の指定が必要です")
+    
+    if not run_edo_recipe_sync(args):
+        print("\n同期に失敗しました。")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,18 +2,20 @@
 """都道府県データデモアプリケーション
 
 PostgreSQLデータベースに都道府県データを登録し、
-面積・人口のTOP3を表示するデモプログラム。
+面積・人口のTOP3と地方別集計を表示するデモプログラム。
 
 Usage:
-    python prefecture_demo.py [--clean]
+    python prefecture_demo.py [--clean] [--copy-format {text,binary}]
     
 Options:
     --clean: 既存テーブルを削除してからクリーンスタート
+    --copy-format: COPY FROM STDIN によるバルクロードで挿入（text または binary）
 """
 
 import sys
 import argparse
 from pathlib import Path
+from typing import Optional
 
 from common.database_config import DatabaseConfig
 from common.prefecture_manager import PrefectureManager
@@ -53,11 +55,27 @@ def display_top_populations(prefecture_manager: PrefectureManager, limit: int =
         print("データの取得に失敗しました")
 
 
-def run_prefecture_demo(clean_start: bool = False) -> bool:
+def display_region_summary(prefecture_manager: PrefectureManager) -> None:
+    """地方別の人口・面積集計を表示（メモリ上のスナップショットで計算）"""
+    print("\n=== 地方別集計 ===")
+    
+    snapshot = prefecture_manager.snapshot()
+    if snapshot is None:
+        print("データの取得に失敗しました")
+        return
+    
+    for region, summary in snapshot.aggregate_by_region().items():
+        largest, _ = snapshot.top_n('population', 1, region=region)[0]
+        print(f"{region}: {summary['count']}都道府県, 人口 {summary['population_sum']:,} 人, "
+              f"人口密度 {summary['population_density']:,.1f} 人/km², 最多 {largest}")
+
+
+def run_prefecture_demo(clean_start: bool = False, copy_format: Optional[str] = None) -> bool:
     """都道府県デモを実行
     
     Args:
         clean_start: True の場合、既存テーブルを削除してから開始
+        copy_format: 指定時は COPY（text/binary）によるバルクロードで挿入
         
     Returns:
         実行成功時はTrue、失敗時はFalse
@@ -93,7 +111,25 @@ def run_prefecture_demo(clean_start: bool = False) -> bool:
                 skip_insert = False
             
             # 4. CSVデータの読み込みと挿入
-            if not skip_insert:
+            if not skip_insert and copy_format:
+                # チャンク単位で型変換・バリデーションしながら COPY に流し込む
+                # （CSV解析はバックグラウンドで先行させ、書き込みと並行させる）
+                print("CSVデータをストリーミングで読み込み・挿入中...")
+                csv_path = get_csv_file_path()
+                
+                try:
+                    chunks = CSVLoader.prefetch(CSVLoader.iter_prefecture_chunks(csv_path))
+                    load_stats = prefecture_manager.insert_prefecture_chunks(chunks, copy_format)
+                    if not load_stats:
+                        return False
+                    if not load_stats['views_refreshed']:
+                        print("⚠ 集計ビューを更新できなかったため、ビューの地方別・全国の集計は古いままです")
+                except (FileNotFoundError, ValueError) as e:
+                    print(f"CSVファイルの読み込みに失敗: {e}")
+                    return False
+                print()
+            
+            elif not skip_insert:
                 print("CSVデータ読み込み中...")
                 csv_path = get_csv_file_path()
                 
@@ -113,6 +149,8 @@ def run_prefecture_demo(clean_start: bool = False) -> bool:
                 
                 print("\nデータ挿入中...")
                 if not prefecture_manager.insert_prefecture_data(prefecture_data):
+                    if prefecture_manager.statistics_views_stale:
+                        print("データは挿入されましたが、集計ビューを更新できなかったため集計は古いままです")
                     return False
                 print()
             
@@ -122,6 +160,9 @@ def run_prefecture_demo(clean_start: bool = False) -> bool:
             # 6. 人口TOP3表示
             display_top_populations(prefecture_manager)
             
+            # 7. 地方別集計
+            display_region_summary(prefecture_manager)
+            
             print(f"\n✓ デモ完了！")
             return True
             
@@ -135,10 +176,12 @@ def main() -> None:
     parser = argparse.ArgumentParser(description='都道府県データデモ')
     parser.add_argument('--clean', action='store_true', 
                        help='既存テーブルを削除してからクリーンスタート')
+    parser.add_argument('--copy-format', choices=['text', 'binary'], default=None,
+                       help='COPY FROM STDIN によるバルクロードで挿入')
     
     args = parser.parse_args()
     
-    success = run_prefecture_demo(clean_start=args.clean)
+    success = run_prefecture_demo(clean_start=args.clean, copy_format=args.copy_format)
     
     if not success:
         print("\nデモの実行に失敗しました。")
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""レシピ検索ベンチマークアプリケーション
+
+合成したコーパス（デフォルト100万件）を専用のベンチマーク用テーブルに生成し、
+インデックス導入前後の検索レイテンシと実行計画を比較する。
+
+--mode fulltext（全文検索）:
+- before: 行ごとに to_tsvector を計算する従来のクエリ（シーケンシャルスキャン）
+- after:  重み付き生成列 search_vector + GINインデックスを使うクエリ
+
+--mode trigram（材料の部分一致検索）:
+- before: インデックスなしの ILIKE '%kw%'
+- after:  pg_trgm（gin_trgm_ops）インデックス作成後の同じクエリ
+
+edo_recipes.id は SMALLINT のため100万件を格納できない。そのため本番テーブルとは
+別に、同じ検索式を持つベンチマーク用テーブルを作成して計測する。
+
+Usage:
+    python search_benchmark.py [--mode {fulltext,trigram}] [--rows N] [--repeat N] [--keep]
+"""
+
+import sys
+import time
+import argparse
+import statistics
+from typing import List, Tuple, Dict
+
+from psycopg2 import Error
+
+from common.database_config import DatabaseConfig
+from common.connection_pool import ConnectionPool
+from common.edo_recipe_manager import EdoRecipeManager
+
+
+BENCH_TABLE = 'fulltext_bench_recipes'
+TRIGRAM_BENCH_TABLE = 'trigram_bench_ingredients'
+
+# 合成コーパスの語彙（'simple' パーサーで単語として分割されるよう空白区切りで連結する）
+VOCABULARY = ['卵', '玉子', '豆腐', '醤油', '味噌', '出汁', '鰹節', '昆布', '胡麻', '山椒',
+              '柚子', '生姜', '葱', '大根', '蕪', '海老', '鯛', '鰻', '鴨', '白魚']
+
+# 検索キーワード（語彙の単語と、出現頻度の低い合成トークン）
+SEARCH_KEYWORDS = ['卵', '柚子', '白魚', 'w42', 'w4999']
+
+# 部分一致検索のキーワード（3文字未満はトライグラムを抽出できずインデックスのフルスキャンになる）
+TRIGRAM_KEYWORDS = ['卵', '醤油', '卵白', '濃口醤油', 'w42']
+
+TRIGRAM_QUERY = f"""
+SELECT recipe_id, ingredient
+FROM {TRIGRAM_BENCH_TABLE}
+WHERE ingredient ILIKE %s
+LIMIT %s;
+"""
+
+BEFORE_QUERY = f"""
+SELECT r.id, r.name, r.description,
+       ts_rank(
+           to_tsvector('simple', r.name || ' ' || COALESCE(r.description, '')),
+           plainto_tsquery('simple', %s)
+       ) as rank
+FROM {BENCH_TABLE} r
+WHERE to_tsvector('simple', r.name || ' ' || COALESCE(r.description, ''))
+      @@ plainto_tsquery('simple', %s)
+ORDER BY rank DESC, r.name
+LIMIT %s;
+"""
+
+AFTER_QUERY = f"""
+SELECT r.id, r.name, r.description,
+       ts_rank(r.search_vector, q.query) as rank
+FROM {BENCH_TABLE} r,
+     plainto_tsquery('simple', %s) AS q(query)
+WHERE r.search_vector @@ q.query
+ORDER BY rank DESC, r.name
+LIMIT %s;
+"""
+
+
+def build_corpus(cur, rows: int) -> None:
+    """ベンチマーク用テーブルを作成し、合成レシピをサーバー側で生成"""
+    vocabulary = "ARRAY[" + ", ".join(f"'{word}'" for word in VOCABULARY) + "]"
+    size = len(VOCABULARY)
+    
+    cur.execute(f"DROP TABLE IF EXISTS {BENCH_TABLE};")
+    cur.execute(f"""
+        CREATE TABLE {BENCH_TABLE} (
+            id INTEGER PRIMARY KEY,
+            name VARCHAR(100) NOT NULL,
+            url TEXT NOT NULL,
+            description TEXT,
+            tips TEXT,
+            original_text TEXT,
+            modern_translation TEXT
+        );
+    """)
+    cur.execute(f"""
+        INSERT INTO {BENCH_TABLE} (id, name, url, description, tips, modern_translation)
+        SELECT g,
+               ({vocabulary})[1 + g %% {size}] || ' ' || ({vocabulary})[1 + (g / {size}) %% {size}] || ' 料理' || g,
+               'https://example.com/recipe/' || g,
+               'w' || (g * 7919) %% 5000 || ' ' || ({vocabulary})[1 + (g * 31) %% {size}] || ' を使った江戸の料理',
+               'w' || (g * 104729) %% 5000 || ' 火加減に注意',
+               ({vocabulary})[1 + (g * 17) %% {size}] || ' を混ぜて焼く'
+        FROM generate_series(1, %s) AS g;
+    """, (rows,))
+    cur.execute(f"ANALYZE {BENCH_TABLE};")
+
+
+def add_search_vector(cur) -> None:
+    """本番と同じ重み付き生成列とGINインデックスを追加"""
+    cur.execute(f"""
+        ALTER TABLE {BENCH_TABLE} ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS ({EdoRecipeManager.SEARCH_VECTOR_EXPRESSION}) STORED;
+    """)
+    cur.execute(f"CREATE INDEX idx_{BENCH_TABLE}_search_vector ON {BENCH_TABLE} USING gin (search_vector);")
+    cur.execute(f"ANALYZE {BENCH_TABLE};")
+
+
+def build_ingredient_corpus(cur, rows: int) -> None:
+    """部分一致検索用のベンチマークテーブルを作成し、合成した材料行をサーバー側で生成"""
+    ingredients = ['卵', '卵白', '卵黄', '濃口醤油', '薄口醤油', '味噌', '出汁', '鰹節', '昆布', '胡麻油',
+                   '山椒', '柚子の皮', '生姜', '長葱', '大根おろし', '海老', '鯛の切り身', '白魚', '砂糖', '塩']
+    vocabulary = "ARRAY[" + ", ".join(f"'{word}'" for word in ingredients) + "]"
+    size = len(ingredients)
+    
+    cur.execute(f"DROP TABLE IF EXISTS {TRIGRAM_BENCH_TABLE};")
+    cur.execute(f"""
+        CREATE TABLE {TRIGRAM_BENCH_TABLE} (
+            id SERIAL PRIMARY KEY,
+            recipe_id INTEGER NOT NULL,
+            ingredient TEXT NOT NULL,
+            sort_order SMALLINT NOT NULL
+        );
+    """)
+    cur.execute(f"""
+        INSERT INTO {TRIGRAM_BENCH_TABLE} (recipe_id, ingredient, sort_order)
+        SELECT g / 5,
+               ({vocabulary})[1 + (g * 7) %% {size}] || ': w' || (g * 7919) %% 5000 || 'g',
+               g %% 5 + 1
+        FROM generate_series(1, %s) AS g;
+    """, (rows,))
+    cur.execute(f"ANALYZE {TRIGRAM_BENCH_TABLE};")
+
+
+def add_trigram_index(cur) -> None:
+    """本番と同じ pg_trgm インデックスを追加"""
+    cur.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+    cur.execute(
+        f"CREATE INDEX idx_{TRIGRAM_BENCH_TABLE}_trgm ON {TRIGRAM_BENCH_TABLE} "
+        f"USING gin (ingredient gin_trgm_ops);"
+    )
+    cur.execute(f"ANALYZE {TRIGRAM_BENCH_TABLE};")
+
+
+def plan_summary(cur, query: str, params: Tuple) -> str:
+    """EXPLAIN から主要なスキャン方式を抽出"""
+    cur.execute("EXPLAIN " + query, params)
+    plan = "\n".join(row[0] for row in cur.fetchall())
+    for scan in ('Bitmap Index Scan', 'Index Scan', 'Seq Scan'):
+        if scan in plan:
+            return scan
+    return 'other'
+
+
+def measure(cur, query: str, params: Tuple, repeat: int) -> Dict:
+    """クエリを repeat 回実行してレイテンシ（ミリ秒）を計測"""
+    timings: List[float] = []
+    hits = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        cur.execute(query, params)
+        hits = len(cur.fetchall())
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return {
+        'median': statistics.median(timings),
+        'p95': timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+        'hits': hits,
+        'plan': plan_summary(cur, query, params)
+    }
+
+
+def print_results(keywords: List[str], before: Dict, after: Dict) -> None:
+    """before/after の計測結果を表形式で表示"""
+    print(f"{'キーワード':<10} {'before median/p95 (ms)':>26} {'after median/p95 (ms)':>26}  plan(before → after)")
+    for kw in keywords:
+        b, a = before[kw], after[kw]
+        print(f"{kw:<10} {b['median']:>12.2f} / {b['p95']:>10.2f}  {a['median']:>12.2f} / {a['p95']:>10.2f}"
+              f"  {b['plan']} → {a['plan']} ({a['hits']}件)")
+
+
+def run_trigram_benchmark(rows: int, repeat: int, limit: int, keep: bool) -> bool:
+    """材料の部分一致検索ベンチマークを実行
+    
+    Args:
+        rows: 合成材料行数
+        repeat: キーワードごとの計測回数
+        limit: 検索結果の取得件数
+        keep: True の場合、計測後もベンチマーク用テーブルを残す
+    
+    Returns:
+        実行成功時はTrue、失敗時はFalse
+    """
+    print("=== 部分一致検索（pg_trgm）ベンチマーク ===\n")
+    
+    db_config = DatabaseConfig.from_environment()
+    pool = ConnectionPool.shared(db_config)
+    
+    try:
+        with pool.connection() as conn:
+            with conn.cursor() as cur:
+                print(f"{rows:,}件の合成材料行を生成中...")
+                started = time.perf_counter()
+                build_ingredient_corpus(cur, rows)
+                conn.commit()
+                print(f"✓ 生成完了（{time.perf_counter() - started:.1f}秒）\n")
+                
+                before = {kw: measure(cur, TRIGRAM_QUERY, (f"%{kw}%", limit), repeat) for kw in TRIGRAM_KEYWORDS}
+                
+                print("pg_trgm インデックスを作成中...")
+                started = time.perf_counter()
+                add_trigram_index(cur)
+                conn.commit()
+                print(f"✓ 作成完了（{time.perf_counter() - started:.1f}秒）\n")
+                
+                after = {kw: measure(cur, TRIGRAM_QUERY, (f"%{kw}%", limit), repeat) for kw in TRIGRAM_KEYWORDS}
+                
+                print_results(TRIGRAM_KEYWORDS, before, after)
+                print("\n※ 3文字未満のキーワードはトライグラムを抽出できないため、インデックスは全件を候補とします")
+                
+                if not keep:
+                    cur.execute(f"DROP TABLE IF EXISTS {TRIGRAM_BENCH_TABLE};")
+                    conn.commit()
+                    print(f"\n✓ {TRIGRAM_BENCH_TABLE} を削除しました")
+        
+        print("\n✓ ベンチマーク完了！")
+        return True
+    
+    except Error as e:
+        print(f"Error running trigram benchmark: {e}")
+        return False
+
+
+def run_search_benchmark(rows: int, repeat: int, limit: int, keep: bool) -> bool:
+    """全文検索ベンチマークを実行
+    
+    Args:
+        rows: 合成レシピ数
+        repeat: キーワードごとの計測回数
+        limit: 検索結果の取得件数
+        keep: True の場合、計測後もベンチマーク用テーブルを残す
+    
+    Returns:
+        実行成功時はTrue、失敗時はFalse
+    """
+    print("=== 全文検索ベンチマーク ===\n")
+    
+    db_config = DatabaseConfig.from_environment()
+    pool = ConnectionPool.shared(db_config)
+    
+    try:
+        with pool.connection() as conn:
+            with conn.cursor() as cur:
+                print(f"{rows:,}件の合成レシピを生成中...")
+                started = time.perf_counter()
+                build_corpus(cur, rows)
+                conn.commit()
+                print(f"✓ 生成完了（{time.perf_counter() - started:.1f}秒）\n")
+                
+                before = {kw: measure(cur, BEFORE_QUERY, (kw, kw, limit), repeat) for kw in SEARCH_KEYWORDS}
+                
+                print("search_vector 生成列とGINインデックスを作成中...")
+                started = time.perf_counter()
+                add_search_vector(cur)
+                conn.commit()
+                print(f"✓ 作成完了（{time.perf_counter() - started:.1f}秒）\n")
+                
+                after = {kw: measure(cur, AFTER_QUERY, (kw, limit), repeat) for kw in SEARCH_KEYWORDS}
+                
+                print_results(SEARCH_KEYWORDS, before, after)
+                
+                if not keep:
+                    cur.execute(f"DROP TABLE IF EXISTS {BENCH_TABLE};")
+                    conn.commit()
+                    print(f"\n✓ {BENCH_TABLE} を削除しました")
+        
+        print("\n✓ ベンチマーク完了！")
+        return True
+    
+    except Error as e:
+        print(f"Error running search benchmark: {e}")
+        return False
+
+
+def main() -> None:
+    """メイン関数"""
+    parser = argparse.ArgumentParser(description='レシピ検索ベンチマーク')
+    parser.add_argument('--mode', choices=['fulltext', 'trigram'], default='fulltext',
+                       help='計測対象（fulltext: 全文検索, trigram: 材料の部分一致検索）')
+    parser.add_argument('--rows', type=int, default=1000000,
+                       help='合成レシピ数・材料行数（デフォルト: 1000000）')
+    parser.add_argument('--repeat', type=int, default=5,
+                       help='キーワードごとの計測回数（デフォルト: 5）')
+    parser.add_argument('--limit', type=int, default=10,
+                       help='検索結果の取得件数（デフォルト: 10）')
+    parser.add_argument('--keep', action='store_true',
+                       help='計測後もベンチマーク用テーブルを残す')
+    
+    args = parser.parse_args()
+    
+    if args.mode == 'trigram':
+        success = run_trigram_benchmark(args.rows, args.repeat, args.limit, args.keep)
+    else:
+        success = run_search_benchmark(args.rows, args.repeat, args.limit, args.keep)
+    
+    if not success:
+        print("\nベンチマークの実行に失敗しました。")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
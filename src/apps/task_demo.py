@@ -59,6 +59,17 @@ def run_task_demo() -> None:
         
         print()
         
+        # 一括操作（1トランザクションで作成・更新・削除）
+        print("5. Batch operations...")
+        batch_ids = task_manager.create_tasks(
+            [(f"一括タスク {i}", "create_tasks で作成") for i in range(1, 6)]
+        )
+        if batch_ids:
+            task_manager.update_tasks([{'id': task_id, 'status': 'done'} for task_id in batch_ids])
+            task_manager.delete_tasks(batch_ids)
+        
+        print()
+        
         # タスクの削除（オプション：デモデータを残したい場合はコメントアウト）
         # if task_id1:
         #     print(f"5. Deleting task {task_id1}...")
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""タスクキュー（SKIP LOCKED）ベンチマークアプリケーション
+
+専用のキューに --tasks 件のタスクを登録し、ワーカープロセス数を変えながら
+claim → ack を繰り返してキューが空になるまでのスループット（タスク/秒）を計測する。
+計測後、すべてのタスクがちょうど1回ずつ処理されたこと（done の件数と試行回数）を確認する。
+
+Usage:
+    python task_queue_benchmark.py [--workers 1 2 4 8] [--tasks N] [--batch-size N]
+"""
+
+import sys
+import time
+import argparse
+import multiprocessing
+from typing import List, Tuple, Dict
+
+from common.database_config import DatabaseConfig
+from common.task_queue import TaskQueue
+
+
+BENCHMARK_QUEUE = 'task_queue_benchmark'
+DEFAULT_WORKERS = [1, 2, 4, 8]
+
+
+def worker(batch_size: int) -> Tuple[int, int]:
+    """キューが空になるまで claim → ack を繰り返す（ワーカープロセスで実行）
+    
+    Returns:
+        (処理したタスク数, claim の回数)
+    """
+    processed = 0
+    claims = 0
+    with TaskQueue(DatabaseConfig.from_environment(), queue=BENCHMARK_QUEUE) as task_queue:
+        while True:
+            claimed = task_queue.claim(batch_size)
+            claims += 1
+            if not claimed:
+                return processed, claims
+            acked = task_queue.ack((task_id, attempts) for task_id, _, _, attempts in claimed)
+            processed += len(acked or [])
+
+
+def verify(task_queue: TaskQueue, task_count: int) -> bool:
+    """全タスクが done で、試行回数がちょうど1回ずつであることを確認"""
+    try:
+        with task_queue.pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT COUNT(*) FILTER (WHERE status = 'done'), COALESCE(SUM(attempts), 0)
+                    FROM tasks WHERE queue = %s;
+                """, (BENCHMARK_QUEUE,))
+                done, attempts = cur.fetchone()
+    except Exception as e:
+        print(f"検証に失敗: {e}")
+        return False
+    
+    if done != task_count or attempts != task_count:
+        print(f"✗ 検証失敗: done={done}, attempts={attempts}（期待値 {task_count}）")
+        return False
+    return True
+
+
+def run_level(task_queue: TaskQueue, workers: int, task_count: int, batch_size: int) -> Dict[str, float]:
+    """キューを作り直し、workers プロセスで空になるまで処理して計測"""
+    task_queue.purge()
+    task_queue.enqueue((f"benchmark task {i}", "") for i in range(task_count))
+    
+    # 子プロセスは親のプール（接続）を引き継がないよう spawn で起動する
+    context = multiprocessing.get_context('spawn')
+    started = time.perf_counter()
+    with context.Pool(processes=workers) as pool:
+        results = pool.map(worker, [batch_size] * workers)
+    elapsed = time.perf_counter() - started
+    
+    processed = sum(count for count, _ in results)
+    return {
+        'processed': processed,
+        'claims': sum(claims for _, claims in results),
+        'seconds': elapsed,
+        'throughput': processed / elapsed if elapsed > 0 else 0.0,
+        'verified': verify(task_queue, task_count),
+    }
+
+
+def run_task_queue_benchmark(worker_levels: List[int], task_count: int, batch_size: int) -> bool:
+    """ワーカープロセス数ごとのキュー処理スループットを計測
+    
+    Args:
+        worker_levels: ワーカープロセス数のリスト
+        task_count: 計測ごとに登録するタスク数
+        batch_size: 1回の claim で取り出す件数
+    
+    Returns:
+        実行成功時（全計測で検証に成功）はTrue、失敗時はFalse
+    """
+    print("=== タスクキュー（SKIP LOCKED）ベンチマーク ===\n")
+    print(f"タスク数: {task_count:,}件/計測, バッチサイズ: {batch_size}\n")
+    
+    all_verified = True
+    with TaskQueue(DatabaseConfig.from_environment(), queue=BENCHMARK_QUEUE) as task_queue:
+        print(f"{'workers':>7} {'tasks/sec':>11} {'seconds':>9} {'claims':>8} {'verified':>9}")
+        for workers in worker_levels:
+            result = run_level(task_queue, workers, task_count, batch_size)
+            all_verified = all_verified and result['verified']
+            print(f"{workers:>7} {result['throughput']:>11,.0f} {result['seconds']:>9.2f} "
+                  f"{result['claims']:>8,} {'✓' if result['verified'] else '✗':>9}")
+        
+        # ベンチマーク用のタスクを残さない
+        task_queue.purge()
+    
+    if all_verified:
+        print("\n✓ ベンチマーク完了！")
+    return all_verified
+
+
+def main() -> None:
+    """メイン関数"""
+    parser = argparse.ArgumentParser(description='タスクキュー（SKIP LOCKED）ベンチマーク')
+    parser.add_argument('--workers', type=int, nargs='+', default=DEFAULT_WORKERS,
+                       help='ワーカープロセス数（デフォルト: 1 2 4 8）')
+    parser.add_argument('--tasks', type=int, default=20000,
+                       help='計測ごとに登録するタスク数（デフォルト: 20000）')
+    parser.add_argument('--batch-size', type=int, default=50,
+                       help='1回の claim で取り出す件数（デフォルト: 50）')
+    
+    args = parser.parse_args()
+    
+    if not run_task_queue_benchmark(args.workers, args.tasks, args.batch_size):
+        print("\nベンチマークの実行に失敗しました。")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
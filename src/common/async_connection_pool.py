@@ -0,0 +1,259 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Sequence, Tuple
+
+import psycopg2
+from psycopg2 import Error, OperationalError
+from psycopg2.extensions import connection, POLL_OK, POLL_READ, POLL_WRITE
+from psycopg2.pool import PoolError
+
+from .connection_pool import PoolTimeout
+from .database_config import DatabaseConfig
+
+
+async def wait_for_connection(conn: connection) -> None:
+    """非同期モードの接続が現在の操作（接続確立・クエリ実行）を完了するまで待機
+    
+    conn.poll() の結果に応じてソケットの読み書き可能をイベントループで待つ。
+    スレッドを占有しないため、1スレッドで多数のクエリを同時に進行できる。
+    
+    Raises:
+        psycopg2.Error: 接続やクエリがエラーになった場合
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        state = conn.poll()
+        if state == POLL_OK:
+            return
+        
+        fd = conn.fileno()
+        ready = loop.create_future()
+        
+        def wake() -> None:
+            if not ready.done():
+                ready.set_result(None)
+        
+        if state == POLL_READ:
+            loop.add_reader(fd, wake)
+            remove = loop.remove_reader
+        elif state == POLL_WRITE:
+            loop.add_writer(fd, wake)
+            remove = loop.remove_writer
+        else:
+            raise OperationalError(f"Unexpected poll state: {state}")
+        
+        try:
+            await ready
+        finally:
+            remove(fd)
+
+
+class _AsyncPooledConnection:
+    """プール内の非同期接続と、その生成・最終利用時刻を保持する"""
+    
+    __slots__ = ('conn', 'created_at', 'last_used')
+    
+    def __init__(self, conn: connection):
+        self.conn = conn
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+class AsyncConnectionPool:
+    """asyncio 用のPostgreSQLコネクションプール（SRP準拠）
+    
+    psycopg2 の非同期モード（async_=True）の接続をイベントループ上で待機する。
+    同期版 ConnectionPool と同じ DatabaseConfig のプール設定（サイズ・寿命・タイムアウト）を使う。
+    - 同時借用数は max_size までに制限（超えた場合は timeout 秒まで待機）
+    - max_idle を超えてアイドルな接続と max_lifetime を超えた接続は再利用しない
+    非同期モードの接続は常にオートコミットで動作するため、読み取り専用の用途を想定する。
+    """
+    
+    def __init__(self, db_config: DatabaseConfig, min_size: int = 1, max_size: int = 10,
+                 max_idle: float = 300.0, max_lifetime: float = 3600.0, timeout: float = 30.0):
+        """AsyncConnectionPoolを初期化（接続は open() または初回借用時に確立）
+        
+        Args:
+            db_config: データベース設定オブジェクト
+            min_size: open() で事前に確立し、アイドル破棄でも保持する接続数
+            max_size: 同時に借用できる最大接続数
+            max_idle: アイドル接続を破棄するまでの秒数
+            max_lifetime: 接続を再作成するまでの最大寿命（秒）
+            timeout: 接続取得の待機上限（秒）
+        """
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(f"Invalid pool size: min_size={min_size}, max_size={max_size}")
+        
+        self.db_config = db_config
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+        self.timeout = timeout
+        
+        self._idle: Deque[_AsyncPooledConnection] = deque()
+        self._in_use: Dict[int, _AsyncPooledConnection] = {}
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._closed = False
+    
+    @classmethod
+    def from_config(cls, db_config: DatabaseConfig) -> 'AsyncConnectionPool':
+        """DatabaseConfigのプール設定からプールを生成"""
+        return cls(db_config, **db_config.to_pool_params())
+    
+    @property
+    def closed(self) -> bool:
+        """プールがクローズ済みかどうか"""
+        return self._closed
+    
+    def _semaphore(self) -> asyncio.Semaphore:
+        """同時借用数を制限するセマフォ（イベントループ上で遅延生成）"""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_size)
+        return self._slots
+    
+    async def _open_connection(self) -> _AsyncPooledConnection:
+        """新しい非同期接続を確立"""
+        try:
+            conn = psycopg2.connect(**self.db_config.to_connection_params(), async_=True)
+            await wait_for_connection(conn)
+            return _AsyncPooledConnection(conn)
+        except Error as e:
+            print(f"Error connecting to PostgreSQL: {e}")
+            raise
+    
+    def _reusable(self, pooled: _AsyncPooledConnection, now: float) -> bool:
+        """アイドル接続を再利用できるか（クローズ済み・寿命超過・アイドル超過は不可）"""
+        if pooled.conn.closed:
+            return False
+        if self.max_lifetime > 0 and now - pooled.created_at >= self.max_lifetime:
+            return False
+        total = len(self._idle) + len(self._in_use)
+        idle_too_long = self.max_idle > 0 and now - pooled.last_used >= self.max_idle
+        return not (idle_too_long and total >= self.min_size)
+    
+    async def open(self) -> 'AsyncConnectionPool':
+        """min_size 分の接続を同時に確立"""
+        opened = await asyncio.gather(*(self._open_connection() for _ in range(self.min_size)))
+        self._idle.extend(opened)
+        return self
+    
+    async def getconn(self) -> connection:
+        """プールから接続を借用
+        
+        Returns:
+            借用した接続（使用後は putconn で返却すること）
+        
+        Raises:
+            PoolError: プールがクローズ済みの場合
+            PoolTimeout: timeout秒以内に接続を取得できない場合
+        """
+        if self._closed:
+            raise PoolError("connection pool is closed")
+        
+        slots = self._semaphore()
+        try:
+            await asyncio.wait_for(slots.acquire(), self.timeout)
+        except asyncio.TimeoutError:
+            raise PoolTimeout(f"Timed out waiting for a connection (max_size={self.max_size})") from None
+        
+        try:
+            pooled = None
+            now = time.monotonic()
+            while self._idle:
+                # 直近に使われた接続を優先（LIFO）
+                candidate = self._idle.pop()
+                if self._reusable(candidate, now):
+                    pooled = candidate
+                    break
+                candidate.conn.close()
+            if pooled is None:
+                pooled = await self._open_connection()
+        except BaseException:
+            slots.release()
+            raise
+        
+        self._in_use[id(pooled.conn)] = pooled
+        return pooled.conn
+    
+    def putconn(self, conn: connection, discard: bool = False) -> None:
+        """借用した接続をプールへ返却
+        
+        Args:
+            conn: getconn で借用した接続
+            discard: True の場合は再利用せずに破棄（実行中に取り消された接続など）
+        """
+        pooled = self._in_use.pop(id(conn), None)
+        if pooled is None:
+            raise PoolError("trying to put unkeyed connection")
+        
+        if discard or conn.closed or self._closed:
+            conn.close()
+        else:
+            pooled.last_used = time.monotonic()
+            self._idle.append(pooled)
+        self._semaphore().release()
+    
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[connection]:
+        """接続を借用し、ブロック終了時に自動で返却する非同期コンテキストマネージャー
+        
+        クエリ実行中の取り消し（タスクのキャンセル・タイムアウト）やエラーの後は、
+        接続の状態が保証できないため破棄する。
+        """
+        conn = await self.getconn()
+        try:
+            yield conn
+        except BaseException:
+            self.putconn(conn, discard=True)
+            raise
+        else:
+            self.putconn(conn)
+    
+    async def fetchall(self, query: str, params: Optional[Sequence[Any]] = None) -> List[Tuple]:
+        """接続を借用してクエリを実行し、全行を取得
+        
+        Args:
+            query: SQL
+            params: クエリパラメータ
+        
+        Returns:
+            結果行のリスト
+        """
+        async with self.connection() as conn:
+            cur = conn.cursor()
+            try:
+                cur.execute(query, params)
+                await wait_for_connection(conn)
+                return cur.fetchall()
+            finally:
+                cur.close()
+    
+    def stats(self) -> Dict[str, int]:
+        """プールの利用状況を取得
+        
+        Returns:
+            idle/in_use/max_size を含む辞書
+        """
+        return {
+            'idle': len(self._idle),
+            'in_use': len(self._in_use),
+            'min_size': self.min_size,
+            'max_size': self.max_size
+        }
+    
+    def close(self) -> None:
+        """アイドル接続をすべてクローズし、以降の借用を拒否（借用中の接続は返却時にクローズ）"""
+        self._closed = True
+        while self._idle:
+            self._idle.pop().conn.close()
+    
+    async def __aenter__(self):
+        """非同期コンテキストマネージャーのエントリー（min_size 分の接続を確立）"""
+        return await self.open()
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """非同期コンテキストマネージャーのイグジット"""
+        self.close()
@@ -0,0 +1,227 @@
+import asyncio
+from typing import Any, Awaitable, Coroutine, Dict, Iterable, List, Optional, Tuple
+
+from psycopg2 import Error
+
+from .async_connection_pool import AsyncConnectionPool
+from .database_config import DatabaseConfig
+from .edo_recipe_manager import EdoRecipeManager
+from .ngram_tokenizer import NgramTokenizer
+from .page_token import PageToken
+from .recipe_search_service import RecipeSearchService
+from .result_cache import ResultCache
+
+
+class AsyncRecipeSearchService:
+    """江戸料理レシピ検索の asyncio 版（SRP準拠）
+    
+    RecipeSearchService と同じ検索メソッドをコルーチンとして提供する。
+    クエリの組み立ては RecipeSearchService と共有し、実行だけを AsyncConnectionPool で行う。
+    各メソッドは呼び出しごとに接続を借用するため、独立した検索は fan_out で同時に実行できる。
+    """
+    
+    def __init__(self, db_config: DatabaseConfig, pool: Optional[AsyncConnectionPool] = None):
+        """AsyncRecipeSearchServiceを初期化
+        
+        Args:
+            db_config: データベース設定オブジェクト
+            pool: 共有する非同期プール（Noneの場合は db_config のプール設定で生成し、close で閉じる）
+        """
+        self.db_config = db_config
+        self.pool = pool or AsyncConnectionPool.from_config(db_config)
+        self._owns_pool = pool is None
+        self._trigram_available: Optional[bool] = None
+        self._ngram_available: Optional[bool] = None
+        # 同期版と同じ共有キャッシュ（EdoRecipeManager の書き込み時に破棄される）
+        self.cache = ResultCache.shared(EdoRecipeManager.SEARCH_CACHE_NAMESPACE, db_config)
+    
+    async def trigram_index_available(self, refresh: bool = False) -> bool:
+        """部分一致検索用の pg_trgm インデックスが利用可能か判定（結果はキャッシュ）"""
+        if self._trigram_available is not None and not refresh:
+            return self._trigram_available
+        
+        try:
+            rows = await self.pool.fetchall(RecipeSearchService.TRIGRAM_CHECK_QUERY,
+                                            (RecipeSearchService.TRIGRAM_INDEX_NAMES,))
+        except Error as e:
+            print(f"Error checking trigram indexes: {e}")
+            return False
+        
+        has_extension, index_count = rows[0]
+        self._trigram_available = (bool(has_extension)
+                                   and index_count == len(RecipeSearchService.TRIGRAM_INDEX_NAMES))
+        if not self._trigram_available:
+            print("Notice: pg_trgmインデックスが見つかりません。部分一致検索は全件走査になります")
+        return self._trigram_available
+    
+    async def ngram_index_available(self, refresh: bool = False) -> bool:
+        """日本語N-gram検索用の列とインデックスが利用可能か判定（結果はキャッシュ）"""
+        if self._ngram_available is not None and not refresh:
+            return self._ngram_available
+        
+        try:
+            rows = await self.pool.fetchall(RecipeSearchService.NGRAM_CHECK_QUERY,
+                                            (RecipeSearchService.NGRAM_INDEX_NAMES,))
+        except Error as e:
+            print(f"Error checking ngram indexes: {e}")
+            return False
+        
+        self._ngram_available = rows[0][0] == len(RecipeSearchService.NGRAM_INDEX_NAMES)
+        if not self._ngram_available:
+            print("Notice: N-gramインデックスが見つかりません。日本語キーワードは部分一致検索で処理します")
+        return self._ngram_available
+    
+    async def _ngram_enabled(self, *keywords: str) -> bool:
+        """日本語キーワードにN-gramインデックスを使えるか判定（RecipeSearchService._ngram_enabled と同じ規則）"""
+        has_cjk = [NgramTokenizer.contains_cjk(keyword) for keyword in keywords]
+        enabled = any(has_cjk) and await self.ngram_index_available()
+        if not enabled or not all(has_cjk):
+            await self.trigram_index_available()
+        return enabled
+    
+    async def _cached_first_page(self, key: Tuple,
+                                 load_page: Coroutine[Any, Any, Optional[Tuple[List[Tuple], Optional[str]]]]
+                                 ) -> Optional[List[Tuple]]:
+        """先頭ページの結果をキャッシュ経由で取得（RecipeSearchService._cached_first_page と同じ規則）"""
+        rows = self.cache.get(key)
+        if rows is None:
+            generation = self.cache.generation
+            page = await load_page
+            if not page:
+                return None
+            rows = page[0]
+            self.cache.put(key, rows, generation)
+        else:
+            # 未使用のコルーチンを閉じて警告を防ぐ
+            load_page.close()
+        return list(rows)
+    
+    @staticmethod
+    async def fan_out(*calls: Awaitable[Any]) -> List[Any]:
+        """独立した検索を同時に実行し、結果を引数の順に返す
+        
+        例: ingredients, fulltext = await service.fan_out(
+                service.search_by_ingredient('卵'), service.search_by_fulltext('卵'))
+        
+        各検索は別々の接続を借用するため、所要時間はおおむね最も遅い検索1件分になる。
+        """
+        return list(await asyncio.gather(*calls))
+    
+    async def search_by_ingredient(self, ingredient_keyword: str, limit: int = 10) -> Optional[List[Tuple]]:
+        """材料での検索（RecipeSearchService.search_by_ingredient の非同期版、同じキャッシュを共有）"""
+        keyword = RecipeSearchService.normalize_keyword(ingredient_keyword)
+        return await self._cached_first_page(('search_by_ingredient', keyword, limit),
+                                             self.search_by_ingredient_page(keyword, limit))
+    
+    async def search_by_ingredient_page(self, ingredient_keyword: str, limit: int = 10,
+                                        page_token: Optional[str] = None
+                                        ) -> Optional[Tuple[List[Tuple], Optional[str]]]:
+        """材料での検索（キーセットページネーション）
+        
+        Raises:
+            ValueError: page_token が不正な場合
+        """
+        after = PageToken.decode('ingredient', page_token, 2) if page_token else None
+        try:
+            rows = await self.pool.fetchall(*RecipeSearchService.build_ingredient_search(
+                ingredient_keyword, limit + 1, after, await self._ngram_enabled(ingredient_keyword)))
+        except Error as e:
+            print(f"Error searching by ingredient: {e}")
+            return None
+        
+        return RecipeSearchService.paginate('ingredient', rows, limit, lambda row: (row[1], row[0]))
+    
+    async def search_by_fulltext(self, search_keyword: str, limit: int = 10) -> Optional[List[Tuple]]:
+        """全文検索（RecipeSearchService.search_by_fulltext の非同期版、同じキャッシュを共有）"""
+        keyword = RecipeSearchService.normalize_keyword(search_keyword)
+        return await self._cached_first_page(('search_by_fulltext', keyword, limit),
+                                             self.search_by_fulltext_page(keyword, limit))
+    
+    async def search_by_fulltext_page(self, search_keyword: str, limit: int = 10,
+                                      page_token: Optional[str] = None
+                                      ) -> Optional[Tuple[List[Tuple], Optional[str]]]:
+        """全文検索（キーセットページネーション）
+        
+        Raises:
+            ValueError: page_token が不正な場合
+        """
+        after = PageToken.decode('fulltext', page_token, 3) if page_token else None
+        ngram_available = NgramTokenizer.contains_cjk(search_keyword) and await self.ngram_index_available()
+        try:
+            rows = await self.pool.fetchall(*RecipeSearchService.build_fulltext_search(
+                search_keyword, limit + 1, after, ngram_available))
+        except Error as e:
+            print(f"Error in fulltext search: {e}")
+            return None
+        
+        return RecipeSearchService.paginate('fulltext', rows, limit,
+                                            lambda row: (row[3], row[1], row[0]))
+    
+    async def search_combined(self, recipe_keyword: str, ingredient_keyword: str,
+                              limit: int = 10) -> Optional[List[Tuple]]:
+        """複合検索（RecipeSearchService.search_combined の非同期版、同じキャッシュを共有）"""
+        recipe_kw = RecipeSearchService.normalize_keyword(recipe_keyword)
+        ingredient_kw = RecipeSearchService.normalize_keyword(ingredient_keyword)
+        return await self._cached_first_page(('search_combined', (recipe_kw, ingredient_kw), limit),
+                                             self.search_combined_page(recipe_kw, ingredient_kw, limit))
+    
+    async def search_combined_page(self, recipe_keyword: str, ingredient_keyword: str, limit: int = 10,
+                                   page_token: Optional[str] = None
+                                   ) -> Optional[Tuple[List[Tuple], Optional[str]]]:
+        """複合検索（キーセットページネーション）
+        
+        Raises:
+            ValueError: page_token が不正な場合
+        """
+        after = PageToken.decode('combined', page_token, 2) if page_token else None
+        try:
+            ngram_available = await self._ngram_enabled(recipe_keyword, ingredient_keyword)
+            rows = await self.pool.fetchall(*RecipeSearchService.build_combined_search(
+                recipe_keyword, ingredient_keyword, limit + 1, after, ngram_available))
+        except Error as e:
+            print(f"Error in combined search: {e}")
+            return None
+        
+        return RecipeSearchService.paginate('combined', rows, limit, lambda row: (row[1], row[0]))
+    
+    async def _fetch_recipe_details(self, recipe_ids: List[int]) -> Dict[int, Dict]:
+        """指定IDのレシピ詳細を1往復で取得（エラーは呼び出し側で処理）"""
+        rows = await self.pool.fetchall(RecipeSearchService.RECIPE_DETAILS_QUERY, (recipe_ids,))
+        return {row[0]: dict(zip(RecipeSearchService.RECIPE_DETAILS_KEYS, row)) for row in rows}
+    
+    async def get_recipe_details(self, recipe_id: int) -> Optional[Dict]:
+        """レシピ詳細情報を取得（RecipeSearchService.get_recipe_details の非同期版）"""
+        try:
+            return (await self._fetch_recipe_details([recipe_id])).get(recipe_id)
+        except Error as e:
+            print(f"Error getting recipe details: {e}")
+            return None
+    
+    async def get_recipes_details(self, recipe_ids: Iterable[int]) -> Optional[List[Dict]]:
+        """複数レシピの詳細情報を1ステートメントで一括取得（指定順、重複と存在しないIDは除く）"""
+        ids = list(dict.fromkeys(recipe_ids))
+        if not ids:
+            return []
+        
+        try:
+            details_by_id = await self._fetch_recipe_details(ids)
+            return [details_by_id[recipe_id] for recipe_id in ids if recipe_id in details_by_id]
+        except Error as e:
+            print(f"Error getting recipes details: {e}")
+            return None
+    
+    def close(self) -> None:
+        """自前で生成したプールをクローズ（外部から渡されたプールは閉じない）"""
+        if self._owns_pool and self.pool is not None:
+            self.pool.close()
+        self.pool = None
+    
+    async def __aenter__(self):
+        """非同期コンテキストマネージャーのエントリー（自前のプールは接続を事前確立）"""
+        if self._owns_pool:
+            await self.pool.open()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """非同期コンテキストマネージャーのイグジット"""
+        self.close()
@@ -0,0 +1,231 @@
+import select
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import psycopg2
+from psycopg2 import Error
+from psycopg2.extensions import connection, ISOLATION_LEVEL_AUTOCOMMIT
+
+from .database_config import DatabaseConfig
+from .result_cache import ResultCache
+
+
+class CacheInvalidation:
+    """テーブル更新時に NOTIFY を送るトリガーの管理（SRP準拠）
+    
+    文単位の AFTER トリガーが、INSERT/UPDATE/DELETE/TRUNCATE（COPY を含む）のたびに
+    CHANNEL へテーブル名をペイロードとして通知する。
+    同じトランザクション内の同一ペイロードの通知は PostgreSQL が1件にまとめ、コミット時にだけ配信される。
+    NOTIFY を含むトランザクションのコミットはクラスタ全体のロックで直列化されるため、
+    キャッシュに影響しない高頻度の更新（作業キューの状態遷移など）は SUPPRESS_QUERY で通知を止める。
+    """
+    
+    CHANNEL = 'cache_invalidation'
+    
+    # この設定が on のトランザクションでは、トリガーは通知しない
+    SUPPRESS_SETTING = 'cache_invalidation.suppress'
+    
+    # トランザクション内の以降の変更を通知しない（SET LOCAL のためコミット・ロールバックで元に戻る）
+    SUPPRESS_QUERY = f"SET LOCAL {SUPPRESS_SETTING} = 'on';"
+    
+    # すべてのテーブルが変更された可能性を表すペイロード（リスナーの再接続時など）
+    ALL_TABLES = '*'
+    
+    FUNCTION_QUERY = f"""
+    CREATE OR REPLACE FUNCTION notify_cache_invalidation() RETURNS trigger AS $$
+    BEGIN
+        IF current_setting('{SUPPRESS_SETTING}', true) IS DISTINCT FROM 'on' THEN
+            PERFORM pg_notify('{CHANNEL}', TG_TABLE_NAME);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """
+    
+    @staticmethod
+    def trigger_name(table_name: str) -> str:
+        """テーブルごとの通知トリガー名"""
+        return f"trg_{table_name}_notify_cache"
+    
+    @classmethod
+    def install(cls, cur, table_names: Iterable[str]) -> None:
+        """通知関数と、未作成のテーブルの通知トリガーを作成
+        
+        トリガーの作成はテーブルをロックするため、作成済みのテーブルには何もしない。
+        通知関数は、作成済みでも SUPPRESS_SETTING に対応していない古い定義なら置き換える。
+        
+        Args:
+            cur: 借用中の接続のカーソル（コミットは呼び出し側で行う）
+            table_names: 通知対象のテーブル名
+        """
+        table_names = list(table_names)
+        cur.execute("""
+            SELECT c.relname FROM pg_trigger t JOIN pg_class c ON c.oid = t.tgrelid
+            WHERE c.relname = ANY(%s) AND t.tgname = 'trg_' || c.relname || '_notify_cache';
+        """, (table_names,))
+        installed = {row[0] for row in cur.fetchall()}
+        missing = [table_name for table_name in table_names if table_name not in installed]
+        
+        cur.execute("SELECT prosrc FROM pg_proc WHERE proname = 'notify_cache_invalidation';")
+        function = cur.fetchone()
+        if function is None or cls.SUPPRESS_SETTING not in function[0]:
+            cur.execute(cls.FUNCTION_QUERY)
+        
+        for table_name in missing:
+            cur.execute(
+                f"CREATE TRIGGER {cls.trigger_name(table_name)} "
+                f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table_name} "
+                f"FOR EACH STATEMENT EXECUTE FUNCTION notify_cache_invalidation();"
+            )
+    
+    @classmethod
+    def notify(cls, cur, table_names: Iterable[str]) -> None:
+        """トリガーを経由しない変更（DROP TABLE など）を明示的に通知（コミット時に配信）
+        
+        Args:
+            cur: 借用中の接続のカーソル
+            table_names: 変更したテーブル名
+        """
+        for table_name in table_names:
+            cur.execute("SELECT pg_notify(%s, %s);", (cls.CHANNEL, table_name))
+
+
+class CacheInvalidationListener:
+    """NOTIFY を受信してプロセス内のキャッシュを破棄・再読み込みするリスナー（SRP準拠）
+    
+    LISTEN はセッション単位のため、プールとは別の専用接続をバックグラウンドスレッドで保持する。
+    - subscribe() でテーブル名ごとのコールバック（引数は変更されたテーブル名）を登録する
+    - 接続が切れた場合は再接続し、切断中の通知を取りこぼした可能性があるため全コールバックを呼ぶ
+    ワーカープロセスごとに1つ起動する想定。
+    """
+    
+    def __init__(self, db_config: DatabaseConfig, channel: str = CacheInvalidation.CHANNEL,
+                 poll_interval: float = 1.0, reconnect_delay: float = 5.0):
+        """CacheInvalidationListenerを初期化（受信は start() で開始）
+        
+        Args:
+            db_config: データベース設定オブジェクト
+            channel: LISTEN するチャネル名
+            poll_interval: 停止要求を確認する間隔（秒）
+            reconnect_delay: 接続失敗時に再接続するまでの待機秒数
+        """
+        self.db_config = db_config
+        self.channel = channel
+        self.poll_interval = poll_interval
+        self.reconnect_delay = reconnect_delay
+        
+        self._callbacks: Dict[str, List[Callable[[str], None]]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._connected = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._conn: Optional[connection] = None
+        self.received = 0
+    
+    def subscribe(self, table_names: Iterable[str], callback: Callable[[str], None]) -> None:
+        """テーブルの変更通知を受けたときに呼ぶコールバックを登録
+        
+        Args:
+            table_names: 対象のテーブル名
+            callback: 変更されたテーブル名を受け取る関数（受信スレッドから呼ばれる）
+        """
+        with self._lock:
+            for table_name in table_names:
+                self._callbacks.setdefault(table_name, []).append(callback)
+    
+    def invalidate_on(self, table_names: Iterable[str], cache: ResultCache) -> None:
+        """テーブルの変更通知を受けたときに ResultCache を破棄するよう登録"""
+        self.subscribe(table_names, lambda _table_name: cache.invalidate())
+    
+    def _dispatch(self, table_name: str) -> None:
+        """通知されたテーブルのコールバックを呼ぶ（ALL_TABLES の場合は全コールバック）"""
+        with self._lock:
+            if table_name == CacheInvalidation.ALL_TABLES:
+                # 同じコールバックが複数テーブルに登録されていても1回だけ呼ぶ
+                targets: List[Tuple[str, Callable[[str], None]]] = list({
+                    id(callback): (name, callback)
+                    for name, callbacks in self._callbacks.items() for callback in callbacks
+                }.values())
+            else:
+                targets = [(table_name, callback) for callback in self._callbacks.get(table_name, [])]
+        
+        for name, callback in targets:
+            try:
+                callback(name)
+            except Exception as e:
+                # 1つのコールバックの失敗で受信スレッドを止めない
+                print(f"Error in cache invalidation callback for {name}: {e}")
+    
+    def _listen(self) -> connection:
+        """専用接続を確立して LISTEN を開始"""
+        conn = psycopg2.connect(**self.db_config.to_connection_params())
+        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        with conn.cursor() as cur:
+            cur.execute(f"LISTEN {self.channel};")
+        return conn
+    
+    def _run(self) -> None:
+        """受信ループ（バックグラウンドスレッド）"""
+        first_connect = True
+        while not self._stop.is_set():
+            try:
+                self._conn = self._listen()
+            except Error as e:
+                print(f"Error starting cache invalidation listener: {e}")
+                first_connect = False
+                self._stop.wait(self.reconnect_delay)
+                continue
+            
+            if not first_connect:
+                # LISTEN していなかった間の通知は失われているため、すべてのキャッシュを破棄する
+                self._dispatch(CacheInvalidation.ALL_TABLES)
+            first_connect = False
+            self._connected.set()
+            
+            try:
+                while not self._stop.is_set():
+                    readable, _, _ = select.select([self._conn], [], [], self.poll_interval)
+                    if not readable:
+                        continue
+                    self._conn.poll()
+                    self.received += len(self._conn.notifies)
+                    # 同じテーブルの通知が溜まっていれば1回にまとめる
+                    table_names = list(dict.fromkeys(notify.payload for notify in self._conn.notifies))
+                    self._conn.notifies.clear()
+                    for table_name in table_names:
+                        self._dispatch(table_name)
+            except (Error, OSError, ValueError) as e:
+                if not self._stop.is_set():
+                    print(f"Cache invalidation listener disconnected, reconnecting: {e}")
+            finally:
+                self._connected.clear()
+                if not self._conn.closed:
+                    self._conn.close()
+    
+    def start(self, wait: float = 5.0) -> bool:
+        """受信スレッドを開始し、LISTEN が有効になるまで最大 wait 秒待機
+        
+        Returns:
+            LISTEN を開始できた場合True（False でも受信スレッドは再接続を続ける）
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='cache-invalidation-listener', daemon=True)
+            self._thread.start()
+        return self._connected.wait(wait)
+    
+    def stop(self) -> None:
+        """受信スレッドを停止して専用接続をクローズ"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+    
+    def __enter__(self):
+        """コンテキストマネージャーのエントリー"""
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """コンテキストマネージャーのイグジット"""
+        self.stop()
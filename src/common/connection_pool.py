@@ -0,0 +1,314 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Tuple, Deque, Iterator
+
+import psycopg2
+from psycopg2 import Error
+from psycopg2.extensions import connection, TRANSACTION_STATUS_IDLE
+from psycopg2.pool import PoolError
+
+from .database_config import DatabaseConfig
+
+
+class PoolTimeout(PoolError):
+    """プールから接続を取得できずタイムアウトした場合の例外"""
+
+
+class _PooledConnection:
+    """プール内の接続と、その生成・最終利用時刻を保持する"""
+    
+    __slots__ = ('conn', 'created_at', 'last_used')
+    
+    def __init__(self, conn: connection):
+        self.conn = conn
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+class ConnectionPool:
+    """スレッドセーフなPostgreSQLコネクションプール（SRP準拠）
+    
+    DatabaseConfigから生成し、各マネージャーは操作ごとに接続を借用・返却する。
+    - min_size/max_size によるサイズ制御
+    - 取得時のヘルスチェック（一定時間アイドルだった接続は SELECT 1 で確認）
+    - max_idle を超えてアイドルな接続の破棄（min_size までは保持）
+    - max_lifetime を超えた接続の再作成
+    """
+    
+    _shared_pools: Dict[Tuple, 'ConnectionPool'] = {}
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, db_config: DatabaseConfig, min_size: int = 1, max_size: int = 10,
+                 max_idle: float = 300.0, max_lifetime: float = 3600.0,
+                 timeout: float = 30.0, health_check_interval: float = 5.0):
+        """ConnectionPoolを初期化し、min_size分の接続を事前に確立
+        
+        Args:
+            db_config: データベース設定オブジェクト
+            min_size: 常に保持する接続数
+            max_size: 同時に確立できる最大接続数
+            max_idle: アイドル接続を破棄するまでの秒数
+            max_lifetime: 接続を再作成するまでの最大寿命（秒）
+            timeout: 接続取得の待機上限（秒）
+            health_check_interval: この秒数以上アイドルだった接続は取得時に疎通確認する
+        """
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(f"Invalid pool size: min_size={min_size}, max_size={max_size}")
+        
+        self.db_config = db_config
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        
+        self._idle: Deque[_PooledConnection] = deque()
+        self._in_use: Dict[int, _PooledConnection] = {}
+        self._opening = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        
+        for _ in range(min_size):
+            self._idle.append(self._open_connection())
+    
+    @classmethod
+    def from_config(cls, db_config: DatabaseConfig) -> 'ConnectionPool':
+        """DatabaseConfigのプール設定からプールを生成"""
+        return cls(db_config, **db_config.to_pool_params())
+    
+    @classmethod
+    def shared(cls, db_config: DatabaseConfig) -> 'ConnectionPool':
+        """接続先ごとに共有されるプールを取得（未作成なら生成）
+        
+        Args:
+            db_config: データベース設定オブジェクト
+        
+        Returns:
+            同一接続先で共有されるConnectionPool
+        """
+        key = tuple(sorted(db_config.to_connection_params().items()))
+        with cls._shared_lock:
+            pool = cls._shared_pools.get(key)
+            if pool is None or pool.closed:
+                pool = cls.from_config(db_config)
+                cls._shared_pools[key] = pool
+                print(f"Connection pool created: {db_config}")
+            return pool
+    
+    @classmethod
+    def close_shared_pools(cls) -> None:
+        """共有プールをすべてクローズ（アプリケーション終了時に使用）"""
+        with cls._shared_lock:
+            pools = list(cls._shared_pools.values())
+            cls._shared_pools.clear()
+        for pool in pools:
+            pool.close()
+    
+    @property
+    def closed(self) -> bool:
+        """プールがクローズ済みかどうか"""
+        return self._closed
+    
+    def _open_connection(self) -> _PooledConnection:
+        """新しい物理接続を確立"""
+        try:
+            return _PooledConnection(psycopg2.connect(**self.db_config.to_connection_params()))
+        except Error as e:
+            print(f"Error connecting to PostgreSQL: {e}")
+            raise
+    
+    def _is_expired(self, pooled: _PooledConnection, now: float) -> bool:
+        """最大寿命を超えているか"""
+        return self.max_lifetime > 0 and now - pooled.created_at >= self.max_lifetime
+    
+    def _is_healthy(self, pooled: _PooledConnection, now: float) -> bool:
+        """取得時のヘルスチェック"""
+        if pooled.conn.closed:
+            return False
+        if now - pooled.last_used < self.health_check_interval:
+            return True
+        try:
+            with pooled.conn.cursor() as cur:
+                cur.execute("SELECT 1;")
+            pooled.conn.rollback()
+            return True
+        except Error:
+            return False
+    
+    @staticmethod
+    def _discard(pooled: _PooledConnection) -> None:
+        """物理接続を破棄"""
+        try:
+            pooled.conn.close()
+        except Error:
+            pass
+    
+    def _evict_idle(self, now: float) -> list:
+        """アイドル超過・寿命超過の接続をアイドルキューから取り除く（ロック保持中に呼ぶ）"""
+        evicted = []
+        kept: Deque[_PooledConnection] = deque()
+        total = len(self._idle) + len(self._in_use) + self._opening
+        
+        for pooled in self._idle:
+            idle_too_long = self.max_idle > 0 and now - pooled.last_used >= self.max_idle
+            if self._is_expired(pooled, now) or (idle_too_long and total > self.min_size):
+                evicted.append(pooled)
+                total -= 1
+            else:
+                kept.append(pooled)
+        
+        self._idle = kept
+        return evicted
+    
+    def getconn(self) -> connection:
+        """プールから接続を借用
+        
+        Returns:
+            借用した接続（使用後は putconn で返却すること）
+        
+        Raises:
+            PoolError: プールがクローズ済みの場合
+            PoolTimeout: timeout秒以内に接続を取得できない場合
+        """
+        deadline = time.monotonic() + self.timeout
+        
+        while True:
+            pooled = None
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise PoolError("connection pool is closed")
+                    
+                    now = time.monotonic()
+                    for stale in self._evict_idle(now):
+                        self._discard(stale)
+                    
+                    if self._idle:
+                        # 直近に使われた接続を優先（LIFO）し、古い接続はアイドル破棄に回す
+                        pooled = self._idle.pop()
+                        self._in_use[id(pooled.conn)] = pooled
+                        break
+                    
+                    if len(self._in_use) + self._opening < self.max_size:
+                        self._opening += 1
+                        break
+                    
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        raise PoolTimeout(
+                            f"Timed out waiting for a connection (max_size={self.max_size})"
+                        )
+                    self._cond.wait(remaining)
+            
+            if pooled is None:
+                # ロック外で新規接続を確立
+                try:
+                    pooled = self._open_connection()
+                except Exception:
+                    with self._cond:
+                        self._opening -= 1
+                        self._cond.notify()
+                    raise
+                with self._cond:
+                    self._opening -= 1
+                    self._in_use[id(pooled.conn)] = pooled
+                return pooled.conn
+            
+            if self._is_healthy(pooled, time.monotonic()):
+                return pooled.conn
+            
+            # 不健全な接続は破棄して再試行
+            with self._cond:
+                self._in_use.pop(id(pooled.conn), None)
+                self._cond.notify()
+            self._discard(pooled)
+    
+    def putconn(self, conn: connection, discard: bool = False) -> None:
+        """借用した接続をプールへ返却
+        
+        Args:
+            conn: getconn で借用した接続
+            discard: True の場合は再利用せずに破棄
+        """
+        with self._cond:
+            pooled = self._in_use.pop(id(conn), None)
+        if pooled is None:
+            raise PoolError("trying to put unkeyed connection")
+        
+        if not discard and not conn.closed:
+            try:
+                # 未完了のトランザクションは破棄してから再利用する
+                if conn.info.transaction_status != TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+            except Error:
+                discard = True
+        
+        now = time.monotonic()
+        with self._cond:
+            if discard or conn.closed or self._closed or self._is_expired(pooled, now):
+                reuse = False
+            else:
+                pooled.last_used = now
+                self._idle.append(pooled)
+                reuse = True
+            self._cond.notify()
+        
+        if not reuse:
+            self._discard(pooled)
+    
+    @contextmanager
+    def connection(self) -> Iterator[connection]:
+        """接続を借用し、ブロック終了時に自動で返却するコンテキストマネージャー
+        
+        例外発生時はロールバックしてから返却する。コミットは呼び出し側で行う。
+        """
+        conn = self.getconn()
+        try:
+            yield conn
+        except BaseException:
+            discard = False
+            try:
+                conn.rollback()
+            except Error:
+                discard = True
+            self.putconn(conn, discard=discard)
+            raise
+        else:
+            self.putconn(conn)
+    
+    def stats(self) -> Dict[str, int]:
+        """プールの利用状況を取得
+        
+        Returns:
+            idle/in_use/max_size を含む辞書
+        """
+        with self._cond:
+            return {
+                'idle': len(self._idle),
+                'in_use': len(self._in_use),
+                'min_size': self.min_size,
+                'max_size': self.max_size
+            }
+    
+    def close(self) -> None:
+        """アイドル接続をすべてクローズし、以降の借用を拒否"""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+        for pooled in idle:
+            self._discard(pooled)
+    
+    def __enter__(self):
+        """コンテキストマネージャーのエントリー"""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """コンテキストマネージャーのイグジット"""
+        self.close()
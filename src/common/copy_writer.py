@@ -0,0 +1,211 @@
+import io
+import struct
+from decimal import Decimal
+from typing import Iterable, List, Sequence, Tuple, Any
+
+from psycopg2 import Error, NotSupportedError
+from psycopg2.extras import execute_values
+
+
+# バイナリCOPYのヘッダー・トレーラー
+_BINARY_SIGNATURE = b'PGCOPY\n\xff\r\n\x00'
+_BINARY_HEADER = _BINARY_SIGNATURE + struct.pack('!ii', 0, 0)
+_BINARY_TRAILER = struct.pack('!h', -1)
+
+_NUMERIC_POS = 0x0000
+_NUMERIC_NEG = 0x4000
+_NUMERIC_NAN = 0xC000
+_NUMERIC_PINF = 0xD000
+_NUMERIC_NINF = 0xF000
+
+
+class CopyWriter:
+    """COPY FROM STDIN によるバルク書き込みを担当するクラス（SRP準拠）
+    
+    行をメモリ上のバッファにtext形式またはbinary形式でエンコードし、
+    copy_expert でサーバーへ送り込む。COPYが利用できない接続先では
+    execute_values によるページ単位のINSERTで代替する。
+    """
+    
+    FORMATS = ('text', 'binary')
+    
+    # execute_values でプレースホルダーに明示的なキャストが必要な型
+    # （文字列リテラルから暗黙に変換されない型。COPY text形式では不要）
+    CAST_TYPES = ('tsvector',)
+    
+    @staticmethod
+    def encode_text(rows: Iterable[Sequence[Any]]) -> bytes:
+        """行をCOPY text形式にエンコード
+        
+        Args:
+            rows: 列値のシーケンスのイテラブル
+        
+        Returns:
+            COPY text形式のバイト列
+        """
+        lines = []
+        for row in rows:
+            lines.append('\t'.join(CopyWriter._text_field(value) for value in row))
+            lines.append('\n')
+        return ''.join(lines).encode('utf-8')
+    
+    @staticmethod
+    def _text_field(value: Any) -> str:
+        """1フィールドをCOPY text形式にエスケープ"""
+        if value is None:
+            return '\\N'
+        if isinstance(value, bool):
+            return 't' if value else 'f'
+        text = str(value)
+        if any(ch in text for ch in '\\\t\n\r'):
+            text = (text.replace('\\', '\\\\').replace('\t', '\\t')
+                    .replace('\n', '\\n').replace('\r', '\\r'))
+        return text
+    
+    @staticmethod
+    def encode_binary(rows: Iterable[Sequence[Any]], column_types: Sequence[str]) -> bytes:
+        """行をCOPY binary形式にエンコード
+        
+        Args:
+            rows: 列値のシーケンスのイテラブル
+            column_types: 各列の型（int2/int4/int8/float8/numeric/text/bool）
+        
+        Returns:
+            COPY binary形式のバイト列（ヘッダー・トレーラー込み）
+        """
+        encoders = [CopyWriter._BINARY_ENCODERS[t] for t in column_types]
+        field_count = struct.pack('!h', len(encoders))
+        
+        buffer = io.BytesIO()
+        buffer.write(_BINARY_HEADER)
+        for row in rows:
+            buffer.write(field_count)
+            for encode, value in zip(encoders, row):
+                if value is None:
+                    buffer.write(b'\xff\xff\xff\xff')
+                else:
+                    data = encode(value)
+                    buffer.write(struct.pack('!i', len(data)))
+                    buffer.write(data)
+        buffer.write(_BINARY_TRAILER)
+        return buffer.getvalue()
+    
+    @staticmethod
+    def _encode_numeric(value: Any) -> bytes:
+        """Decimal/float/int を numeric のバイナリ表現（base 10000）に変換"""
+        number = value if isinstance(value, Decimal) else Decimal(str(value))
+        if number.is_nan():
+            return struct.pack('!hhHH', 0, 0, _NUMERIC_NAN, 0)
+        if number.is_infinite():
+            # ±Infinity（PostgreSQL 14 以降の numeric）
+            return struct.pack('!hhHH', 0, 0, _NUMERIC_NINF if number.is_signed() else _NUMERIC_PINF, 0)
+        
+        sign, digits, exponent = number.as_tuple()
+        digit_text = ''.join(map(str, digits))
+        if exponent > 0:
+            digit_text += '0' * exponent
+            exponent = 0
+        dscale = -exponent
+        if len(digit_text) < dscale:
+            digit_text = '0' * (dscale - len(digit_text)) + digit_text
+        
+        int_part = digit_text[:len(digit_text) - dscale]
+        frac_part = digit_text[len(digit_text) - dscale:]
+        int_part = int_part.zfill((len(int_part) + 3) // 4 * 4)
+        frac_part = frac_part.ljust((len(frac_part) + 3) // 4 * 4, '0')
+        
+        groups = [int(int_part[i:i + 4]) for i in range(0, len(int_part), 4)]
+        weight = len(groups) - 1
+        groups += [int(frac_part[i:i + 4]) for i in range(0, len(frac_part), 4)]
+        
+        while groups and groups[0] == 0:
+            groups.pop(0)
+            weight -= 1
+        while groups and groups[-1] == 0:
+            groups.pop()
+        if not groups:
+            weight = 0
+        
+        return struct.pack(f'!hhHH{len(groups)}h', len(groups), weight,
+                           _NUMERIC_NEG if sign else _NUMERIC_POS, dscale, *groups)
+    
+    _BINARY_ENCODERS = {
+        'int2': lambda v: struct.pack('!h', v),
+        'int4': lambda v: struct.pack('!i', v),
+        'int8': lambda v: struct.pack('!q', v),
+        'float8': lambda v: struct.pack('!d', v),
+        'bool': lambda v: b'\x01' if v else b'\x00',
+        'text': lambda v: str(v).encode('utf-8'),
+        'numeric': lambda v: CopyWriter._encode_numeric(v),
+    }
+    
+    @staticmethod
+    def copy_rows(cur, table: str, columns: Sequence[Tuple[str, str]],
+                  rows: List[Sequence[Any]], copy_format: str = 'text') -> int:
+        """行のチャンクを COPY table FROM STDIN で書き込み
+        
+        Args:
+            cur: カーソル（呼び出し側のトランザクション内で実行）
+            table: 書き込み先テーブル名
+            columns: (列名, 型) のシーケンス
+            rows: 列順に並んだ行のリスト
+            copy_format: 'text' または 'binary'
+        
+        Returns:
+            書き込んだ行数
+        """
+        if copy_format not in CopyWriter.FORMATS:
+            raise ValueError(f"Unsupported COPY format: {copy_format}")
+        
+        if copy_format == 'binary':
+            payload = CopyWriter.encode_binary(rows, [t for _, t in columns])
+        else:
+            payload = CopyWriter.encode_text(rows)
+        
+        column_list = ', '.join(name for name, _ in columns)
+        cur.copy_expert(
+            f"COPY {table} ({column_list}) FROM STDIN WITH (FORMAT {copy_format})",
+            io.BytesIO(payload)
+        )
+        return len(rows)
+    
+    @staticmethod
+    def values_template(columns: Sequence[Tuple[str, str]]) -> str:
+        """execute_values 用の1行分テンプレートを作成（CAST_TYPES の列はキャスト付き）
+        
+        Args:
+            columns: (列名, 型) のシーケンス
+        
+        Returns:
+            '(%s, %s::tsvector)' 形式のテンプレート
+        """
+        placeholders = (
+            f"%s::{column_type}" if column_type in CopyWriter.CAST_TYPES else '%s'
+            for _, column_type in columns
+        )
+        return f"({', '.join(placeholders)})"
+    
+    @staticmethod
+    def insert_values(cur, table: str, columns: Sequence[Tuple[str, str]],
+                      rows: List[Sequence[Any]], page_size: int = 1000) -> int:
+        """行のチャンクを execute_values のページ単位INSERTで書き込み（COPY非対応時の代替）
+        
+        Args:
+            cur: カーソル（呼び出し側のトランザクション内で実行）
+            table: 書き込み先テーブル名
+            columns: (列名, 型) のシーケンス
+            rows: 列順に並んだ行のリスト
+            page_size: 1ステートメントあたりの行数
+        
+        Returns:
+            書き込んだ行数
+        """
+        column_list = ', '.join(name for name, _ in columns)
+        execute_values(cur, f"INSERT INTO {table} ({column_list}) VALUES %s", rows,
+                       template=CopyWriter.values_template(columns), page_size=page_size)
+        return len(rows)
+    
+    @staticmethod
+    def is_copy_unsupported(error: Error) -> bool:
+        """COPYが接続先で利用できないことを示すエラーかどうか"""
+        return isinstance(error, NotSupportedError)
@@ -1,11 +1,30 @@
 import csv
-from typing import List, Dict, Optional
+import queue
+import threading
+from itertools import islice
+from typing import List, Dict, Optional, Iterator, Iterable, Tuple, Callable, Union, Any
 from pathlib import Path
 
 
 class CSVLoader:
     """CSV読み取り専用クラス（SRP準拠）"""
     
+    # (DB列名, CSV列名, 型変換) の定義。並びは PrefectureManager.PREFECTURE_COLUMNS と一致させる
+    PREFECTURE_SCHEMA: Tuple[Tuple[str, str, Callable[[str], Any]], ...] = (
+        ('id', 'id', int),
+        ('name', 'name', str.strip),
+        ('name_kana', 'furigana', str.strip),
+        ('capital', 'capital', str.strip),
+        ('largest_city', 'largest_city', str.strip),
+        ('region', 'region', str.strip),
+        ('population', 'population', int),
+        ('area', 'area', float),
+        ('population_density', 'ppa', float),
+        ('municipalities_count', 'towns', int),
+        ('lower_house_seats', 'seats1', int),
+        ('upper_house_seats', 'seats2', int),
+    )
+    
     @staticmethod
     def load_prefectures_csv(file_path: str) -> List[Dict]:
         """都道府県CSVファイルを読み込み、辞書のリストとして返す
@@ -16,6 +35,29 @@ class CSVLoader:
         Returns:
             都道府県データの辞書リスト
             
+        Raises:
+            FileNotFoundError: CSVファイルが見つからない場合
+            ValueError: CSVデータの形式が不正な場合
+        """
+        prefectures_data = list(CSVLoader.iter_prefectures_csv(file_path))
+        
+        if not prefectures_data:
+            raise ValueError("No valid prefecture data found in CSV")
+            
+        return prefectures_data
+    
+    @staticmethod
+    def iter_prefectures_csv(file_path: str) -> Iterator[Dict]:
+        """都道府県CSVファイルを1行ずつ読み込み、辞書を順に返すジェネレーター
+        
+        全行をリストに保持しないため、大きなCSVもバルクローダーへ直接流し込める。
+        
+        Args:
+            file_path: CSVファイルのパス
+            
+        Yields:
+            都道府県データの辞書
+            
         Raises:
             FileNotFoundError: CSVファイルが見つからない場合
             ValueError: CSVデータの形式が不正な場合
@@ -24,8 +66,6 @@ class CSVLoader:
         if not csv_path.exists():
             raise FileNotFoundError(f"CSV file not found: {file_path}")
         
-        prefectures_data = []
-        
         try:
             with open(csv_path, 'r', encoding='utf-8') as file:
                 csv_reader = csv.DictReader(file)
@@ -33,19 +73,14 @@ class CSVLoader:
                 for row_num, row in enumerate(csv_reader, start=2):  # ヘッダー行の次から
                     try:
                         prefecture_data = CSVLoader._convert_row_to_prefecture_data(row)
-                        prefectures_data.append(prefecture_data)
                     except (ValueError, KeyError) as e:
                         raise ValueError(f"Invalid data in row {row_num}: {e}")
+                    yield prefecture_data
                         
         except Exception as e:
             if isinstance(e, (FileNotFoundError, ValueError)):
                 raise
             raise ValueError(f"Error reading CSV file: {e}")
-        
-        if not prefectures_data:
-            raise ValueError("No valid prefecture data found in CSV")
-            
-        return prefectures_data
     
     @staticmethod
     def _convert_row_to_prefecture_data(row: Dict[str, str]) -> Dict:
@@ -59,22 +94,164 @@ class CSVLoader:
         """
         try:
             return {
-                'id': int(row['id']),
-                'name': row['name'].strip(),
-                'name_kana': row['furigana'].strip(),
-                'capital': row['capital'].strip(),
-                'largest_city': row['largest_city'].strip(),
-                'region': row['region'].strip(),
-                'population': int(row['population']),
-                'area': float(row['area']),
-                'population_density': float(row['ppa']),
-                'municipalities_count': int(row['towns']),
-                'lower_house_seats': int(row['seats1']),
-                'upper_house_seats': int(row['seats2'])
+                db_column: convert(row[csv_column])
+                for db_column, csv_column, convert in CSVLoader.PREFECTURE_SCHEMA
             }
         except (ValueError, KeyError) as e:
             raise ValueError(f"Failed to convert row data: {e}")
     
+    @staticmethod
+    def iter_prefecture_chunks(file_path: str, chunk_size: int = 10000, as_columns: bool = False,
+                               validate: bool = True) -> Iterator[Union[List[Tuple], Dict[str, List]]]:
+        """都道府県CSVを固定サイズのチャンク単位で型変換して返すジェネレーター
+        
+        行を辞書にせず、PREFECTURE_SCHEMA の列順のタプルへ直接変換する。
+        チャンクごとにバリデーションを行うため、全件を読み込む前に不正データを検出できる。
+        メモリ使用量はチャンク1つ分に収まる。
+        
+        Args:
+            file_path: CSVファイルのパス
+            chunk_size: 1チャンクあたりの行数
+            as_columns: True の場合、チャンクを {列名: 値リスト} の列指向形式で返す
+            validate: チャンクごとにバリデーションを行うかどうか
+            
+        Yields:
+            型変換済みの行タプルのリスト、または列名→値リストの辞書
+            
+        Raises:
+            FileNotFoundError: CSVファイルが見つからない場合
+            ValueError: CSVデータの形式が不正、またはバリデーションに失敗した場合
+        """
+        if chunk_size < 1:
+            raise ValueError(f"Invalid chunk_size: {chunk_size}")
+        
+        csv_path = Path(file_path)
+        if not csv_path.exists():
+            raise FileNotFoundError(f"CSV file not found: {file_path}")
+        
+        column_names = [db_column for db_column, _, _ in CSVLoader.PREFECTURE_SCHEMA]
+        
+        try:
+            with open(csv_path, 'r', encoding='utf-8', newline='') as file:
+                csv_reader = csv.reader(file)
+                header = next(csv_reader, None)
+                if header is None:
+                    raise ValueError("No valid prefecture data found in CSV")
+                
+                # CSV列名を位置に解決しておき、行ごとの辞書化を避ける
+                try:
+                    converters = [
+                        (header.index(csv_column), convert)
+                        for _, csv_column, convert in CSVLoader.PREFECTURE_SCHEMA
+                    ]
+                except ValueError as e:
+                    raise ValueError(f"Missing column in CSV header: {e}")
+                
+                row_num = 1
+                while True:
+                    lines = list(islice(csv_reader, chunk_size))
+                    if not lines:
+                        break
+                    
+                    first_row_num = row_num + 1
+                    chunk = []
+                    for line in lines:
+                        row_num += 1
+                        try:
+                            chunk.append(tuple(convert(line[index]) for index, convert in converters))
+                        except (ValueError, IndexError) as e:
+                            raise ValueError(f"Invalid data in row {row_num}: {e}")
+                    
+                    if validate:
+                        CSVLoader.validate_chunk(chunk, first_row_num)
+                    
+                    if as_columns:
+                        yield dict(zip(column_names, (list(values) for values in zip(*chunk))))
+                    else:
+                        yield chunk
+                        
+        except Exception as e:
+            if isinstance(e, (FileNotFoundError, ValueError)):
+                raise
+            raise ValueError(f"Error reading CSV file: {e}")
+    
+    @staticmethod
+    def validate_chunk(chunk: List[Tuple], first_row_num: int = 2) -> None:
+        """型変換済みチャンクのバリデーション（validate_csv_data と同じ基準）
+        
+        Args:
+            chunk: PREFECTURE_SCHEMA の列順の行タプルのリスト
+            first_row_num: チャンク先頭行のCSV上の行番号（エラー表示用）
+            
+        Raises:
+            ValueError: 不正な値を含む場合
+        """
+        for offset, row in enumerate(chunk):
+            # PREFECTURE_SCHEMA の列順: id=0, population=6, area=7
+            prefecture_id, population, area = row[0], row[6], row[7]
+            row_num = first_row_num + offset
+            
+            if prefecture_id < 1 or prefecture_id > 47:
+                raise ValueError(f"Invalid prefecture ID in row {row_num}: {prefecture_id}")
+            if population < 0:
+                raise ValueError(f"Invalid population in row {row_num}: {population}")
+            if area <= 0:
+                raise ValueError(f"Invalid area in row {row_num}: {area}")
+    
+    @staticmethod
+    def prefetch(chunks: Iterable, depth: int = 2) -> Iterator:
+        """チャンクの読み込みをバックグラウンドスレッドで先行させるイテレーター
+        
+        CSVの解析とデータベースへの書き込み（ネットワークI/O）を並行させる。
+        先読みは depth チャンクまでに制限されるため、メモリ使用量は有界に保たれる。
+        読み込み側で発生した例外は消費側で再送出される。
+        
+        Args:
+            chunks: チャンクのイテラブル（iter_prefecture_chunks など）
+            depth: 先読みするチャンク数の上限
+            
+        Yields:
+            元のイテラブルと同じ順序のチャンク
+        """
+        buffer: queue.Queue = queue.Queue(maxsize=max(1, depth))
+        done = object()
+        stop = threading.Event()
+        
+        def produce() -> None:
+            try:
+                for chunk in chunks:
+                    while not stop.is_set():
+                        try:
+                            buffer.put(('chunk', chunk), timeout=0.1)
+                            break
+                        except queue.Full:
+                            continue
+                    if stop.is_set():
+                        return
+                buffer.put(('done', done))
+            except BaseException as e:
+                buffer.put(('error', e))
+        
+        producer = threading.Thread(target=produce, name='csv-prefetch', daemon=True)
+        producer.start()
+        try:
+            while True:
+                kind, item = buffer.get()
+                if kind == 'chunk':
+                    yield item
+                elif kind == 'error':
+                    raise item
+                else:
+                    break
+        finally:
+            # 消費側が途中で終了した場合は読み込みスレッドも停止させる
+            stop.set()
+            while producer.is_alive():
+                try:
+                    buffer.get_nowait()
+                except queue.Empty:
+                    producer.join(timeout=0.1)
+    
     @staticmethod
     def validate_csv_data(data_list: List[Dict]) -> bool:
         """都道府県データリストのバリデーション
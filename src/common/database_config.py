@@ -10,6 +10,16 @@ class DatabaseConfig:
     database: str
     user: str
     password: str
+    pool_min_size: int = 1
+    pool_max_size: int = 10
+    pool_max_idle: float = 300.0
+    pool_max_lifetime: float = 3600.0
+    pool_timeout: float = 30.0
+    stream_itersize: int = 2000
+    search_cache_max_entries: int = 1024
+    search_cache_max_bytes: int = 16 * 1024 * 1024
+    search_cache_ttl: float = 300.0
+    prepared_statements: bool = True
     
     @classmethod
     def from_environment(cls) -> 'DatabaseConfig':
@@ -18,6 +28,11 @@ class DatabaseConfig:
         実行環境を自動検出してデフォルト値を設定：
         - コンテナ内: host=db, port=5432
         - ホスト: host=127.0.0.1, port=5555
+        
+        コネクションプールのサイズ等は DB_POOL_* 環境変数で、
+        サーバーサイドカーソルの1回の取得行数は DB_STREAM_ITERSIZE で、
+        検索結果キャッシュの上限・有効期間は SEARCH_CACHE_* 環境変数で、
+        プリペアドステートメントの利用有無は DB_PREPARED_STATEMENTS で上書き可能
         """
         # Dockerコンテナ内実行の判定
         is_container = os.path.exists('/.dockerenv')
@@ -27,7 +42,17 @@ class DatabaseConfig:
             port=os.getenv('DB_PORT', '5432' if is_container else '5555'),
             database=os.getenv('DB_NAME', 'mydatabase'),
             user=os.getenv('DB_USER', 'postgres'),
-            password=os.getenv('DB_PASSWORD', 'mysecretpassword')
+            password=os.getenv('DB_PASSWORD', 'mysecretpassword'),
+            pool_min_size=int(os.getenv('DB_POOL_MIN_SIZE', '1')),
+            pool_max_size=int(os.getenv('DB_POOL_MAX_SIZE', '10')),
+            pool_max_idle=float(os.getenv('DB_POOL_MAX_IDLE', '300')),
+            pool_max_lifetime=float(os.getenv('DB_POOL_MAX_LIFETIME', '3600')),
+            pool_timeout=float(os.getenv('DB_POOL_TIMEOUT', '30')),
+            stream_itersize=int(os.getenv('DB_STREAM_ITERSIZE', '2000')),
+            search_cache_max_entries=int(os.getenv('SEARCH_CACHE_MAX_ENTRIES', '1024')),
+            search_cache_max_bytes=int(os.getenv('SEARCH_CACHE_MAX_BYTES', str(16 * 1024 * 1024))),
+            search_cache_ttl=float(os.getenv('SEARCH_CACHE_TTL', '300')),
+            prepared_statements=os.getenv('DB_PREPARED_STATEMENTS', 'true').lower() not in ('0', 'false', 'no', 'off')
         )
     
     def to_connection_params(self) -> Dict[str, str]:
@@ -40,6 +65,24 @@ class DatabaseConfig:
             'password': self.password
         }
     
+    def to_pool_params(self) -> Dict[str, float]:
+        """コネクションプールのサイズ・寿命パラメータに変換"""
+        return {
+            'min_size': self.pool_min_size,
+            'max_size': self.pool_max_size,
+            'max_idle': self.pool_max_idle,
+            'max_lifetime': self.pool_max_lifetime,
+            'timeout': self.pool_timeout
+        }
+    
+    def to_cache_params(self) -> Dict[str, float]:
+        """検索結果キャッシュの上限・有効期間パラメータに変換"""
+        return {
+            'max_entries': self.search_cache_max_entries,
+            'max_bytes': self.search_cache_max_bytes,
+            'ttl': self.search_cache_ttl
+        }
+    
     def __str__(self) -> str:
         """接続情報の表示（パスワードは隠蔽）"""
         return f"DatabaseConfig(host={self.host}, port={self.port}, database={self.database}, user={self.user})"
\ No newline at end of file
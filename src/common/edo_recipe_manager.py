@@ -1,14 +1,92 @@
-import psycopg2
+import json
+import hashlib
+from itertools import islice
 from psycopg2 import Error
-from psycopg2.extensions import connection
-from typing import Optional, List, Tuple, Dict
+from psycopg2.extras import execute_values
+from typing import Optional, List, Tuple, Dict, Iterable
 
 from .database_config import DatabaseConfig
+from .cache_invalidation import CacheInvalidation
+from .connection_pool import ConnectionPool
+from .copy_writer import CopyWriter
+from .ngram_tokenizer import NgramTokenizer
+from .prepared_statements import StatementRegistry
+from .result_cache import ResultCache
 
 
 class EdoRecipeManager:
     """江戸料理レシピデータの管理を担当するクラス（SRP準拠）"""
     
+    # 一括挿入時の列定義（(列名, 型)）
+    RECIPE_COLUMNS: Tuple[Tuple[str, str], ...] = (
+        ('id', 'int2'),
+        ('name', 'text'),
+        ('url', 'text'),
+        ('description', 'text'),
+        ('tips', 'text'),
+        ('original_text', 'text'),
+        ('modern_translation', 'text'),
+        ('ngram_vector', 'tsvector'),
+        ('content_hash', 'text'),
+    )
+    INGREDIENT_COLUMNS: Tuple[Tuple[str, str], ...] = (
+        ('recipe_id', 'int2'),
+        ('ingredient', 'text'),
+        ('sort_order', 'int2'),
+        ('ngram_vector', 'tsvector'),
+    )
+    INSTRUCTION_COLUMNS: Tuple[Tuple[str, str], ...] = (
+        ('recipe_id', 'int2'),
+        ('instruction_type', 'text'),
+        ('instruction', 'text'),
+        ('step_number', 'int2'),
+    )
+    # 全文検索用の重み付きtsvector（名前A・説明B・コツC・現代語訳D）。生成列として自動維持される
+    SEARCH_VECTOR_EXPRESSION = (
+        "setweight(to_tsvector('simple', COALESCE(name, '')), 'A') || "
+        "setweight(to_tsvector('simple', COALESCE(description, '')), 'B') || "
+        "setweight(to_tsvector('simple', COALESCE(tips, '')), 'C') || "
+        "setweight(to_tsvector('simple', COALESCE(modern_translation, '')), 'D')"
+    )
+    
+    # 日本語N-gram検索用tsvectorの対象フィールドと重み（search_vector と同じ配分）。
+    # 分かち書きはアプリケーション側（NgramTokenizer）で行うため、挿入時に計算して格納する
+    NGRAM_FIELDS: Tuple[Tuple[str, str], ...] = (
+        ('name', 'A'),
+        ('description', 'B'),
+        ('tips', 'C'),
+        ('modern_translation', 'D'),
+    )
+    NGRAM_INDEXES: Tuple[Tuple[str, str], ...] = (
+        ('idx_recipes_ngram_vector', 'edo_recipes'),
+        ('idx_ingredients_ngram_vector', 'recipe_ingredients'),
+    )
+    
+    # 部分一致（ILIKE '%kw%'）検索用の pg_trgm GINインデックス
+    TRIGRAM_INDEXES: Tuple[Tuple[str, str, str], ...] = (
+        ('idx_ingredients_ingredient_trgm', 'recipe_ingredients', 'ingredient'),
+        ('idx_recipes_name_trgm', 'edo_recipes', 'name'),
+        ('idx_recipes_description_trgm', 'edo_recipes', 'description'),
+    )
+    
+    # 検索結果キャッシュ（RecipeSearchService と共有）の名前空間
+    SEARCH_CACHE_NAMESPACE = 'edo_recipes'
+    
+    # 変更時に CacheInvalidation.CHANNEL へ NOTIFY するテーブル
+    NOTIFY_TABLES: Tuple[str, ...] = ('edo_recipes', 'recipe_ingredients', 'recipe_instructions')
+    
+    # 手順タイプとレシピデータ辞書のキーの対応
+    INSTRUCTION_SOURCES: Tuple[Tuple[str, str], ...] = (
+        ('modern', 'modern_instructions'),
+        ('translation', 'modern_translation_instructions'),
+        ('original', 'original_instructions'),
+    )
+    
+    # content_hash の計算対象（レシピ本体・材料・手順の内容。変わらなければ upsert_recipes は何もしない）
+    CONTENT_HASH_FIELDS: Tuple[str, ...] = (
+        'name', 'url', 'description', 'tips', 'original_text', 'modern_translation', 'ingredients',
+    ) + tuple(key for _, key in INSTRUCTION_SOURCES)
+    
     def __init__(self, db_config: DatabaseConfig):
         """EdoRecipeManagerを初期化
         
@@ -16,19 +94,20 @@ class EdoRecipeManager:
             db_config: データベース設定オブジェクト
         """
         self.db_config = db_config
-        self.conn: Optional[connection] = None
-        self.cur = None
+        self.pool: Optional[ConnectionPool] = None
+        self.statements = StatementRegistry.shared(db_config)
+        self.statements.register('recipe_exists', "SELECT EXISTS (SELECT 1 FROM edo_recipes WHERE id = %s);",
+                                 ('integer',))
         self._connect()
     
     def _connect(self) -> None:
-        """データベースに接続"""
-        try:
-            self.conn = psycopg2.connect(**self.db_config.to_connection_params())
-            self.cur = self.conn.cursor()
-            print(f"Connected to database: {self.db_config}")
-        except Error as e:
-            print(f"Error connecting to PostgreSQL: {e}")
-            raise
+        """共有コネクションプールを取得（接続は操作ごとに借用）"""
+        self.pool = ConnectionPool.shared(self.db_config)
+        print(f"Connected to database: {self.db_config}")
+    
+    def _invalidate_search_cache(self) -> None:
+        """レシピデータの変更後に、同じ接続先の検索結果キャッシュを破棄"""
+        ResultCache.shared(self.SEARCH_CACHE_NAMESPACE, self.db_config).invalidate()
     
     def tables_exist(self) -> bool:
         """江戸料理レシピテーブルの存在確認
@@ -39,16 +118,18 @@ class EdoRecipeManager:
         try:
             tables = ['edo_recipes', 'recipe_ingredients', 'recipe_instructions']
             
-            for table_name in tables:
-                self.cur.execute("""
-                    SELECT EXISTS (
-                        SELECT FROM information_schema.tables 
-                        WHERE table_name = %s
-                    );
-                """, (table_name,))
-                
-                if not self.cur.fetchone()[0]:
-                    return False
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    for table_name in tables:
+                        cur.execute("""
+                            SELECT EXISTS (
+                                SELECT FROM information_schema.tables 
+                                WHERE table_name = %s
+                            );
+                        """, (table_name,))
+                        
+                        if not cur.fetchone()[0]:
+                            return False
             
             return True
         except Error as e:
@@ -96,38 +177,98 @@ class EdoRecipeManager:
         );
         """
         
+        # 全文検索用の生成列（既存テーブルにも追加されるよう ALTER で定義）
+        add_search_vector_query = f"""
+        ALTER TABLE edo_recipes ADD COLUMN IF NOT EXISTS search_vector tsvector
+            GENERATED ALWAYS AS ({self.SEARCH_VECTOR_EXPRESSION}) STORED;
+        """
+        
+        # 日本語N-gram検索用の列（挿入時に NgramTokenizer で計算した値を格納）
+        add_ngram_vector_queries = [
+            "ALTER TABLE edo_recipes ADD COLUMN IF NOT EXISTS ngram_vector tsvector;",
+            "ALTER TABLE recipe_ingredients ADD COLUMN IF NOT EXISTS ngram_vector tsvector;"
+        ]
+        
+        # 内容のハッシュ（差分更新で未変更のレシピを読み飛ばすために使用）
+        add_content_hash_query = "ALTER TABLE edo_recipes ADD COLUMN IF NOT EXISTS content_hash TEXT;"
+        
         # インデックス作成クエリ（デフォルト設定を使用）
         create_indexes_queries = [
+            "CREATE INDEX IF NOT EXISTS idx_recipes_search_vector ON edo_recipes USING gin (search_vector);",
             "CREATE INDEX IF NOT EXISTS idx_recipes_name ON edo_recipes USING gin (to_tsvector('simple', name));",
             "CREATE INDEX IF NOT EXISTS idx_recipes_description ON edo_recipes USING gin (to_tsvector('simple', description));",
             "CREATE INDEX IF NOT EXISTS idx_ingredients_text ON recipe_ingredients USING gin (to_tsvector('simple', ingredient));",
+            "CREATE INDEX IF NOT EXISTS idx_recipes_name_id ON edo_recipes(name, id);",
             "CREATE INDEX IF NOT EXISTS idx_ingredients_recipe_id ON recipe_ingredients(recipe_id);",
             "CREATE INDEX IF NOT EXISTS idx_instructions_recipe_id ON recipe_instructions(recipe_id);",
             "CREATE INDEX IF NOT EXISTS idx_instructions_type ON recipe_instructions(instruction_type);"
         ]
+        create_indexes_queries += [
+            f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} USING gin (ngram_vector);"
+            for index_name, table_name in self.NGRAM_INDEXES
+        ]
         
         try:
-            # テーブル作成
-            self.cur.execute(create_recipes_table_query)
-            print("✓ edo_recipesテーブルを作成しました")
-            
-            self.cur.execute(create_ingredients_table_query)
-            print("✓ recipe_ingredientsテーブルを作成しました")
-            
-            self.cur.execute(create_instructions_table_query)
-            print("✓ recipe_instructionsテーブルを作成しました")
-            
-            # インデックス作成
-            for index_query in create_indexes_queries:
-                self.cur.execute(index_query)
-            print("✓ 検索用インデックスを作成しました")
-            
-            self.conn.commit()
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    # テーブル作成
+                    cur.execute(create_recipes_table_query)
+                    cur.execute(add_search_vector_query)
+                    print("✓ edo_recipesテーブルを作成しました")
+                    
+                    cur.execute(create_ingredients_table_query)
+                    print("✓ recipe_ingredientsテーブルを作成しました")
+                    
+                    cur.execute(create_instructions_table_query)
+                    print("✓ recipe_instructionsテーブルを作成しました")
+                    
+                    for query in add_ngram_vector_queries:
+                        cur.execute(query)
+                    cur.execute(add_content_hash_query)
+                    
+                    # インデックス作成
+                    for index_query in create_indexes_queries:
+                        cur.execute(index_query)
+                    print("✓ 検索用インデックスを作成しました")
+                    
+                    self._create_trigram_indexes(cur)
+                    
+                    # 他プロセスのキャッシュ破棄用の通知トリガー
+                    CacheInvalidation.install(cur, self.NOTIFY_TABLES)
+                
+                conn.commit()
             return True
             
         except Error as e:
             print(f"Error creating tables: {e}")
-            self.conn.rollback()
+            return False
+    
+    def _create_trigram_indexes(self, cur) -> bool:
+        """pg_trgm 拡張と部分一致検索用のGINインデックスを作成
+        
+        拡張を作成する権限がない環境でもテーブル作成自体は成功させるため、
+        セーブポイント内で実行し、失敗時はその部分だけを取り消す。
+        
+        Args:
+            cur: 借用中の接続のカーソル
+            
+        Returns:
+            作成できた場合True
+        """
+        cur.execute("SAVEPOINT trigram_indexes;")
+        try:
+            cur.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+            for index_name, table_name, column_name in self.TRIGRAM_INDEXES:
+                cur.execute(
+                    f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} "
+                    f"USING gin ({column_name} gin_trgm_ops);"
+                )
+            cur.execute("RELEASE SAVEPOINT trigram_indexes;")
+            print("✓ 部分一致検索用インデックス（pg_trgm）を作成しました")
+            return True
+        except Error as e:
+            cur.execute("ROLLBACK TO SAVEPOINT trigram_indexes;")
+            print(f"Warning: pg_trgmインデックスを作成できませんでした（部分一致検索は全件走査になります）: {e}")
             return False
     
     def drop_tables(self) -> bool:
@@ -144,16 +285,19 @@ class EdoRecipeManager:
                 "DROP TABLE IF EXISTS edo_recipes CASCADE;"
             ]
             
-            for query in drop_queries:
-                self.cur.execute(query)
-            
-            self.conn.commit()
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    for query in drop_queries:
+                        cur.execute(query)
+                    # DROP TABLE ではトリガーが動かないため明示的に通知する
+                    CacheInvalidation.notify(cur, self.NOTIFY_TABLES)
+                conn.commit()
+                self._invalidate_search_cache()
             print("✓ 江戸料理レシピテーブルを削除しました")
             return True
             
         except Error as e:
             print(f"Error dropping tables: {e}")
-            self.conn.rollback()
             return False
     
     def recipe_exists(self, recipe_id: int) -> bool:
@@ -166,8 +310,10 @@ class EdoRecipeManager:
             存在する場合True
         """
         try:
-            self.cur.execute("SELECT EXISTS (SELECT 1 FROM edo_recipes WHERE id = %s);", (recipe_id,))
-            return self.cur.fetchone()[0]
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    self.statements.execute(cur, 'recipe_exists', (recipe_id,))
+                    return cur.fetchone()[0]
         except Error as e:
             print(f"Error checking recipe existence: {e}")
             return False
@@ -190,49 +336,353 @@ class EdoRecipeManager:
             # メインレシピデータ挿入
             insert_recipe_query = """
             INSERT INTO edo_recipes (
-                id, name, url, description, tips, original_text, modern_translation
+                id, name, url, description, tips, original_text, modern_translation, ngram_vector, content_hash
             ) VALUES (
-                %(id)s, %(name)s, %(url)s, %(description)s, %(tips)s, %(original_text)s, %(modern_translation)s
+                %(id)s, %(name)s, %(url)s, %(description)s, %(tips)s, %(original_text)s, %(modern_translation)s,
+                %(ngram_vector)s::tsvector, %(content_hash)s
             );
             """
             
-            self.cur.execute(insert_recipe_query, recipe_data)
-            
-            # 材料データ挿入
-            ingredients = recipe_data.get('ingredients', [])
-            for i, ingredient in enumerate(ingredients, 1):
-                self.cur.execute("""
-                    INSERT INTO recipe_ingredients (recipe_id, ingredient, sort_order)
-                    VALUES (%s, %s, %s);
-                """, (recipe_data['id'], ingredient, i))
-            
-            # 手順データ挿入
-            self._insert_instructions(recipe_data['id'], 'modern', recipe_data.get('modern_instructions', []))
-            self._insert_instructions(recipe_data['id'], 'translation', recipe_data.get('modern_translation_instructions', []))
-            self._insert_instructions(recipe_data['id'], 'original', recipe_data.get('original_instructions', []))
-            
-            self.conn.commit()
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(insert_recipe_query,
+                                dict(recipe_data, ngram_vector=self.recipe_ngram_vector(recipe_data),
+                                     content_hash=self.recipe_content_hash(recipe_data)))
+                    
+                    # 材料データ挿入
+                    ingredients = recipe_data.get('ingredients', [])
+                    for i, ingredient in enumerate(ingredients, 1):
+                        cur.execute("""
+                            INSERT INTO recipe_ingredients (recipe_id, ingredient, sort_order, ngram_vector)
+                            VALUES (%s, %s, %s, %s::tsvector);
+                        """, (recipe_data['id'], ingredient, i, self.ingredient_ngram_vector(ingredient)))
+                    
+                    # 手順データ挿入
+                    self._insert_instructions(cur, recipe_data['id'], 'modern', recipe_data.get('modern_instructions', []))
+                    self._insert_instructions(cur, recipe_data['id'], 'translation', recipe_data.get('modern_translation_instructions', []))
+                    self._insert_instructions(cur, recipe_data['id'], 'original', recipe_data.get('original_instructions', []))
+                
+                conn.commit()
+                self._invalidate_search_cache()
             return True
             
         except Error as e:
             print(f"Error inserting recipe data: {e}")
-            self.conn.rollback()
             return False
     
-    def _insert_instructions(self, recipe_id: int, instruction_type: str, instructions: List[str]) -> None:
+    @classmethod
+    def recipe_ngram_vector(cls, recipe_data: Dict) -> str:
+        """レシピの日本語N-gram検索用 tsvector リテラルを作成
+        
+        Args:
+            recipe_data: レシピデータ辞書
+            
+        Returns:
+            NGRAM_FIELDS の重みを付けた tsvector リテラル
+        """
+        return NgramTokenizer.to_tsvector_literal(
+            [(recipe_data.get(name), weight) for name, weight in cls.NGRAM_FIELDS]
+        )
+    
+    @classmethod
+    def recipe_content_hash(cls, recipe_data: Dict) -> str:
+        """レシピの内容（CONTENT_HASH_FIELDS）の SHA-256 ハッシュを作成
+        
+        Args:
+            recipe_data: レシピデータ辞書（extract_recipe_data の出力形式）
+            
+        Returns:
+            16進文字列のハッシュ
+        """
+        content = {name: recipe_data.get(name) for name in cls.CONTENT_HASH_FIELDS}
+        encoded = json.dumps(content, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def ingredient_ngram_vector(ingredient: str) -> str:
+        """材料の日本語N-gram検索用 tsvector リテラルを作成"""
+        return NgramTokenizer.to_tsvector_literal([(ingredient, 'D')])
+    
+    def _insert_instructions(self, cur, recipe_id: int, instruction_type: str, instructions: List[str]) -> None:
         """手順データを挿入
         
         Args:
+            cur: 借用中の接続のカーソル
             recipe_id: レシピID
             instruction_type: 手順タイプ
             instructions: 手順リスト
         """
         for i, instruction in enumerate(instructions, 1):
-            self.cur.execute("""
+            cur.execute("""
                 INSERT INTO recipe_instructions (recipe_id, instruction_type, instruction, step_number)
                 VALUES (%s, %s, %s, %s);
             """, (recipe_id, instruction_type, instruction, i))
     
+    def insert_recipes_bulk(self, recipes: Iterable[Dict], batch_size: int = 500,
+                            use_copy: bool = True) -> Optional[Dict[str, int]]:
+        """レシピデータをバッチ単位で一括挿入
+        
+        batch_size 件ごとにレシピ・材料・手順の行を蓄積し、テーブルごとに1回の
+        複数行INSERT（材料・手順は COPY）で書き込んでバッチごとにコミットする。
+        既存レシピは事前のSELECTではなく ON CONFLICT DO NOTHING でスキップし、
+        実際に挿入されたレシピの材料・手順のみを書き込む。
+        
+        Args:
+            recipes: レシピデータ辞書のイテラブル（extract_recipe_data の出力形式）
+            batch_size: 1トランザクションで書き込むレシピ数
+            use_copy: False の場合、材料・手順も execute_values で書き込む
+            
+        Returns:
+            inserted/skipped/batches を含む辞書、失敗時はNone
+            （失敗したバッチはロールバックされ、それ以前のバッチはコミット済み）
+        """
+        if batch_size < 1:
+            raise ValueError(f"Invalid batch_size: {batch_size}")
+        
+        recipe_iter = iter(recipes)
+        stats = {'inserted': 0, 'skipped': 0, 'batches': 0}
+        
+        try:
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    while True:
+                        batch = list(islice(recipe_iter, batch_size))
+                        if not batch:
+                            break
+                        
+                        inserted, skipped = self._write_recipe_batch(cur, batch, use_copy)
+                        conn.commit()
+                        self._invalidate_search_cache()
+                        
+                        stats['inserted'] += inserted
+                        stats['skipped'] += skipped
+                        stats['batches'] += 1
+            
+        except Error as e:
+            print(f"Error bulk inserting recipe data (batch {stats['batches'] + 1}): {e}")
+            return None
+        
+        print(f"✓ {stats['inserted']}件のレシピを一括登録しました"
+              f"（既存スキップ: {stats['skipped']}件, {stats['batches']}バッチ）")
+        return stats
+    
+    def _write_recipe_batch(self, cur, batch: List[Dict], use_copy: bool) -> Tuple[int, int]:
+        """1バッチ分のレシピ・材料・手順を書き込み（コミットは呼び出し側）
+        
+        Args:
+            cur: 借用中の接続のカーソル
+            batch: レシピデータ辞書のリスト
+            use_copy: 材料・手順を COPY で書き込むかどうか
+            
+        Returns:
+            (挿入件数, スキップ件数) のタプル
+        """
+        # バッチ内で重複したIDは先勝ちとする
+        recipes_by_id: Dict[int, Dict] = {}
+        for recipe_data in batch:
+            recipes_by_id.setdefault(recipe_data['id'], recipe_data)
+        
+        column_list = ', '.join(name for name, _ in self.RECIPE_COLUMNS)
+        inserted_ids = execute_values(cur, f"""
+            INSERT INTO edo_recipes ({column_list}) VALUES %s
+            ON CONFLICT (id) DO NOTHING
+            RETURNING id;
+        """, self._recipe_rows(recipes_by_id.values()), template=CopyWriter.values_template(self.RECIPE_COLUMNS),
+            page_size=len(recipes_by_id), fetch=True)
+        inserted_ids = [row[0] for row in inserted_ids]
+        
+        self._write_child_rows(cur, recipes_by_id, inserted_ids, use_copy)
+        return len(inserted_ids), len(batch) - len(inserted_ids)
+    
+    def _recipe_rows(self, recipes: Iterable[Dict], hashes: Optional[Dict[int, str]] = None) -> List[Tuple]:
+        """edo_recipes の行タプル（RECIPE_COLUMNS の列順）を作成"""
+        rows = []
+        for recipe_data in recipes:
+            content_hash = hashes[recipe_data['id']] if hashes else self.recipe_content_hash(recipe_data)
+            row_data = dict(recipe_data, ngram_vector=self.recipe_ngram_vector(recipe_data), content_hash=content_hash)
+            rows.append(tuple(row_data.get(name) for name, _ in self.RECIPE_COLUMNS))
+        return rows
+    
+    def _write_child_rows(self, cur, recipes_by_id: Dict[int, Dict], recipe_ids: Iterable[int], use_copy: bool) -> None:
+        """指定レシピの材料・手順の行を書き込み"""
+        ingredient_rows = []
+        instruction_rows = []
+        for recipe_id in recipe_ids:
+            recipe_data = recipes_by_id[recipe_id]
+            for i, ingredient in enumerate(recipe_data.get('ingredients', []), 1):
+                ingredient_rows.append((recipe_id, ingredient, i, self.ingredient_ngram_vector(ingredient)))
+            for instruction_type, key in self.INSTRUCTION_SOURCES:
+                for i, instruction in enumerate(recipe_data.get(key, []), 1):
+                    instruction_rows.append((recipe_id, instruction_type, instruction, i))
+        
+        write_rows = CopyWriter.copy_rows if use_copy else CopyWriter.insert_values
+        if ingredient_rows:
+            write_rows(cur, 'recipe_ingredients', self.INGREDIENT_COLUMNS, ingredient_rows)
+        if instruction_rows:
+            write_rows(cur, 'recipe_instructions', self.INSTRUCTION_COLUMNS, instruction_rows)
+    
+    def upsert_recipes(self, recipes: Iterable[Dict], batch_size: int = 500,
+                       use_copy: bool = True) -> Optional[Dict[str, int]]:
+        """レシピデータを差分更新（新規は挿入、内容が変わったレシピのみ更新）
+        
+        レシピごとに内容のハッシュ（recipe_content_hash）を計算し、保存済みの content_hash と
+        一致するレシピは何も書き込まない（N-gram の計算も省略する）。
+        変更されたレシピは本体を ON CONFLICT DO UPDATE で更新し、材料・手順を削除して書き直す。
+        
+        Args:
+            recipes: レシピデータ辞書のイテラブル（extract_recipe_data の出力形式）
+            batch_size: 1トランザクションで処理するレシピ数
+            use_copy: False の場合、材料・手順も execute_values で書き込む
+            
+        Returns:
+            inserted/updated/unchanged/batches を含む辞書、失敗時はNone
+            （失敗したバッチはロールバックされ、それ以前のバッチはコミット済み）
+        """
+        if batch_size < 1:
+            raise ValueError(f"Invalid batch_size: {batch_size}")
+        
+        recipe_iter = iter(recipes)
+        stats = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'batches': 0}
+        
+        try:
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    while True:
+                        batch = list(islice(recipe_iter, batch_size))
+                        if not batch:
+                            break
+                        
+                        inserted, updated, unchanged = self._upsert_recipe_batch(cur, batch, use_copy)
+                        conn.commit()
+                        if inserted or updated:
+                            self._invalidate_search_cache()
+                        
+                        stats['inserted'] += inserted
+                        stats['updated'] += updated
+                        stats['unchanged'] += unchanged
+                        stats['batches'] += 1
+            
+        except Error as e:
+            print(f"Error upserting recipe data (batch {stats['batches'] + 1}): {e}")
+            return None
+        
+        return stats
+    
+    def _upsert_recipe_batch(self, cur, batch: List[Dict], use_copy: bool) -> Tuple[int, int, int]:
+        """1バッチ分のレシピを差分更新（コミットは呼び出し側）
+        
+        Returns:
+            (挿入件数, 更新件数, 未変更件数) のタプル
+        """
+        # バッチ内で重複したIDは後勝ち（新しく取得した内容）とする
+        recipes_by_id: Dict[int, Dict] = {}
+        for recipe_data in batch:
+            recipes_by_id[recipe_data['id']] = recipe_data
+        hashes = {recipe_id: self.recipe_content_hash(recipe_data)
+                  for recipe_id, recipe_data in recipes_by_id.items()}
+        
+        cur.execute("SELECT id, content_hash FROM edo_recipes WHERE id = ANY(%s);", (list(hashes),))
+        stored_hashes = dict(cur.fetchall())
+        changed = [recipes_by_id[recipe_id] for recipe_id, content_hash in hashes.items()
+                   if stored_hashes.get(recipe_id) != content_hash]
+        if not changed:
+            return 0, 0, len(recipes_by_id)
+        
+        # 読み取り後に他のトランザクションが同じ内容を書き込んだ場合も、WHERE で同一内容の更新を避ける
+        column_list = ', '.join(name for name, _ in self.RECIPE_COLUMNS)
+        update_list = ', '.join(f"{name} = EXCLUDED.{name}" for name, _ in self.RECIPE_COLUMNS if name != 'id')
+        written = execute_values(cur, f"""
+            INSERT INTO edo_recipes ({column_list}) VALUES %s
+            ON CONFLICT (id) DO UPDATE SET {update_list}
+            WHERE edo_recipes.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+            RETURNING id, (xmax = 0) AS inserted;
+        """, self._recipe_rows(changed, hashes), template=CopyWriter.values_template(self.RECIPE_COLUMNS),
+            page_size=len(changed), fetch=True)
+        
+        written_ids = [recipe_id for recipe_id, _ in written]
+        updated_ids = [recipe_id for recipe_id, inserted in written if not inserted]
+        if updated_ids:
+            cur.execute("DELETE FROM recipe_ingredients WHERE recipe_id = ANY(%s);", (updated_ids,))
+            cur.execute("DELETE FROM recipe_instructions WHERE recipe_id = ANY(%s);", (updated_ids,))
+        self._write_child_rows(cur, recipes_by_id, written_ids, use_copy)
+        
+        inserted_count = len(written_ids) - len(updated_ids)
+        return inserted_count, len(updated_ids), len(recipes_by_id) - len(written_ids)
+    
+    def rebuild_ngram_vectors(self, batch_size: int = 1000) -> Optional[Dict[str, int]]:
+        """既存行の日本語N-gram検索用列を再計算
+        
+        ngram_vector 列の追加前に登録されたデータや、分かち書き規則の変更後に使用する。
+        主キー順にバッチ単位で読み出し、UPDATE ... FROM (VALUES ...) で書き戻す。
+        
+        Args:
+            batch_size: 1回に更新する行数
+            
+        Returns:
+            recipes/ingredients の更新件数を含む辞書、失敗時はNone
+        """
+        if batch_size < 1:
+            raise ValueError(f"Invalid batch_size: {batch_size}")
+        
+        field_list = ', '.join(name for name, _ in self.NGRAM_FIELDS)
+        stats = {'recipes': 0, 'ingredients': 0}
+        
+        try:
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    last_id = -32769  # SMALLINT の最小値未満から開始
+                    while True:
+                        cur.execute(f"""
+                            SELECT id, {field_list} FROM edo_recipes
+                            WHERE id > %s ORDER BY id LIMIT %s;
+                        """, (last_id, batch_size))
+                        rows = cur.fetchall()
+                        if not rows:
+                            break
+                        
+                        updates = [
+                            (row[0], self.recipe_ngram_vector(
+                                dict(zip((name for name, _ in self.NGRAM_FIELDS), row[1:]))))
+                            for row in rows
+                        ]
+                        execute_values(cur, """
+                            UPDATE edo_recipes r SET ngram_vector = v.ngram_vector::tsvector
+                            FROM (VALUES %s) AS v(id, ngram_vector)
+                            WHERE r.id = v.id;
+                        """, updates, page_size=len(updates))
+                        conn.commit()
+                        self._invalidate_search_cache()
+                        stats['recipes'] += len(updates)
+                        last_id = rows[-1][0]
+                    
+                    last_id = 0
+                    while True:
+                        cur.execute("""
+                            SELECT id, ingredient FROM recipe_ingredients
+                            WHERE id > %s ORDER BY id LIMIT %s;
+                        """, (last_id, batch_size))
+                        rows = cur.fetchall()
+                        if not rows:
+                            break
+                        
+                        updates = [(row[0], self.ingredient_ngram_vector(row[1])) for row in rows]
+                        execute_values(cur, """
+                            UPDATE recipe_ingredients ri SET ngram_vector = v.ngram_vector::tsvector
+                            FROM (VALUES %s) AS v(id, ngram_vector)
+                            WHERE ri.id = v.id;
+                        """, updates, page_size=len(updates))
+                        conn.commit()
+                        self._invalidate_search_cache()
+                        stats['ingredients'] += len(updates)
+                        last_id = rows[-1][0]
+            
+        except Error as e:
+            print(f"Error rebuilding ngram vectors: {e}")
+            return None
+        
+        print(f"✓ N-gram検索用列を再計算しました（レシピ: {stats['recipes']}件, 材料: {stats['ingredients']}件）")
+        return stats
+    
     def get_total_recipes_count(self) -> int:
         """登録済みレシピ総数を取得
         
@@ -240,18 +690,17 @@ class EdoRecipeManager:
             レシピ数、エラー時は0
         """
         try:
-            self.cur.execute("SELECT COUNT(*) FROM edo_recipes;")
-            return self.cur.fetchone()[0]
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT COUNT(*) FROM edo_recipes;")
+                    return cur.fetchone()[0]
         except Error as e:
             print(f"Error getting recipe count: {e}")
             return 0
     
     def close(self) -> None:
-        """データベース接続を適切にクローズ"""
-        if self.cur:
-            self.cur.close()
-        if self.conn:
-            self.conn.close()
+        """プールへの参照を解放（共有プール自体は他のインスタンスが利用するため閉じない）"""
+        self.pool = None
     
     def __enter__(self):
         """コンテキストマネージャーのエントリー"""
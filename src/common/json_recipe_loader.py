@@ -1,6 +1,10 @@
+import os
 import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator, Iterable, Callable
 
 
 class JsonRecipeLoader:
@@ -36,6 +40,217 @@ class JsonRecipeLoader:
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON format: {e}")
     
+    @staticmethod
+    def iter_edo_recipes_json(file_path: str, chunk_size: int = 65536) -> Iterator[Dict]:
+        """江戸料理レシピJSONファイルをレシピ1件ずつ逐次読み込むジェネレーター
+        
+        トップレベル配列をチャンク単位で読み進め、要素を1つデコードするごとに返す。
+        ファイル全体を保持しないため、巨大なJSONでもメモリ使用量は要素1件分程度に収まる。
+        
+        Args:
+            file_path: JSONファイルのパス
+            chunk_size: 1回に読み込む文字数
+            
+        Yields:
+            レシピデータの辞書
+            
+        Raises:
+            FileNotFoundError: ファイルが見つからない場合
+            ValueError: JSONデータが不正な場合
+        """
+        json_path = Path(file_path)
+        if not json_path.exists():
+            raise FileNotFoundError(f"JSON file not found: {file_path}")
+        
+        decoder = json.JSONDecoder()
+        
+        with open(json_path, 'r', encoding='utf-8') as f:
+            buffer = ''
+            pos = 0
+            eof = False
+            read_size = chunk_size
+            
+            def fill() -> bool:
+                """バッファに続きを読み込む（EOFならFalse）"""
+                nonlocal buffer, pos, eof
+                data = f.read(read_size)
+                if not data:
+                    eof = True
+                    return False
+                buffer = buffer[pos:] + data
+                pos = 0
+                return True
+            
+            def next_token() -> str:
+                """空白を読み飛ばして次の1文字を返す（EOFなら空文字）"""
+                nonlocal pos
+                while True:
+                    while pos < len(buffer) and buffer[pos] in ' \t\r\n':
+                        pos += 1
+                    if pos < len(buffer):
+                        return buffer[pos]
+                    if not fill():
+                        return ''
+            
+            if next_token() != '[':
+                raise ValueError("JSON data must be a list of recipes")
+            pos += 1
+            
+            if next_token() == ']':
+                pos += 1
+            else:
+                while True:
+                    if next_token() == '':
+                        raise ValueError("Invalid JSON format: unexpected end of data")
+                    
+                    # 要素が途中で切れている間は読み込みサイズを増やしながら再試行
+                    # （バッファ末尾で終わった値や、"1." のように区切り文字以外が続く数値は
+                    #  続きがある可能性があるため読み足す）
+                    while True:
+                        try:
+                            item, end = decoder.raw_decode(buffer, pos)
+                        except json.JSONDecodeError as e:
+                            if eof or not fill():
+                                raise ValueError(f"Invalid JSON format: {e}")
+                            read_size = min(read_size * 2, 64 * chunk_size)
+                            continue
+                        
+                        after = end
+                        while after < len(buffer) and buffer[after] in ' \t\r\n':
+                            after += 1
+                        if after < len(buffer):
+                            is_number = isinstance(item, (int, float)) and not isinstance(item, bool)
+                            if not is_number or buffer[after] in ',]':
+                                break
+                        if eof or not fill():
+                            break
+                        read_size = min(read_size * 2, 64 * chunk_size)
+                    
+                    pos = end
+                    read_size = chunk_size
+                    yield item
+                    
+                    token = next_token()
+                    pos += 1
+                    if token == ']':
+                        break
+                    if token != ',':
+                        raise ValueError(
+                            f"Invalid JSON format: expected ',' or ']' but got {token or 'end of data'!r}"
+                        )
+            
+            if next_token() != '':
+                raise ValueError("Invalid JSON format: extra data after top-level array")
+    
+    @staticmethod
+    def iter_valid_recipes(recipes: Iterable[Dict]) -> Iterator[Dict]:
+        """有効なレシピのみを逐次返すパイプラインステージ
+        
+        Args:
+            recipes: レシピデータの辞書のイテラブル
+            
+        Yields:
+            有効なレシピデータの辞書
+        """
+        for recipe in recipes:
+            if JsonRecipeLoader._is_valid_recipe(recipe):
+                yield recipe
+    
+    @staticmethod
+    def iter_recipe_data(recipes: Iterable[Dict],
+                         on_invalid: Optional[Callable[[Dict], None]] = None) -> Iterator[Dict]:
+        """レシピをデータベース用の形式に変換・バリデーションしながら逐次返すパイプラインステージ
+        
+        Args:
+            recipes: 元のレシピデータ辞書のイテラブル
+            on_invalid: バリデーション失敗時に元のレシピを受け取るコールバック
+            
+        Yields:
+            バリデーション済みのデータベース用レシピデータ辞書
+        """
+        for recipe in recipes:
+            recipe_data = JsonRecipeLoader.extract_recipe_data(recipe)
+            if JsonRecipeLoader.validate_recipe_data(recipe_data):
+                yield recipe_data
+            elif on_invalid is not None:
+                on_invalid(recipe)
+    
+    @staticmethod
+    def iter_recipe_data_parallel(recipes: Iterable[Dict], workers: Optional[int] = None,
+                                  chunk_size: int = 256,
+                                  on_invalid: Optional[Callable[[Dict], None]] = None) -> Iterator[Dict]:
+        """変換・バリデーションをプロセスプールで並列に行う iter_recipe_data（結果は入力の順）
+        
+        レシピを chunk_size 件ずつ解析プロセスに割り振り、完了したチャンクから入力の順に返す。
+        処理中のチャンクは workers の2倍までに抑えるため、逐次読み込みの入力でもメモリ使用量は増え続けない。
+        
+        Args:
+            recipes: 元のレシピデータ辞書のイテラブル
+            workers: プロセス数（None の場合はCPUコア数、1の場合は iter_recipe_data と同じく逐次処理）
+            chunk_size: 1回にプロセスへ渡すレシピ数（小さいほどプロセス間通信の回数が増える）
+            on_invalid: バリデーション失敗時に元のレシピを受け取るコールバック（呼び出し元のプロセスで呼ばれる）
+        
+        Yields:
+            バリデーション済みのデータベース用レシピデータ辞書
+        """
+        if chunk_size < 1:
+            raise ValueError(f"Invalid chunk_size: {chunk_size}")
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+            yield from JsonRecipeLoader.iter_recipe_data(recipes, on_invalid)
+            return
+        
+        recipe_iter = iter(recipes)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            max_pending = workers * 2
+            pending = deque()
+            try:
+                while True:
+                    # 処理中のチャンクが上限に達するまで投入する
+                    while len(pending) < max_pending:
+                        chunk = list(islice(recipe_iter, chunk_size))
+                        if not chunk:
+                            break
+                        pending.append((chunk, executor.submit(JsonRecipeLoader._extract_chunk, chunk)))
+                    if not pending:
+                        break
+                    
+                    chunk, future = pending.popleft()
+                    for recipe, recipe_data in zip(chunk, future.result()):
+                        if recipe_data is not None:
+                            yield recipe_data
+                        elif on_invalid is not None:
+                            on_invalid(recipe)
+            finally:
+                # 途中で打ち切られた場合、未着手のチャンクは実行しない
+                for _, future in pending:
+                    future.cancel()
+    
+    @staticmethod
+    def _extract_chunk(recipes: List[Dict]) -> List[Optional[Dict]]:
+        """解析プロセスでチャンク内のレシピを変換・バリデーション（失敗したレシピはNone）"""
+        results = []
+        for recipe in recipes:
+            recipe_data = JsonRecipeLoader.extract_recipe_data(recipe)
+            results.append(recipe_data if JsonRecipeLoader.validate_recipe_data(recipe_data) else None)
+        return results
+    
+    @staticmethod
+    def stream_recipe_data(file_path: str,
+                           on_invalid: Optional[Callable[[Dict], None]] = None) -> Iterator[Dict]:
+        """JSONファイルから 読み込み→フィルタ→変換→バリデーション を遅延評価で連結したパイプライン
+        
+        Args:
+            file_path: JSONファイルのパス
+            on_invalid: バリデーション失敗時に元のレシピを受け取るコールバック
+            
+        Returns:
+            バリデーション済みのデータベース用レシピデータ辞書のイテレーター
+        """
+        recipes = JsonRecipeLoader.iter_edo_recipes_json(file_path)
+        valid_recipes = JsonRecipeLoader.iter_valid_recipes(recipes)
+        return JsonRecipeLoader.iter_recipe_data(valid_recipes, on_invalid)
+    
     @staticmethod
     def filter_valid_recipes(recipes: List[Dict]) -> List[Dict]:
         """有効なレシピ（modern_recipeが存在するもの）をフィルタリング
@@ -46,13 +261,7 @@ class JsonRecipeLoader:
         Returns:
             有効なレシピのみの辞書リスト
         """
-        valid_recipes = []
-        
-        for recipe in recipes:
-            if JsonRecipeLoader._is_valid_recipe(recipe):
-                valid_recipes.append(recipe)
-        
-        return valid_recipes
+        return list(JsonRecipeLoader.iter_valid_recipes(recipes))
     
     @staticmethod
     def _is_valid_recipe(recipe: Dict) -> bool:
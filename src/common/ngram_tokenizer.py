@@ -0,0 +1,168 @@
+import unicodedata
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+class NgramTokenizer:
+    """日本語テキストのN-gram分かち書きを担当するクラス（SRP準拠）
+    
+    'simple' 設定は空白を含まない日本語の連続を1語として扱うため、
+    「卵」のような短いキーワードが一致しない。このクラスはCJK文字の連続を
+    ユニグラム・バイグラムに分割し、位置情報付きの tsvector リテラルを生成する。
+    検索時は同じ規則でキーワードを tsquery リテラルに変換する
+    （2文字以上はバイグラムを <-> で連結したフレーズ検索になり、部分文字列と同じ意味になる）。
+    英数字の連続は小文字化した1語として扱う。
+    """
+    
+    # tsvector の位置と、1語あたりの位置数の上限（PostgreSQLの制限）
+    MAX_POSITION = 16383
+    MAX_POSITIONS_PER_LEXEME = 256
+    # 1語のバイト長の上限（これを超える語は to_tsvector と同様に無視する）
+    MAX_LEXEME_BYTES = 2046
+    
+    _CJK_RANGES: Tuple[Tuple[int, int], ...] = (
+        (0x3005, 0x3007),    # 々〆〇
+        (0x3040, 0x309F),    # ひらがな
+        (0x30A0, 0x30FF),    # カタカナ（長音符を含む）
+        (0x31F0, 0x31FF),    # カタカナ拡張
+        (0x3400, 0x4DBF),    # CJK統合漢字拡張A
+        (0x4E00, 0x9FFF),    # CJK統合漢字
+        (0xF900, 0xFAFF),    # CJK互換漢字
+        (0x20000, 0x2FFFF),  # CJK統合漢字拡張B以降
+    )
+    
+    @staticmethod
+    def is_cjk(char: str) -> bool:
+        """CJK文字（かな・漢字）かどうか"""
+        code = ord(char)
+        return any(start <= code <= end for start, end in NgramTokenizer._CJK_RANGES)
+    
+    @staticmethod
+    def contains_cjk(text: Optional[str]) -> bool:
+        """テキストにCJK文字が含まれるかどうか"""
+        return bool(text) and any(NgramTokenizer.is_cjk(ch) for ch in text)
+    
+    @staticmethod
+    def _runs(text: str) -> Iterator[Tuple[str, bool]]:
+        """正規化したテキストを (連続部分, CJKかどうか) に分割
+        
+        NFKC正規化（半角カナ・全角英数の統一）と小文字化を行い、
+        CJK文字の連続と英数字の連続をそれぞれ1つの区切りとして返す。
+        """
+        normalized = unicodedata.normalize('NFKC', text).lower()
+        run: List[str] = []
+        run_is_cjk = False
+        
+        for ch in normalized:
+            if NgramTokenizer.is_cjk(ch):
+                kind = True
+            elif ch.isalnum():
+                kind = False
+            else:
+                if run:
+                    yield ''.join(run), run_is_cjk
+                    run = []
+                continue
+            
+            if run and kind != run_is_cjk:
+                yield ''.join(run), run_is_cjk
+                run = []
+            run_is_cjk = kind
+            run.append(ch)
+        
+        if run:
+            yield ''.join(run), run_is_cjk
+    
+    @staticmethod
+    def document_lexemes(text: Optional[str], start: int = 1) -> Tuple[List[Tuple[str, int]], int]:
+        """文書側の語と位置を抽出
+        
+        CJK文字の連続は各文字のユニグラムと、各位置から始まるバイグラムを同じ位置に置く。
+        連続部分の間には位置を1つ空け、フレーズ検索が区切りをまたがないようにする。
+        
+        Args:
+            text: 対象テキスト
+            start: 先頭の位置
+        
+        Returns:
+            ((語, 位置) のリスト, 次に使う位置) のタプル
+        """
+        lexemes: List[Tuple[str, int]] = []
+        position = start
+        if not text:
+            return lexemes, position
+        
+        for run, run_is_cjk in NgramTokenizer._runs(text):
+            if run_is_cjk:
+                for i, ch in enumerate(run):
+                    lexemes.append((ch, position + i))
+                    if i + 1 < len(run):
+                        lexemes.append((run[i:i + 2], position + i))
+                position += len(run) + 1
+            else:
+                lexemes.append((run, position))
+                position += 2
+        
+        return lexemes, position
+    
+    @staticmethod
+    def _quote(lexeme: str) -> str:
+        """tsvector/tsquery リテラル用に語をクォート"""
+        return "'" + lexeme.replace('\\', '\\\\').replace("'", "''") + "'"
+    
+    @staticmethod
+    def to_tsvector_literal(fields: Sequence[Tuple[Optional[str], str]]) -> str:
+        """複数フィールドから重み付きの tsvector リテラルを生成
+        
+        Args:
+            fields: (テキスト, 重み 'A'〜'D') のシーケンス。位置はフィールドをまたいで連番になる
+        
+        Returns:
+            '語':位置重み 形式の tsvector リテラル（:: tsvector でキャストして使う）
+        """
+        positions: Dict[str, List[str]] = {}
+        position = 1
+        
+        for text, weight in fields:
+            lexemes, position = NgramTokenizer.document_lexemes(text, position)
+            suffix = '' if weight == 'D' else weight
+            for lexeme, pos in lexemes:
+                if len(lexeme.encode('utf-8')) > NgramTokenizer.MAX_LEXEME_BYTES:
+                    continue
+                entries = positions.setdefault(lexeme, [])
+                if len(entries) < NgramTokenizer.MAX_POSITIONS_PER_LEXEME:
+                    entries.append(f"{min(pos, NgramTokenizer.MAX_POSITION)}{suffix}")
+        
+        return ' '.join(
+            f"{NgramTokenizer._quote(lexeme)}:{','.join(entries)}"
+            for lexeme, entries in positions.items()
+        )
+    
+    @staticmethod
+    def to_tsquery_literal(keyword: Optional[str], weights: str = '') -> Optional[str]:
+        """検索キーワードを文書側と同じ規則で tsquery リテラルに変換
+        
+        - CJK 1文字: ユニグラム
+        - CJK 2文字以上: バイグラムを <-> で連結したフレーズ（部分文字列一致と同義）
+        - 英数字: 小文字化した1語
+        空白などで区切られた複数の部分は AND（&）で結合する。
+        
+        Args:
+            keyword: 検索キーワード
+            weights: 対象とする重み（例: 'AB' で名前・説明のみ）。空文字は全フィールド
+        
+        Returns:
+            tsquery リテラル（:: tsquery でキャストして使う）、語が無い場合はNone
+        """
+        if not keyword:
+            return None
+        
+        suffix = f":{weights}" if weights else ''
+        terms = []
+        for run, run_is_cjk in NgramTokenizer._runs(keyword):
+            if run_is_cjk and len(run) > 1:
+                grams = [NgramTokenizer._quote(run[i:i + 2]) + suffix for i in range(len(run) - 1)]
+                terms.append('(' + ' <-> '.join(grams) + ')' if len(grams) > 1 else grams[0])
+            elif len(run.encode('utf-8')) <= NgramTokenizer.MAX_LEXEME_BYTES:
+                terms.append(NgramTokenizer._quote(run) + suffix)
+        
+        return ' & '.join(terms) if terms else None
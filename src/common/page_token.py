@@ -0,0 +1,75 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, List, Sequence
+
+
+class PageToken:
+    """キーセットページネーション用の継続トークンを担当するクラス（SRP準拠）
+    
+    前ページ最終行のソートキー（例: (rank, name, id) や (created_at, id)）を
+    JSON にして URL セーフな Base64 に符号化する。呼び出し側にとっては不透明な文字列で、
+    次ページの取得時にそのまま渡し返してもらう。トークンには種別を含め、
+    別の検索のトークンが渡された場合は ValueError とする。
+    """
+    
+    _DATETIME_KEY = '$dt'
+    
+    @staticmethod
+    def _default(value: Any) -> Any:
+        """JSON に直接変換できない値の変換（datetime のみ対応）"""
+        if isinstance(value, datetime):
+            return {PageToken._DATETIME_KEY: value.isoformat()}
+        raise TypeError(f"Unsupported page key type: {type(value).__name__}")
+    
+    @staticmethod
+    def _object_hook(obj: dict) -> Any:
+        """_default で変換した値の復元"""
+        if set(obj) == {PageToken._DATETIME_KEY}:
+            return datetime.fromisoformat(obj[PageToken._DATETIME_KEY])
+        return obj
+    
+    @staticmethod
+    def encode(kind: str, key: Sequence[Any]) -> str:
+        """ソートキーから継続トークンを作成
+        
+        Args:
+            kind: トークンの種別（検索メソッドごとに固有の文字列）
+            key: 最終行のソートキー
+        
+        Returns:
+            継続トークン
+        """
+        payload = json.dumps({'k': kind, 'v': list(key)}, default=PageToken._default,
+                             ensure_ascii=False, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+    
+    @staticmethod
+    def decode(kind: str, token: str, key_length: int) -> List[Any]:
+        """継続トークンからソートキーを復元
+        
+        Args:
+            kind: 期待するトークンの種別
+            token: encode で作成したトークン
+            key_length: ソートキーの要素数
+        
+        Returns:
+            ソートキーのリスト
+        
+        Raises:
+            ValueError: トークンが不正、または種別・要素数が一致しない場合
+        """
+        try:
+            padded = token + '=' * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'),
+                                 object_hook=PageToken._object_hook)
+        except (binascii.Error, UnicodeError, ValueError) as e:
+            raise ValueError(f"Invalid page token: {e}") from e
+        
+        if not isinstance(payload, dict) or payload.get('k') != kind:
+            raise ValueError(f"Page token is not for '{kind}'")
+        key = payload.get('v')
+        if not isinstance(key, list) or len(key) != key_length:
+            raise ValueError("Invalid page token: unexpected key")
+        return key
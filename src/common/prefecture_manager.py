@@ -1,14 +1,67 @@
-import psycopg2
+import time
+import threading
+from itertools import islice
 from psycopg2 import Error
-from psycopg2.extensions import connection
-from typing import Optional, List, Tuple, Dict
+from typing import Optional, List, Tuple, Dict, Iterable, Iterator, Union, Any
 
 from .database_config import DatabaseConfig
+from .cache_invalidation import CacheInvalidation, CacheInvalidationListener
+from .connection_pool import ConnectionPool
+from .copy_writer import CopyWriter
+from .prefecture_snapshot import PrefectureSnapshot
 
 
 class PrefectureManager:
     """都道府県データの管理を担当するクラス（SRP準拠）"""
     
+    # バルクロード時の列順と型（COPY binary のエンコードに使用）
+    PREFECTURE_COLUMNS: Tuple[Tuple[str, str], ...] = (
+        ('id', 'int2'),
+        ('name', 'text'),
+        ('name_kana', 'text'),
+        ('capital', 'text'),
+        ('largest_city', 'text'),
+        ('region', 'text'),
+        ('population', 'int4'),
+        ('area', 'numeric'),
+        ('population_density', 'numeric'),
+        ('municipalities_count', 'int2'),
+        ('lower_house_seats', 'int2'),
+        ('upper_house_seats', 'int2'),
+    )
+    
+    # 変更時に CacheInvalidation.CHANNEL へ NOTIFY するテーブル
+    NOTIFY_TABLES: Tuple[str, ...] = ('prefectures',)
+    
+    # ランキング可能な列と、上位N件の取得に使うインデックス
+    RANKING_METRICS: Dict[str, str] = {
+        'population': 'idx_prefectures_population',
+        'area': 'idx_prefectures_area',
+        'population_density': 'idx_prefectures_density',
+        'lower_house_seats': 'idx_prefectures_lower_house_seats',
+        'upper_house_seats': 'idx_prefectures_upper_house_seats',
+    }
+    
+    # 地方別・全国の集計値（人口密度は合計から再計算）
+    AGGREGATE_METRICS: Tuple[Tuple[str, str], ...] = (
+        ('prefectures', 'COUNT(*)'),
+        ('population', 'SUM(population)'),
+        ('area', 'SUM(area)'),
+        ('population_density', 'ROUND(SUM(population) / NULLIF(SUM(area), 0), 1)'),
+        ('lower_house_seats', 'SUM(lower_house_seats)'),
+        ('upper_house_seats', 'SUM(upper_house_seats)'),
+    )
+    
+    # 地方別・全国の集計を保持するマテリアライズドビュー（ビュー名, キー列）。
+    # REFRESH ... CONCURRENTLY にはキー列の一意インデックスが必要
+    STATISTICS_VIEWS: Tuple[Tuple[str, str], ...] = (
+        ('prefecture_region_stats', 'region'),
+        ('prefecture_national_stats', 'scope'),
+    )
+    
+    # 集計・ランキング結果を int で返す指標（それ以外は Decimal）
+    INTEGER_METRICS = frozenset({'prefectures', 'population', 'lower_house_seats', 'upper_house_seats'})
+    
     def __init__(self, db_config: DatabaseConfig):
         """PrefectureManagerを初期化
         
@@ -16,19 +69,18 @@ class PrefectureManager:
             db_config: データベース設定オブジェクト
         """
         self.db_config = db_config
-        self.conn: Optional[connection] = None
-        self.cur = None
+        self.pool: Optional[ConnectionPool] = None
+        self._snapshot: Optional[PrefectureSnapshot] = None
+        self._snapshot_generation = 0
+        self._snapshot_lock = threading.Lock()
+        # 最後の集計ビューの更新に失敗し、ビューの内容がテーブルより古い場合True
+        self._statistics_views_stale = False
         self._connect()
     
     def _connect(self) -> None:
-        """データベースに接続"""
-        try:
-            self.conn = psycopg2.connect(**self.db_config.to_connection_params())
-            self.cur = self.conn.cursor()
-            print(f"Connected to database: {self.db_config}")
-        except Error as e:
-            print(f"Error connecting to PostgreSQL: {e}")
-            raise
+        """共有コネクションプールを取得（接続は操作ごとに借用）"""
+        self.pool = ConnectionPool.shared(self.db_config)
+        print(f"Connected to database: {self.db_config}")
     
     def table_exists(self, table_name: str) -> bool:
         """テーブルの存在確認
@@ -40,13 +92,15 @@ class PrefectureManager:
             テーブルが存在する場合True
         """
         try:
-            self.cur.execute("""
-                SELECT EXISTS (
-                    SELECT FROM information_schema.tables 
-                    WHERE table_name = %s
-                );
-            """, (table_name,))
-            return self.cur.fetchone()[0]
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("""
+                        SELECT EXISTS (
+                            SELECT FROM information_schema.tables 
+                            WHERE table_name = %s
+                        );
+                    """, (table_name,))
+                    return cur.fetchone()[0]
         except Error as e:
             print(f"Error checking table existence: {e}")
             return False
@@ -80,25 +134,36 @@ class PrefectureManager:
             "CREATE INDEX IF NOT EXISTS idx_prefectures_population ON prefectures(population DESC);",
             "CREATE INDEX IF NOT EXISTS idx_prefectures_area ON prefectures(area DESC);",
             "CREATE INDEX IF NOT EXISTS idx_prefectures_density ON prefectures(population_density DESC);",
+            "CREATE INDEX IF NOT EXISTS idx_prefectures_lower_house_seats ON prefectures(lower_house_seats DESC);",
+            "CREATE INDEX IF NOT EXISTS idx_prefectures_upper_house_seats ON prefectures(upper_house_seats DESC);",
             "CREATE INDEX IF NOT EXISTS idx_prefectures_region ON prefectures(region);"
         ]
         
         try:
-            # テーブル作成
-            self.cur.execute(create_prefectures_table_query)
-            print("✓ prefecturesテーブルを作成しました")
-            
-            # インデックス作成
-            for index_query in create_indexes_queries:
-                self.cur.execute(index_query)
-            print("✓ インデックスを作成しました")
-            
-            self.conn.commit()
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    # テーブル作成
+                    cur.execute(create_prefectures_table_query)
+                    print("✓ prefecturesテーブルを作成しました")
+                    
+                    # インデックス作成
+                    for index_query in create_indexes_queries:
+                        cur.execute(index_query)
+                    print("✓ インデックスを作成しました")
+                    
+                    # 地方別・全国の集計ビュー
+                    for query in self.build_statistics_views_queries():
+                        cur.execute(query)
+                    print("✓ 集計用マテリアライズドビューを作成しました")
+                    
+                    # 他プロセスのキャッシュ破棄用の通知トリガー
+                    CacheInvalidation.install(cur, self.NOTIFY_TABLES)
+                
+                conn.commit()
             return True
             
         except Error as e:
             print(f"Error creating tables: {e}")
-            self.conn.rollback()
             return False
     
     def drop_tables(self) -> bool:
@@ -108,15 +173,19 @@ class PrefectureManager:
             削除成功時はTrue、失敗時はFalse
         """
         try:
-            # CASCADE でインデックスも含めて削除
-            self.cur.execute("DROP TABLE IF EXISTS prefectures CASCADE;")
-            self.conn.commit()
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    # CASCADE でインデックスと集計ビューも含めて削除
+                    cur.execute("DROP TABLE IF EXISTS prefectures CASCADE;")
+                    # DROP TABLE ではトリガーが動かないため明示的に通知する
+                    CacheInvalidation.notify(cur, self.NOTIFY_TABLES)
+                conn.commit()
+                self.invalidate_snapshot()
             print("✓ 既存テーブルを削除しました")
             return True
             
         except Error as e:
             print(f"Error dropping tables: {e}")
-            self.conn.rollback()
             return False
     
     def insert_prefecture_data(self, data_list: List[Dict]) -> bool:
@@ -126,7 +195,8 @@ class PrefectureManager:
             data_list: 都道府県データの辞書リスト
             
         Returns:
-            挿入成功時はTrue、失敗時はFalse
+            挿入と集計ビューの更新が成功した場合True、失敗時はFalse
+            （ビューの更新だけが失敗した場合、挿入した行は残り、ビューの集計は古いまま）
         """
         insert_query = """
         INSERT INTO prefectures (
@@ -141,16 +211,357 @@ class PrefectureManager:
         """
         
         try:
-            # バッチ挿入の実行
-            self.cur.executemany(insert_query, data_list)
-            self.conn.commit()
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    # バッチ挿入の実行
+                    cur.executemany(insert_query, data_list)
+                conn.commit()
+                self.invalidate_snapshot()
             print(f"✓ {len(data_list)}件のデータを挿入しました")
-            return True
             
         except Error as e:
             print(f"Error inserting prefecture data: {e}")
-            self.conn.rollback()
             return False
+        
+        return self.refresh_statistics_views()
+    
+    def insert_prefecture_data_bulk(self, rows: Iterable[Dict], copy_format: str = 'text',
+                                    chunk_size: int = 10000) -> Optional[Dict[str, Any]]:
+        """都道府県データを COPY FROM STDIN で一括挿入
+        
+        rows を chunk_size 件ずつメモリ上のバッファにエンコードして COPY で送り込む。
+        全チャンクを1トランザクションで書き込み、途中で失敗した場合はすべてロールバックする。
+        接続先が COPY に対応していない場合は execute_values のページ単位INSERTに切り替える。
+        
+        Args:
+            rows: 都道府県データの辞書のイテラブル（CSVLoader.iter_prefectures_csv など）
+            copy_format: 'text' または 'binary'
+            chunk_size: 1回のCOPY（またはINSERTページ）で送る行数
+            
+        Returns:
+            rows/method/seconds/rows_per_sec/views_refreshed を含む辞書、失敗時はNone
+            （views_refreshed が False の場合、挿入した行は残り、集計ビューの集計は古いまま）
+        """
+        column_names = [name for name, _ in self.PREFECTURE_COLUMNS]
+        row_iter = iter(rows)
+        
+        def dict_chunks() -> Iterator[List[Tuple]]:
+            while True:
+                chunk = [tuple(row[name] for name in column_names)
+                         for row in islice(row_iter, chunk_size)]
+                if not chunk:
+                    return
+                yield chunk
+        
+        return self.insert_prefecture_chunks(dict_chunks(), copy_format)
+    
+    def insert_prefecture_chunks(self, chunks: Iterable[Union[List[Tuple], Dict[str, List]]],
+                                 copy_format: str = 'text') -> Optional[Dict[str, Any]]:
+        """型変換済みのチャンクを COPY FROM STDIN で一括挿入
+        
+        CSVLoader.iter_prefecture_chunks の出力をそのまま受け取り、チャンクごとに COPY する。
+        全チャンクを1トランザクションで書き込み、途中で失敗した場合はすべてロールバックする。
+        最初のチャンクで COPY 非対応と判明した場合は execute_values のページ単位INSERTに切り替える。
+        
+        Args:
+            chunks: PREFECTURE_COLUMNS の列順の行タプルのリスト、または列名→値リストの辞書のイテラブル
+            copy_format: 'text' または 'binary'
+            
+        Returns:
+            rows/method/seconds/rows_per_sec/views_refreshed を含む辞書、失敗時はNone
+            （views_refreshed が False の場合、挿入した行は残り、集計ビューの集計は古いまま）
+        """
+        if copy_format not in CopyWriter.FORMATS:
+            raise ValueError(f"Unsupported COPY format: {copy_format}")
+        
+        column_names = [name for name, _ in self.PREFECTURE_COLUMNS]
+        method = f"COPY {copy_format}"
+        total_rows = 0
+        started = time.perf_counter()
+        
+        try:
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    for chunk in chunks:
+                        if isinstance(chunk, dict):
+                            # 列指向チャンクは行タプルに組み替える
+                            chunk = list(zip(*(chunk[name] for name in column_names)))
+                        if not chunk:
+                            continue
+                        
+                        if method == 'execute_values':
+                            total_rows += CopyWriter.insert_values(
+                                cur, 'prefectures', self.PREFECTURE_COLUMNS, chunk, page_size=len(chunk))
+                            continue
+                        
+                        try:
+                            total_rows += CopyWriter.copy_rows(
+                                cur, 'prefectures', self.PREFECTURE_COLUMNS, chunk, copy_format)
+                        except Error as e:
+                            # 最初のチャンクでCOPY非対応と判明した場合のみ代替経路へ切り替え可能
+                            if total_rows > 0 or not CopyWriter.is_copy_unsupported(e):
+                                raise
+                            print(f"COPY is not available, falling back to execute_values: {e}")
+                            conn.rollback()
+                            method = 'execute_values'
+                            total_rows += CopyWriter.insert_values(
+                                cur, 'prefectures', self.PREFECTURE_COLUMNS, chunk, page_size=len(chunk))
+                
+                conn.commit()
+                self.invalidate_snapshot()
+            
+        except Error as e:
+            print(f"Error bulk loading prefecture data: {e}")
+            return None
+        
+        elapsed = time.perf_counter() - started
+        rows_per_sec = total_rows / elapsed if elapsed > 0 else float(total_rows)
+        print(f"✓ {total_rows}件のデータを挿入しました（{method}, {rows_per_sec:,.0f} rows/sec）")
+        views_refreshed = self.refresh_statistics_views()
+        return {
+            'rows': total_rows,
+            'method': method,
+            'seconds': elapsed,
+            'rows_per_sec': rows_per_sec,
+            'views_refreshed': views_refreshed
+        }
+    
+    @classmethod
+    def _aggregate_columns(cls, indent: str) -> str:
+        """AGGREGATE_METRICS の集計式を SELECT 列のリストに展開"""
+        return ',\n'.join(f"{indent}{expression} AS {metric}" for metric, expression in cls.AGGREGATE_METRICS)
+    
+    @classmethod
+    def build_statistics_views_queries(cls) -> List[str]:
+        """地方別・全国の集計マテリアライズドビューと、その一意インデックスを作成するDDLを作成
+        
+        prefecture_region_stats は地方ごとに1行（position は地方内の最小の都道府県ID）、
+        prefecture_national_stats は scope = 'national' の1行を持つ。
+        """
+        region_view, region_key = cls.STATISTICS_VIEWS[0]
+        national_view, national_key = cls.STATISTICS_VIEWS[1]
+        columns = cls._aggregate_columns('                   ')
+        return [
+            f"""
+            CREATE MATERIALIZED VIEW IF NOT EXISTS {region_view} AS
+            SELECT region, MIN(id) AS position,
+{columns}
+            FROM prefectures
+            GROUP BY region;
+            """,
+            f"""
+            CREATE MATERIALIZED VIEW IF NOT EXISTS {national_view} AS
+            SELECT 'national'::text AS scope, 0 AS position,
+{columns}
+            FROM prefectures;
+            """,
+        ] + [
+            f"CREATE UNIQUE INDEX IF NOT EXISTS idx_{view_name}_{key} ON {view_name}({key});"
+            for view_name, key in ((region_view, region_key), (national_view, national_key))
+        ]
+    
+    def refresh_statistics_views(self, concurrently: bool = True) -> bool:
+        """集計マテリアライズドビューを最新のデータで更新
+        
+        CONCURRENTLY の場合は更新中も古い内容を読み取れる（読み取り側をブロックしない）。
+        
+        Args:
+            concurrently: REFRESH MATERIALIZED VIEW CONCURRENTLY を使う場合True
+            
+        Returns:
+            更新成功時はTrue、失敗時はFalse
+        """
+        option = ' CONCURRENTLY' if concurrently else ''
+        try:
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    for view_name, _ in self.STATISTICS_VIEWS:
+                        cur.execute(f"REFRESH MATERIALIZED VIEW{option} {view_name};")
+                conn.commit()
+            self._statistics_views_stale = False
+            print("✓ 集計用マテリアライズドビューを更新しました")
+            return True
+        except Error as e:
+            self._statistics_views_stale = True
+            print(f"Error refreshing statistics views: {e}")
+            return False
+    
+    @property
+    def statistics_views_stale(self) -> bool:
+        """最後の集計ビューの更新に失敗し、ビューの集計がテーブルより古い場合True"""
+        return self._statistics_views_stale
+    
+    @classmethod
+    def build_rankings_query(cls, metrics: Iterable[str]) -> List[str]:
+        """指定した指標ごとの上位N件を取得するSELECT（UNION ALL で連結する部品）を作成
+        
+        各指標は対応する idx_prefectures_* インデックスの順に LIMIT 件だけ読み、
+        ウィンドウ関数 RANK() で順位を付ける（同値は同順位）。
+        結果列は (kind, key, position, label, value) = ('ranking', 指標, 順位, 都道府県名, 値)。
+        
+        Args:
+            metrics: RANKING_METRICS のキー
+            
+        Returns:
+            SELECT文のリスト（パラメータ %(limit)s を含む）
+            
+        Raises:
+            ValueError: 未対応の指標が含まれる場合
+        """
+        branches = []
+        for metric in metrics:
+            if metric not in cls.RANKING_METRICS:
+                raise ValueError(f"Unsupported ranking metric: {metric}")
+            branches.append(f"""
+                SELECT 'ranking' AS kind, '{metric}' AS key,
+                       RANK() OVER (ORDER BY {metric} DESC)::int AS position,
+                       name AS label, {metric}::numeric AS value
+                FROM (
+                    SELECT id, name, {metric} FROM prefectures
+                    ORDER BY {metric} DESC, id
+                    LIMIT %(limit)s
+                ) AS top_{metric}
+            """)
+        return branches
+    
+    @classmethod
+    def build_aggregates_query(cls, use_views: bool = True) -> str:
+        """地方別と全国の集計を取得するSELECT（UNION ALL で連結する部品）を作成
+        
+        use_views の場合は集計マテリアライズドビューを読み、基のテーブルを走査しない。
+        それ以外は GROUPING SETS で地方別と全国を1回に計算する。
+        結果列は (kind, key, position, label, value) = ('aggregate', 地方名（全国はNULL）, 並び順, 指標, 値)。
+        並び順は地方内の最小の都道府県ID（全国は0）。
+        """
+        metric_names = ', '.join(metric for metric, _ in cls.AGGREGATE_METRICS)
+        if use_views:
+            region_view, _ = cls.STATISTICS_VIEWS[0]
+            national_view, _ = cls.STATISTICS_VIEWS[1]
+            totals = f"""
+                    SELECT region, position, {metric_names} FROM {region_view}
+                    UNION ALL
+                    SELECT NULL, position, {metric_names} FROM {national_view}"""
+        else:
+            totals = f"""
+                    SELECT CASE WHEN GROUPING(region) = 1 THEN NULL ELSE region END AS region,
+                           CASE WHEN GROUPING(region) = 1 THEN 0 ELSE MIN(id) END AS position,
+{cls._aggregate_columns('                           ')}
+                    FROM prefectures
+                    GROUP BY GROUPING SETS ((region), ())"""
+        unpivot_values = ', '.join(
+            f"('{metric}', totals.{metric}::numeric)" for metric, _ in cls.AGGREGATE_METRICS)
+        return f"""
+                SELECT 'aggregate' AS kind, totals.region AS key, totals.position,
+                       metric.label, metric.value
+                FROM ({totals}
+                ) AS totals
+                CROSS JOIN LATERAL (VALUES {unpivot_values}) AS metric(label, value)
+            """
+    
+    @classmethod
+    def _metric_value(cls, metric: str, value: Any) -> Any:
+        """NUMERIC で統一して返した値を、指標本来の型（int または Decimal）に戻す"""
+        if value is not None and metric in cls.INTEGER_METRICS:
+            return int(value)
+        return value
+    
+    def _fetch_statistics(self, branches: List[str], metrics: List[str], limit: int) -> Dict[str, Any]:
+        """UNION ALL で連結した1ステートメントを実行し、ランキングと集計に組み替える（エラーは呼び出し側で処理）"""
+        query = "\nUNION ALL\n".join(f"({branch})" for branch in branches) + "\nORDER BY kind, position, key;"
+        with self.pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, {'limit': limit})
+                rows = cur.fetchall()
+        
+        rankings: Dict[str, List[Tuple]] = {metric: [] for metric in metrics}
+        regions: Dict[str, Dict[str, Any]] = {}
+        national: Dict[str, Any] = {}
+        for kind, key, position, label, value in rows:
+            if kind == 'ranking':
+                rankings[key].append((position, label, self._metric_value(key, value)))
+            elif key is None:
+                national[label] = self._metric_value(label, value)
+            else:
+                regions.setdefault(key, {})[label] = self._metric_value(label, value)
+        
+        return {'rankings': rankings, 'regions': regions, 'national': national}
+    
+    def get_rankings(self, metrics: Iterable[str] = tuple(RANKING_METRICS),
+                     limit: int = 3) -> Optional[Dict[str, List[Tuple]]]:
+        """複数の指標の上位N件を1ステートメントで取得
+        
+        Args:
+            metrics: RANKING_METRICS のキー（デフォルトはすべて）
+            limit: 指標ごとの取得件数
+            
+        Returns:
+            指標 → (順位, 都道府県名, 値) のタプルリスト の辞書、失敗時はNone
+            
+        Raises:
+            ValueError: 未対応の指標が含まれる場合
+        """
+        metrics = list(dict.fromkeys(metrics))
+        branches = self.build_rankings_query(metrics)
+        if not branches:
+            return {}
+        
+        try:
+            return self._fetch_statistics(branches, metrics, limit)['rankings']
+        except Error as e:
+            print(f"Error getting prefecture rankings: {e}")
+            return None
+    
+    def get_prefecture_statistics(self, metrics: Iterable[str] = tuple(RANKING_METRICS),
+                                  limit: int = 3, use_views: bool = True) -> Optional[Dict[str, Any]]:
+        """ダッシュボード用に、複数のランキングと地方別・全国の集計を1ステートメントで取得
+        
+        Args:
+            metrics: ランキングを取得する RANKING_METRICS のキー（デフォルトはすべて）
+            limit: 指標ごとのランキング件数
+            use_views: True の場合、集計は STATISTICS_VIEWS から読む（False の場合はテーブルから計算）
+            
+        Returns:
+            以下のキーを持つ辞書、失敗時はNone
+            - rankings: 指標 → (順位, 都道府県名, 値) のタプルリスト
+            - regions: 地方名 → AGGREGATE_METRICS の指標 → 値（地方の並びは都道府県ID順）
+            - national: 全国の AGGREGATE_METRICS の指標 → 値
+            - stale: 集計ビューの更新に失敗しており、regions/national が古い場合True
+            
+        Raises:
+            ValueError: 未対応の指標が含まれる場合
+        """
+        metrics = list(dict.fromkeys(metrics))
+        branches = self.build_rankings_query(metrics) + [self.build_aggregates_query(use_views)]
+        
+        try:
+            statistics = self._fetch_statistics(branches, metrics, limit)
+        except Error as e:
+            print(f"Error getting prefecture statistics: {e}")
+            return None
+        statistics['stale'] = use_views and self._statistics_views_stale
+        return statistics
+    
+    def get_region_statistics(self) -> Optional[Dict[str, Any]]:
+        """地方別・全国の集計を集計ビューから取得（基のテーブルは走査しない）
+        
+        Returns:
+            regions（地方名 → 指標 → 値）、national（指標 → 値）と
+            stale（集計ビューの更新に失敗しており、集計が古い場合True）を持つ辞書、失敗時はNone
+        """
+        try:
+            statistics = self._fetch_statistics([self.build_aggregates_query(use_views=True)], [], 0)
+        except Error as e:
+            print(f"Error getting region statistics: {e}")
+            return None
+        return {'regions': statistics['regions'], 'national': statistics['national'],
+                'stale': self._statistics_views_stale}
+    
+    def _get_top_prefectures(self, metric: str, limit: int) -> Optional[List[Tuple]]:
+        """1つの指標の上位N件を (都道府県名, 値) のタプルリストで取得"""
+        rankings = self.get_rankings((metric,), limit)
+        if rankings is None:
+            return None
+        return [(name, value) for _, name, value in rankings[metric]]
     
     def get_top_prefectures_by_area(self, limit: int = 3) -> Optional[List[Tuple]]:
         """面積の大きい都道府県を取得
@@ -161,17 +572,7 @@ class PrefectureManager:
         Returns:
             (都道府県名, 面積) のタプルリスト、失敗時はNone
         """
-        try:
-            self.cur.execute("""
-                SELECT name, area 
-                FROM prefectures 
-                ORDER BY area DESC 
-                LIMIT %s;
-            """, (limit,))
-            return self.cur.fetchall()
-        except Error as e:
-            print(f"Error getting top prefectures by area: {e}")
-            return None
+        return self._get_top_prefectures('area', limit)
     
     def get_top_prefectures_by_population(self, limit: int = 3) -> Optional[List[Tuple]]:
         """人口の多い都道府県を取得
@@ -182,17 +583,63 @@ class PrefectureManager:
         Returns:
             (都道府県名, 人口) のタプルリスト、失敗時はNone
         """
+        return self._get_top_prefectures('population', limit)
+    
+    def load_snapshot(self) -> Optional[PrefectureSnapshot]:
+        """prefectures テーブル全体を1回のクエリで読み込み、列指向のスナップショットを作成
+        
+        Returns:
+            PrefectureSnapshot、失敗時はNone
+        """
+        column_names = ', '.join(name for name, _ in self.PREFECTURE_COLUMNS)
         try:
-            self.cur.execute("""
-                SELECT name, population 
-                FROM prefectures 
-                ORDER BY population DESC 
-                LIMIT %s;
-            """, (limit,))
-            return self.cur.fetchall()
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(f"SELECT {column_names} FROM prefectures ORDER BY id;")
+                    rows = cur.fetchall()
         except Error as e:
-            print(f"Error getting top prefectures by population: {e}")
+            print(f"Error loading prefecture snapshot: {e}")
             return None
+        
+        return PrefectureSnapshot.from_rows(self.PREFECTURE_COLUMNS, rows)
+    
+    def snapshot(self, refresh: bool = False) -> Optional[PrefectureSnapshot]:
+        """保持しているスナップショットを取得（未読み込み・refresh 指定時は読み込み直す）
+        
+        読み込み中に invalidate_snapshot() された場合、読み込んだ結果は返すが保持しない。
+        
+        Args:
+            refresh: True の場合は保持しているスナップショットを使わずに読み込む
+            
+        Returns:
+            PrefectureSnapshot、読み込みに失敗した場合は保持している古いスナップショット（なければNone）
+        """
+        with self._snapshot_lock:
+            if self._snapshot is not None and not refresh:
+                return self._snapshot
+            generation = self._snapshot_generation
+        
+        loaded = self.load_snapshot()
+        with self._snapshot_lock:
+            if loaded is None:
+                return self._snapshot
+            if generation == self._snapshot_generation:
+                self._snapshot = loaded
+        return loaded
+    
+    def invalidate_snapshot(self) -> None:
+        """保持しているスナップショットを破棄（次の snapshot() で読み込み直す）"""
+        with self._snapshot_lock:
+            self._snapshot = None
+            self._snapshot_generation += 1
+    
+    def listen_for_invalidation(self, listener: CacheInvalidationListener) -> None:
+        """prefectures の変更通知（NOTIFY）を受けてスナップショットを破棄するよう登録
+        
+        Args:
+            listener: プロセスで共有する CacheInvalidationListener（start() は呼び出し側で行う）
+        """
+        listener.subscribe(self.NOTIFY_TABLES, lambda _table_name: self.invalidate_snapshot())
     
     def get_total_records_count(self) -> int:
         """テーブル内の総レコード数を取得
@@ -201,18 +648,17 @@ class PrefectureManager:
             レコード数、エラー時は0
         """
         try:
-            self.cur.execute("SELECT COUNT(*) FROM prefectures;")
-            return self.cur.fetchone()[0]
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT COUNT(*) FROM prefectures;")
+                    return cur.fetchone()[0]
         except Error as e:
             print(f"Error getting record count: {e}")
             return 0
     
     def close(self) -> None:
-        """データベース接続を適切にクローズ"""
-        if self.cur:
-            self.cur.close()
-        if self.conn:
-            self.conn.close()
+        """プールへの参照を解放（共有プール自体は他のインスタンスが利用するため閉じない）"""
+        self.pool = None
     
     def __enter__(self):
         """コンテキストマネージャーのエントリー"""
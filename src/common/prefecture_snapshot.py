@@ -0,0 +1,170 @@
+import sys
+import math
+import heapq
+from array import array
+from decimal import Decimal
+from itertools import compress
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+
+# PostgreSQL の型 → array の型コード（文字列の列はインターンした str のリスト）
+ARRAY_TYPECODES: Dict[str, str] = {
+    'int2': 'h',
+    'int4': 'i',
+    'int8': 'q',
+    'numeric': 'd',
+    'float8': 'd',
+}
+
+Column = Union[array, List[str]]
+
+
+class PrefectureSnapshot:
+    """都道府県テーブルのメモリ上の列指向スナップショット（SRP準拠）
+    
+    数値列は型付きの array（int2 → 'h'、int4 → 'i'、numeric → 'd'）に、
+    文字列列はインターンした str のリストに保持する。地方ごとの行位置は読み込み時に索引化する。
+    上位N件・地方での絞り込み・集計をデータベースへの往復なしで計算する。
+    読み込み後は変更しない（更新は新しいスナップショットを作り直す）。
+    """
+    
+    def __init__(self, columns: Sequence[Tuple[str, str]], data: Dict[str, Column]):
+        """PrefectureSnapshotを初期化（通常は from_rows で生成）
+        
+        Args:
+            columns: (列名, PostgreSQLの型) のタプル列（PrefectureManager.PREFECTURE_COLUMNS）
+            data: 列名 → 列データ（すべて同じ長さ）
+        """
+        self.columns = tuple(columns)
+        self._data = data
+        self._length = len(data[self.columns[0][0]]) if self.columns else 0
+        
+        # 地方 → 行位置。絞り込みのたびに全行を走査しないよう先に作っておく
+        self._region_positions: Dict[str, array] = {}
+        for position, region in enumerate(data.get('region', ())):
+            self._region_positions.setdefault(region, array('h')).append(position)
+    
+    @classmethod
+    def from_rows(cls, columns: Sequence[Tuple[str, str]], rows: Iterable[Sequence[Any]]) -> 'PrefectureSnapshot':
+        """行タプル（columns の列順）から列指向のスナップショットを構築
+        
+        Args:
+            columns: (列名, PostgreSQLの型) のタプル列
+            rows: 行タプルのイテラブル
+        
+        Returns:
+            構築したスナップショット
+        """
+        data: Dict[str, Column] = {
+            name: array(ARRAY_TYPECODES[pg_type]) if pg_type in ARRAY_TYPECODES else []
+            for name, pg_type in columns
+        }
+        for row in rows:
+            for (name, pg_type), value in zip(columns, row):
+                column = data[name]
+                if isinstance(column, array):
+                    # NUMERIC は Decimal で返るため float に変換して格納する
+                    column.append(float(value) if isinstance(value, Decimal) else value)
+                else:
+                    # 同じ地方名・都市名などは1つの文字列オブジェクトを共有する
+                    column.append(sys.intern(value))
+        return cls(columns, data)
+    
+    def __len__(self) -> int:
+        """行数"""
+        return self._length
+    
+    def column(self, name: str) -> Column:
+        """列データを取得（読み取り専用として扱うこと）
+        
+        Raises:
+            KeyError: 存在しない列名の場合
+        """
+        return self._data[name]
+    
+    def regions(self) -> List[str]:
+        """地方名の一覧（初出順）"""
+        return list(self._region_positions)
+    
+    def positions(self, region: Optional[str] = None) -> Sequence[int]:
+        """行位置の一覧（region 指定時はその地方の行のみ）"""
+        if region is None:
+            return range(self._length)
+        return self._region_positions.get(region, array('h'))
+    
+    def filter_region(self, region: str) -> 'PrefectureSnapshot':
+        """指定した地方の行だけを持つスナップショットを作成"""
+        mask = [False] * self._length
+        for position in self.positions(region):
+            mask[position] = True
+        
+        data: Dict[str, Column] = {}
+        for name, column in self._data.items():
+            selected = compress(column, mask)
+            data[name] = array(column.typecode, selected) if isinstance(column, array) else list(selected)
+        return PrefectureSnapshot(self.columns, data)
+    
+    def top_n(self, column_name: str, limit: int = 3, region: Optional[str] = None) -> List[Tuple[str, Any]]:
+        """数値列の値が大きい順に上位 limit 件を取得
+        
+        Args:
+            column_name: 並べ替える数値列（'area'、'population' など）
+            limit: 取得する件数
+            region: 指定時はその地方の中で並べ替える
+        
+        Returns:
+            (都道府県名, 値) のタプルリスト（PrefectureManager.get_top_prefectures_by_* と同じ形）
+        """
+        values = self._data[column_name]
+        names = self._data['name']
+        top = heapq.nlargest(limit, self.positions(region), key=values.__getitem__)
+        return [(names[position], values[position]) for position in top]
+    
+    def aggregate(self, region: Optional[str] = None) -> Dict[str, float]:
+        """人口・面積の集計（region 指定時はその地方のみ）
+        
+        人口密度は各都道府県の密度の平均ではなく、人口合計 / 面積合計 で再計算する。
+        面積は丸め誤差が積み重ならないよう math.fsum で合計する。
+        
+        Returns:
+            count/population_sum/population_mean/area_sum/population_density を含む辞書
+        """
+        positions = self.positions(region)
+        population = self._data['population']
+        area = self._data['area']
+        
+        count = len(positions)
+        if region is None:
+            # 全行の場合は array をそのまま合計する（位置経由の参照を省く）
+            population_sum = sum(population)
+            area_sum = math.fsum(area)
+        else:
+            population_sum = sum(map(population.__getitem__, positions))
+            area_sum = math.fsum(map(area.__getitem__, positions))
+        
+        return {
+            'count': count,
+            'population_sum': population_sum,
+            'population_mean': population_sum / count if count else 0.0,
+            'area_sum': area_sum,
+            'population_density': population_sum / area_sum if area_sum else 0.0,
+        }
+    
+    def aggregate_by_region(self) -> Dict[str, Dict[str, float]]:
+        """地方ごとの aggregate() の結果（地方の初出順）"""
+        return {region: self.aggregate(region) for region in self._region_positions}
+    
+    def nbytes(self) -> int:
+        """列データの推定バイト数（インターン済み文字列は1回だけ数える）"""
+        total = 0
+        seen_strings = set()
+        for column in self._data.values():
+            if isinstance(column, array):
+                total += column.itemsize * len(column)
+            else:
+                total += sys.getsizeof(column)
+                for value in column:
+                    if id(value) not in seen_strings:
+                        seen_strings.add(id(value))
+                        total += sys.getsizeof(value)
+        return total
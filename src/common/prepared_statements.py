@@ -0,0 +1,204 @@
+import re
+import json
+import threading
+import time
+from typing import Any, Dict, Sequence, Set, Tuple
+from weakref import WeakKeyDictionary
+
+from psycopg2 import errors
+from psycopg2.extensions import connection
+
+from .database_config import DatabaseConfig
+
+
+class StatementRegistry:
+    """頻繁に実行する固定クエリのサーバーサイド・プリペアドステートメント管理（SRP準拠）
+    
+    登録したクエリを接続ごとに1回だけ PREPARE し、以降は EXECUTE で実行する。
+    サーバーは構文解析を省略でき、同じ文を繰り返すと汎用プランをキャッシュして計画も省略する。
+    - PREPARE 済みの文は接続（セッション）ごとに記録する（破棄された接続の記録は自動で消える）
+    - 文ごとの呼び出し回数・実行時間・PREPARE 時間を計測する
+    - explain() でサーバー側の計画時間と実行時間を取得できる
+    トランザクションプーリングの接続プーラー（pgbouncer など）経由では PREPARE が使えないため、
+    無効化（DB_PREPARED_STATEMENTS=false）すると同じクエリを通常の実行で処理する。
+    """
+    
+    _shared_registries: Dict[Tuple, 'StatementRegistry'] = {}
+    _shared_lock = threading.Lock()
+    
+    # psycopg2 形式のプレースホルダー（%s）とエスケープされた %（%%）
+    _PLACEHOLDER = re.compile(r'%%|%s')
+    
+    def __init__(self, enabled: bool = True):
+        """StatementRegistryを初期化
+        
+        Args:
+            enabled: False の場合は PREPARE せず、登録したクエリをそのまま実行する
+        """
+        self.enabled = enabled
+        # 文の名前 -> (psycopg2 形式のクエリ, PREPARE 文)
+        self._statements: Dict[str, Tuple[str, str]] = {}
+        self._prepared: 'WeakKeyDictionary[connection, Set[str]]' = WeakKeyDictionary()
+        self._timings: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def shared(cls, db_config: DatabaseConfig) -> 'StatementRegistry':
+        """接続先ごとに共有されるレジストリを取得（未作成なら生成）"""
+        key = tuple(sorted(db_config.to_connection_params().items()))
+        with cls._shared_lock:
+            registry = cls._shared_registries.get(key)
+            if registry is None:
+                registry = cls(enabled=db_config.prepared_statements)
+                cls._shared_registries[key] = registry
+            return registry
+    
+    @classmethod
+    def to_server_placeholders(cls, query: str) -> Tuple[str, int]:
+        """psycopg2 形式（%s）のクエリを PREPARE 用の $1, $2, ... 形式に変換
+        
+        Returns:
+            (変換後のクエリ, パラメータ数)
+        """
+        count = 0
+        
+        def replace(match: 're.Match') -> str:
+            nonlocal count
+            if match.group(0) == '%%':
+                return '%'
+            count += 1
+            return f'${count}'
+        
+        return cls._PLACEHOLDER.sub(replace, query), count
+    
+    def register(self, name: str, query: str, param_types: Sequence[str] = ()) -> str:
+        """クエリを名前付きで登録（同じ内容の再登録は何もしない）
+        
+        Args:
+            name: 文の名前（SQL識別子として使える英数字と _）
+            query: psycopg2 形式（%s）のプレースホルダーを持つクエリ
+            param_types: パラメータの型（'integer'、'integer[]' など。省略時はサーバーが推論）
+        
+        Returns:
+            登録した文の名前
+        
+        Raises:
+            ValueError: 名前が不正な場合、同じ名前で別の内容が登録済みの場合
+        """
+        if not re.fullmatch(r'[a-z_][a-z0-9_]*', name):
+            raise ValueError(f"Invalid statement name: {name}")
+        
+        server_query, param_count = self.to_server_placeholders(query.strip().rstrip(';'))
+        if param_types and len(param_types) != param_count:
+            raise ValueError(f"Statement {name} has {param_count} parameters but {len(param_types)} types")
+        types = f" ({', '.join(param_types)})" if param_types else ''
+        statement = (query, f"PREPARE {name}{types} AS {server_query}")
+        
+        with self._lock:
+            registered = self._statements.get(name)
+            if registered is not None and registered != statement:
+                raise ValueError(f"Statement {name} is already registered with a different query")
+            self._statements[name] = statement
+            self._timings.setdefault(name, {'calls': 0, 'total_ms': 0.0, 'prepares': 0, 'prepare_ms': 0.0})
+        return name
+    
+    def _record(self, name: str, count_key: str, time_key: str, elapsed: float) -> None:
+        """計測値（回数と所要時間）を加算"""
+        with self._lock:
+            timing = self._timings[name]
+            timing[count_key] += 1
+            timing[time_key] += elapsed * 1000
+    
+    def _ensure_prepared(self, cur, name: str) -> None:
+        """カーソルの接続で文が未 PREPARE なら PREPARE する"""
+        conn = cur.connection
+        with self._lock:
+            prepared = self._prepared.setdefault(conn, set())
+            if name in prepared:
+                return
+            _, prepare_query = self._statements[name]
+        
+        started = time.perf_counter()
+        cur.execute(prepare_query)
+        self._record(name, 'prepares', 'prepare_ms', time.perf_counter() - started)
+        with self._lock:
+            prepared.add(name)
+    
+    def _forget(self, conn: connection) -> None:
+        """接続で PREPARE 済みの記録を消す（DISCARD ALL などでサーバー側から消えた場合）"""
+        with self._lock:
+            self._prepared.pop(conn, None)
+    
+    def execute(self, cur, name: str, params: Sequence[Any] = ()) -> None:
+        """登録した文を実行（結果はカーソルから fetch する）
+        
+        計測する実行時間に初回の PREPARE は含めない（prepare_ms に別途計上する）。
+        
+        Args:
+            cur: 借用中の接続のカーソル
+            name: register で登録した文の名前
+            params: パラメータ
+        
+        Raises:
+            KeyError: 未登録の名前の場合
+            psycopg2.Error: 実行に失敗した場合
+        """
+        query, _ = self._statements[name]
+        if not self.enabled:
+            started = time.perf_counter()
+            cur.execute(query, params)
+        else:
+            self._ensure_prepared(cur, name)
+            placeholders = ', '.join(['%s'] * len(params))
+            started = time.perf_counter()
+            try:
+                cur.execute(f"EXECUTE {name} ({placeholders});" if params else f"EXECUTE {name};", params)
+            except errors.InvalidSqlStatementName:
+                # サーバー側で文が消えていた場合、次回の実行で PREPARE し直す
+                self._forget(cur.connection)
+                raise
+        self._record(name, 'calls', 'total_ms', time.perf_counter() - started)
+    
+    def explain(self, cur, name: str, params: Sequence[Any] = ()) -> Dict[str, Any]:
+        """EXPLAIN ANALYZE で文を実際に実行し、サーバー側の計画時間と実行時間を取得
+        
+        更新系の文も実際に実行されるため、呼び出し側でロールバックすること。
+        
+        Returns:
+            planning_ms/execution_ms/plan を含む辞書
+        """
+        query, _ = self._statements[name]
+        if self.enabled:
+            self._ensure_prepared(cur, name)
+            placeholders = ', '.join(['%s'] * len(params))
+            target = f"EXECUTE {name} ({placeholders})" if params else f"EXECUTE {name}"
+        else:
+            target = query.strip().rstrip(';')
+        
+        cur.execute(f"EXPLAIN (ANALYZE, FORMAT JSON) {target};", params)
+        result = cur.fetchone()[0]
+        # psycopg2 は json 列を自動で変換するが、text で返る場合にも対応する
+        explained = (json.loads(result) if isinstance(result, str) else result)[0]
+        return {
+            'planning_ms': explained.get('Planning Time'),
+            'execution_ms': explained.get('Execution Time'),
+            'plan': explained['Plan'],
+        }
+    
+    def server_plan_counts(self, cur) -> Dict[str, Dict[str, int]]:
+        """カーソルの接続で PREPARE 済みの文ごとの汎用プラン・カスタムプランの使用回数（PostgreSQL 14以降）"""
+        cur.execute("SELECT name, generic_plans, custom_plans FROM pg_prepared_statements;")
+        return {name: {'generic_plans': generic, 'custom_plans': custom}
+                for name, generic, custom in cur.fetchall()}
+    
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """文ごとの計測値を取得
+        
+        Returns:
+            文の名前 → calls/total_ms/mean_ms/prepares/prepare_ms の辞書
+        """
+        with self._lock:
+            return {
+                name: dict(timing, mean_ms=timing['total_ms'] / timing['calls'] if timing['calls'] else 0.0)
+                for name, timing in self._timings.items()
+            }
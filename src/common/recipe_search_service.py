@@ -1,14 +1,53 @@
-import psycopg2
 from psycopg2 import Error
-from psycopg2.extensions import connection
-from typing import Optional, List, Tuple, Dict
+from typing import Optional, List, Tuple, Dict, Iterable, Callable, Iterator
 
 from .database_config import DatabaseConfig
+from .cache_invalidation import CacheInvalidationListener
+from .connection_pool import ConnectionPool
+from .edo_recipe_manager import EdoRecipeManager
+from .ngram_tokenizer import NgramTokenizer
+from .page_token import PageToken
+from .prepared_statements import StatementRegistry
+from .result_cache import ResultCache
 
 
 class RecipeSearchService:
     """江戸料理レシピ検索機能を担当するクラス（SRP準拠）"""
     
+    # レシピ詳細を1ステートメントで取得するクエリ。
+    # 材料・手順は相関サブクエリの ARRAY(...) で集約し、レシピ1件につき1行で返す
+    # （材料・手順が無い場合は空配列。各サブクエリは recipe_id インデックスで処理される）
+    RECIPE_DETAILS_QUERY = """
+    SELECT r.id, r.name, r.url, r.description, r.tips, r.original_text, r.modern_translation,
+           ARRAY(SELECT ingredient FROM recipe_ingredients
+                 WHERE recipe_id = r.id ORDER BY sort_order) AS ingredients,
+           ARRAY(SELECT instruction FROM recipe_instructions
+                 WHERE recipe_id = r.id AND instruction_type = 'modern'
+                 ORDER BY step_number) AS modern_instructions,
+           ARRAY(SELECT instruction FROM recipe_instructions
+                 WHERE recipe_id = r.id AND instruction_type = 'translation'
+                 ORDER BY step_number) AS translation_instructions,
+           ARRAY(SELECT instruction FROM recipe_instructions
+                 WHERE recipe_id = r.id AND instruction_type = 'original'
+                 ORDER BY step_number) AS original_instructions
+    FROM edo_recipes r
+    WHERE r.id = ANY(%s);
+    """
+    # RECIPE_DETAILS_QUERY の列順に対応する辞書キー
+    RECIPE_DETAILS_KEYS = (
+        'id', 'name', 'url', 'description', 'tips', 'original_text', 'modern_translation',
+        'ingredients', 'modern_instructions', 'translation_instructions', 'original_instructions'
+    )
+    
+    # 部分一致用（pg_trgm）・N-gram用インデックスの存在確認クエリ（パラメータはインデックス名の配列）
+    TRIGRAM_CHECK_QUERY = """
+    SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'),
+           (SELECT COUNT(*) FROM pg_indexes WHERE indexname = ANY(%s));
+    """
+    NGRAM_CHECK_QUERY = "SELECT COUNT(*) FROM pg_indexes WHERE indexname = ANY(%s);"
+    TRIGRAM_INDEX_NAMES = [index_name for index_name, _, _ in EdoRecipeManager.TRIGRAM_INDEXES]
+    NGRAM_INDEX_NAMES = [index_name for index_name, _ in EdoRecipeManager.NGRAM_INDEXES]
+    
     def __init__(self, db_config: DatabaseConfig):
         """RecipeSearchServiceを初期化
         
@@ -16,176 +55,442 @@ class RecipeSearchService:
             db_config: データベース設定オブジェクト
         """
         self.db_config = db_config
-        self.conn: Optional[connection] = None
-        self.cur = None
+        self.pool: Optional[ConnectionPool] = None
+        self._trigram_available: Optional[bool] = None
+        self._ngram_available: Optional[bool] = None
+        # EdoRecipeManager の書き込み時に破棄される、接続先ごとの共有キャッシュ
+        self.cache = ResultCache.shared(EdoRecipeManager.SEARCH_CACHE_NAMESPACE, db_config)
+        # 詳細取得は検索のたびに実行されるため、接続ごとに1回だけ PREPARE して使い回す
+        self.statements = StatementRegistry.shared(db_config)
+        self.statements.register('recipe_details', self.RECIPE_DETAILS_QUERY, ('integer[]',))
         self._connect()
     
     def _connect(self) -> None:
-        """データベースに接続"""
+        """共有コネクションプールを取得（接続は操作ごとに借用）"""
+        self.pool = ConnectionPool.shared(self.db_config)
+    
+    def trigram_index_available(self, refresh: bool = False) -> bool:
+        """部分一致検索用の pg_trgm インデックスが利用可能か判定（結果はキャッシュ）
+        
+        Args:
+            refresh: True の場合、キャッシュを破棄して再判定
+        
+        Returns:
+            pg_trgm 拡張と全ての部分一致用インデックスが存在する場合True
+        """
+        if self._trigram_available is not None and not refresh:
+            return self._trigram_available
+        
         try:
-            self.conn = psycopg2.connect(**self.db_config.to_connection_params())
-            self.cur = self.conn.cursor()
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(self.TRIGRAM_CHECK_QUERY, (self.TRIGRAM_INDEX_NAMES,))
+                    has_extension, index_count = cur.fetchone()
         except Error as e:
-            print(f"Error connecting to PostgreSQL: {e}")
-            raise
+            print(f"Error checking trigram indexes: {e}")
+            return False
+        
+        self._trigram_available = bool(has_extension) and index_count == len(self.TRIGRAM_INDEX_NAMES)
+        if not self._trigram_available:
+            print("Notice: pg_trgmインデックスが見つかりません。部分一致検索は全件走査になります")
+        return self._trigram_available
+    
+    def ngram_index_available(self, refresh: bool = False) -> bool:
+        """日本語N-gram検索用の列とインデックスが利用可能か判定（結果はキャッシュ）
+        
+        Args:
+            refresh: True の場合、キャッシュを破棄して再判定
+        
+        Returns:
+            全ての ngram_vector 用インデックスが存在する場合True
+        """
+        if self._ngram_available is not None and not refresh:
+            return self._ngram_available
+        
+        try:
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(self.NGRAM_CHECK_QUERY, (self.NGRAM_INDEX_NAMES,))
+                    index_count = cur.fetchone()[0]
+        except Error as e:
+            print(f"Error checking ngram indexes: {e}")
+            return False
+        
+        self._ngram_available = index_count == len(self.NGRAM_INDEX_NAMES)
+        if not self._ngram_available:
+            print("Notice: N-gramインデックスが見つかりません。日本語キーワードは部分一致検索で処理します")
+        return self._ngram_available
+    
+    def _ngram_enabled(self, *keywords: str) -> bool:
+        """日本語キーワードにN-gramインデックスを使えるか判定
+        
+        いずれかのキーワードがCJK文字を含み、インデックスが存在する場合True。
+        部分一致検索を使うキーワードがある場合は pg_trgm インデックスの有無も確認する（未作成時の通知のため）。
+        """
+        has_cjk = [NgramTokenizer.contains_cjk(keyword) for keyword in keywords]
+        enabled = any(has_cjk) and self.ngram_index_available()
+        if not enabled or not all(has_cjk):
+            self.trigram_index_available()
+        return enabled
+    
+    # クエリ組み立て（I/Oを伴わないため、非同期版 AsyncRecipeSearchService と共有する）
+    
+    @staticmethod
+    def _ngram_query(keyword: str, weights: str, ngram_available: bool) -> Optional[str]:
+        """日本語キーワードをN-gram検索用の tsquery リテラルに変換
+        
+        挿入時と同じ規則（NgramTokenizer）で分かち書きするため、1文字の「卵」も
+        インデックスで検索できる。CJK文字を含まない場合やインデックスが無い場合はNone。
+        """
+        if not ngram_available or not NgramTokenizer.contains_cjk(keyword):
+            return None
+        return NgramTokenizer.to_tsquery_literal(keyword, weights)
+    
+    @staticmethod
+    def _substring_pattern(keyword: str) -> str:
+        """部分一致用の ILIKE パターンを作成（利用者入力のワイルドカードはエスケープ）
+        
+        pg_trgm インデックスがある場合、'%kw%' の ILIKE はインデックスで処理される。
+        ただし3文字未満のキーワードからはトライグラムを抽出できないため、
+        インデックスは全件を候補とするフルスキャンになる。
+        """
+        escaped = keyword.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        return f"%{escaped}%"
+    
+    @staticmethod
+    def _ingredient_condition(keyword: str, ngram_available: bool) -> Tuple[str, Tuple]:
+        """材料キーワードの WHERE 条件とパラメータ（日本語はN-gram、それ以外は部分一致）"""
+        ngram_query = RecipeSearchService._ngram_query(keyword, '', ngram_available)
+        if ngram_query:
+            return "ri.ngram_vector @@ %s::tsquery", (ngram_query,)
+        return "ri.ingredient ILIKE %s", (RecipeSearchService._substring_pattern(keyword),)
+    
+    @staticmethod
+    def _recipe_name_condition(keyword: str, ngram_available: bool) -> Tuple[str, Tuple]:
+        """レシピ名・説明文キーワードの WHERE 条件とパラメータ（N-gramは重みA・Bのみ対象）"""
+        ngram_query = RecipeSearchService._ngram_query(keyword, 'AB', ngram_available)
+        if ngram_query:
+            return "r.ngram_vector @@ %s::tsquery", (ngram_query,)
+        pattern = RecipeSearchService._substring_pattern(keyword)
+        return "(r.name ILIKE %s OR r.description ILIKE %s)", (pattern, pattern)
+    
+    @staticmethod
+    def _name_keyset(after: Optional[List]) -> Tuple[str, Tuple]:
+        """(name, id) 順のキーセット条件（先頭ページは条件なし）"""
+        if after is None:
+            return '', ()
+        return "\n              AND (r.name, r.id) > (%s, %s)", tuple(after)
+    
+    @staticmethod
+    def paginate(kind: str, rows: List[Tuple], limit: int,
+                  key_of: Callable[[Tuple], Tuple]) -> Tuple[List[Tuple], Optional[str]]:
+        """limit+1 件取得した結果をページと継続トークンに分ける"""
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, PageToken.encode(kind, key_of(rows[-1]))
+    
+    @staticmethod
+    def build_ingredient_search(ingredient_keyword: str, limit: int, after: Optional[List],
+                                ngram_available: bool) -> Tuple[str, Tuple]:
+        """材料検索のクエリとパラメータを組み立て（(name, id) 順、after より後ろを limit 件）"""
+        condition, params = RecipeSearchService._ingredient_condition(ingredient_keyword, ngram_available)
+        keyset, keyset_params = RecipeSearchService._name_keyset(after)
+        query = f"""
+        SELECT DISTINCT r.id, r.name, array_agg(ri.ingredient ORDER BY ri.sort_order) as ingredients
+        FROM edo_recipes r
+        JOIN recipe_ingredients ri ON r.id = ri.recipe_id
+        WHERE {condition}{keyset}
+        GROUP BY r.id, r.name
+        ORDER BY r.name, r.id
+        LIMIT %s;
+        """
+        return query, params + keyset_params + (limit,)
+    
+    @staticmethod
+    def build_fulltext_search(search_keyword: str, limit: int, after: Optional[List],
+                              ngram_available: bool) -> Tuple[str, Tuple]:
+        """全文検索のクエリとパラメータを組み立て（(rank DESC, name, id) 順、after より後ろを limit 件）
+        
+        日本語を含むキーワードはN-gram列 ngram_vector、それ以外は search_vector で検索する。
+        """
+        ngram_query = RecipeSearchService._ngram_query(search_keyword, '', ngram_available)
+        if ngram_query:
+            vector_column, query_source, param = 'ngram_vector', '(SELECT %s::tsquery)', ngram_query
+        else:
+            vector_column, query_source, param = 'search_vector', "plainto_tsquery('simple', %s)", search_keyword
+        
+        # ts_rank は real 型のため、継続キーのランクも real で比較して同値判定を正確にする
+        keyset, keyset_params = '', ()
+        if after is not None:
+            rank, name, recipe_id = after
+            keyset = """
+        WHERE rank < %s::real
+           OR (rank = %s::real AND (name, id) > (%s, %s))"""
+            keyset_params = (rank, rank, name, recipe_id)
+        
+        # GINインデックス付きのtsvector列に対して検索・ランク付けする
+        query = f"""
+        SELECT id, name, description, rank
+        FROM (
+            SELECT r.id, r.name, r.description,
+                   ts_rank(r.{vector_column}, q.query) as rank
+            FROM edo_recipes r,
+                 {query_source} AS q(query)
+            WHERE r.{vector_column} @@ q.query
+        ) ranked{keyset}
+        ORDER BY rank DESC, name, id
+        LIMIT %s;
+        """
+        return query, (param,) + keyset_params + (limit,)
+    
+    @staticmethod
+    def build_combined_search(recipe_keyword: str, ingredient_keyword: str, limit: int,
+                              after: Optional[List], ngram_available: bool) -> Tuple[str, Tuple]:
+        """複合検索のクエリとパラメータを組み立て（(name, id) 順、after より後ろを limit 件）"""
+        recipe_condition, recipe_params = RecipeSearchService._recipe_name_condition(
+            recipe_keyword, ngram_available)
+        ingredient_condition, ingredient_params = RecipeSearchService._ingredient_condition(
+            ingredient_keyword, ngram_available)
+        keyset, keyset_params = RecipeSearchService._name_keyset(after)
+        query = f"""
+        SELECT DISTINCT r.id, r.name, r.description, 
+               array_agg(ri.ingredient ORDER BY ri.sort_order) as ingredients
+        FROM edo_recipes r
+        JOIN recipe_ingredients ri ON r.id = ri.recipe_id
+        WHERE {recipe_condition}
+          AND {ingredient_condition}{keyset}
+        GROUP BY r.id, r.name, r.description
+        ORDER BY r.name, r.id
+        LIMIT %s;
+        """
+        return query, recipe_params + ingredient_params + keyset_params + (limit,)
+    
+    @staticmethod
+    def normalize_keyword(keyword: str) -> str:
+        """キャッシュキー・検索に使うキーワードの正規化（前後空白の除去、連続空白の統一、小文字化）
+        
+        いずれの検索方式（ILIKE・tsquery）も大文字小文字を区別しないため、結果は変わらない。
+        """
+        return ' '.join(keyword.split()).lower()
+    
+    def _cached_first_page(self, key: Tuple,
+                           load_page: Callable[[], Optional[Tuple[List[Tuple], Optional[str]]]]
+                           ) -> Optional[List[Tuple]]:
+        """先頭ページの結果をキャッシュ経由で取得（失敗時の None はキャッシュしない）"""
+        def load() -> Optional[List[Tuple]]:
+            page = load_page()
+            return page[0] if page else None
+        
+        rows = self.cache.get_or_load(key, load)
+        # キャッシュ内のリストを呼び出し側の変更から守るため、外側のリストは複製して返す
+        return list(rows) if rows is not None else None
+    
+    def listen_for_invalidation(self, listener: CacheInvalidationListener) -> None:
+        """他プロセスでのレシピデータ変更（NOTIFY）を受けて検索結果キャッシュを破棄するよう登録
+        
+        Args:
+            listener: プロセスで共有する CacheInvalidationListener（start() は呼び出し側で行う）
+        """
+        listener.invalidate_on(EdoRecipeManager.NOTIFY_TABLES, self.cache)
+    
+    def cache_stats(self) -> Dict[str, int]:
+        """検索結果キャッシュの hits/misses/evictions などを取得"""
+        return self.cache.stats()
+    
+    def statement_stats(self) -> Dict[str, Dict[str, float]]:
+        """プリペアドステートメントごとの呼び出し回数・実行時間などを取得"""
+        return self.statements.stats()
+    
+    def _fetch_page(self, query: str, params: Tuple) -> List[Tuple]:
+        """組み立てたクエリを実行して全行を取得（エラーは呼び出し側で処理）"""
+        with self.pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, params)
+                return cur.fetchall()
     
     def search_by_ingredient(self, ingredient_keyword: str, limit: int = 10) -> Optional[List[Tuple]]:
-        """材料での検索
+        """材料での検索（結果は (メソッド, 正規化キーワード, limit) をキーにキャッシュ）
         
         Args:
             ingredient_keyword: 材料キーワード
             limit: 取得件数
-            
+        
         Returns:
             (レシピID, レシピ名, 材料) のタプルリスト、失敗時はNone
         """
+        keyword = self.normalize_keyword(ingredient_keyword)
+        return self._cached_first_page(('search_by_ingredient', keyword, limit),
+                                       lambda: self.search_by_ingredient_page(keyword, limit))
+    
+    def search_by_ingredient_page(self, ingredient_keyword: str, limit: int = 10,
+                                  page_token: Optional[str] = None) -> Optional[Tuple[List[Tuple], Optional[str]]]:
+        """材料での検索（(name, id) によるキーセットページネーション）
+        
+        Args:
+            ingredient_keyword: 材料キーワード
+            limit: 1ページの件数
+            page_token: 前ページの継続トークン（先頭ページはNone）
+        
+        Returns:
+            (タプルリスト, 次ページの継続トークン) のタプル、失敗時はNone
+            （最終ページではトークンがNone）
+        
+        Raises:
+            ValueError: page_token が不正な場合
+        """
+        after = PageToken.decode('ingredient', page_token, 2) if page_token else None
         try:
-            query = """
-            SELECT DISTINCT r.id, r.name, array_agg(ri.ingredient ORDER BY ri.sort_order) as ingredients
-            FROM edo_recipes r
-            JOIN recipe_ingredients ri ON r.id = ri.recipe_id
-            WHERE ri.ingredient ILIKE %s
-            GROUP BY r.id, r.name
-            ORDER BY r.name
-            LIMIT %s;
-            """
-            
-            search_pattern = f"%{ingredient_keyword}%"
-            self.cur.execute(query, (search_pattern, limit))
-            return self.cur.fetchall()
-            
+            rows = self._fetch_page(*self.build_ingredient_search(
+                ingredient_keyword, limit + 1, after, self._ngram_enabled(ingredient_keyword)))
         except Error as e:
             print(f"Error searching by ingredient: {e}")
             return None
+        
+        return self.paginate('ingredient', rows, limit, lambda row: (row[1], row[0]))
     
     def search_by_fulltext(self, search_keyword: str, limit: int = 10) -> Optional[List[Tuple]]:
-        """全文検索（レシピ名・説明文）
+        """全文検索（レシピ名・説明文・コツ・現代語訳、重み付き）
+        
+        日本語を含むキーワードはN-gram列 ngram_vector、それ以外は search_vector で検索する。
+        結果は (メソッド, 正規化キーワード, limit) をキーにキャッシュする。
         
         Args:
             search_keyword: 検索キーワード
             limit: 取得件数
-            
+        
         Returns:
             (レシピID, レシピ名, 説明文, ランク) のタプルリスト、失敗時はNone
         """
+        keyword = self.normalize_keyword(search_keyword)
+        return self._cached_first_page(('search_by_fulltext', keyword, limit),
+                                       lambda: self.search_by_fulltext_page(keyword, limit))
+    
+    def search_by_fulltext_page(self, search_keyword: str, limit: int = 10,
+                                page_token: Optional[str] = None) -> Optional[Tuple[List[Tuple], Optional[str]]]:
+        """全文検索（(rank, name, id) によるキーセットページネーション）
+        
+        OFFSET と異なり前ページまでの行を読み飛ばさず、ランク順で続きから返す。
+        
+        Args:
+            search_keyword: 検索キーワード
+            limit: 1ページの件数
+            page_token: 前ページの継続トークン（先頭ページはNone）
+        
+        Returns:
+            (タプルリスト, 次ページの継続トークン) のタプル、失敗時はNone
+        
+        Raises:
+            ValueError: page_token が不正な場合
+        """
+        after = PageToken.decode('fulltext', page_token, 3) if page_token else None
+        ngram_available = NgramTokenizer.contains_cjk(search_keyword) and self.ngram_index_available()
         try:
-            query = """
-            SELECT r.id, r.name, r.description,
-                   ts_rank(
-                       to_tsvector('simple', r.name || ' ' || COALESCE(r.description, '')),
-                       plainto_tsquery('simple', %s)
-                   ) as rank
-            FROM edo_recipes r
-            WHERE to_tsvector('simple', r.name || ' ' || COALESCE(r.description, '')) 
-                  @@ plainto_tsquery('simple', %s)
-            ORDER BY rank DESC, r.name
-            LIMIT %s;
-            """
-            
-            self.cur.execute(query, (search_keyword, search_keyword, limit))
-            return self.cur.fetchall()
-            
+            rows = self._fetch_page(*self.build_fulltext_search(
+                search_keyword, limit + 1, after, ngram_available))
         except Error as e:
             print(f"Error in fulltext search: {e}")
             return None
+        
+        return self.paginate('fulltext', rows, limit, lambda row: (row[3], row[1], row[0]))
     
     def search_combined(self, recipe_keyword: str, ingredient_keyword: str, limit: int = 10) -> Optional[List[Tuple]]:
-        """複合検索（レシピ名 + 材料）
+        """複合検索（レシピ名 + 材料、結果はキャッシュ）
         
         Args:
             recipe_keyword: レシピ名キーワード
             ingredient_keyword: 材料キーワード
             limit: 取得件数
-            
+        
         Returns:
             (レシピID, レシピ名, 説明文, 材料リスト) のタプルリスト、失敗時はNone
         """
+        recipe_kw = self.normalize_keyword(recipe_keyword)
+        ingredient_kw = self.normalize_keyword(ingredient_keyword)
+        return self._cached_first_page(('search_combined', (recipe_kw, ingredient_kw), limit),
+                                       lambda: self.search_combined_page(recipe_kw, ingredient_kw, limit))
+    
+    def search_combined_page(self, recipe_keyword: str, ingredient_keyword: str, limit: int = 10,
+                             page_token: Optional[str] = None) -> Optional[Tuple[List[Tuple], Optional[str]]]:
+        """複合検索（(name, id) によるキーセットページネーション）
+        
+        Args:
+            recipe_keyword: レシピ名キーワード
+            ingredient_keyword: 材料キーワード
+            limit: 1ページの件数
+            page_token: 前ページの継続トークン（先頭ページはNone）
+        
+        Returns:
+            (タプルリスト, 次ページの継続トークン) のタプル、失敗時はNone
+        
+        Raises:
+            ValueError: page_token が不正な場合
+        """
+        after = PageToken.decode('combined', page_token, 2) if page_token else None
         try:
-            query = """
-            SELECT DISTINCT r.id, r.name, r.description, 
-                   array_agg(ri.ingredient ORDER BY ri.sort_order) as ingredients
-            FROM edo_recipes r
-            JOIN recipe_ingredients ri ON r.id = ri.recipe_id
-            WHERE (r.name ILIKE %s OR r.description ILIKE %s)
-              AND ri.ingredient ILIKE %s
-            GROUP BY r.id, r.name, r.description
-            ORDER BY r.name
-            LIMIT %s;
-            """
-            
-            recipe_pattern = f"%{recipe_keyword}%"
-            ingredient_pattern = f"%{ingredient_keyword}%"
-            
-            self.cur.execute(query, (recipe_pattern, recipe_pattern, ingredient_pattern, limit))
-            return self.cur.fetchall()
-            
+            rows = self._fetch_page(*self.build_combined_search(
+                recipe_keyword, ingredient_keyword, limit + 1, after,
+                self._ngram_enabled(recipe_keyword, ingredient_keyword)))
         except Error as e:
             print(f"Error in combined search: {e}")
             return None
+        
+        return self.paginate('combined', rows, limit, lambda row: (row[1], row[0]))
+    
+    def _fetch_recipe_details(self, recipe_ids: List[int]) -> Dict[int, Dict]:
+        """指定IDのレシピ詳細を1往復で取得（エラーは呼び出し側で処理）
+        
+        Returns:
+            レシピID → レシピ詳細情報の辞書（存在しないIDは含まない）
+        """
+        with self.pool.connection() as conn:
+            with conn.cursor() as cur:
+                self.statements.execute(cur, 'recipe_details', (recipe_ids,))
+                return {row[0]: dict(zip(self.RECIPE_DETAILS_KEYS, row)) for row in cur.fetchall()}
     
     def get_recipe_details(self, recipe_id: int) -> Optional[Dict]:
-        """レシピ詳細情報を取得
+        """レシピ詳細情報を取得（基本情報・材料・手順を1クエリで取得）
         
         Args:
             recipe_id: レシピID
-            
+        
         Returns:
             レシピ詳細情報の辞書、失敗時はNone
         """
         try:
-            # 基本情報取得
-            self.cur.execute("""
-                SELECT id, name, url, description, tips, original_text, modern_translation
-                FROM edo_recipes WHERE id = %s;
-            """, (recipe_id,))
-            
-            recipe_row = self.cur.fetchone()
-            if not recipe_row:
-                return None
-            
-            recipe_details = {
-                'id': recipe_row[0],
-                'name': recipe_row[1],
-                'url': recipe_row[2],
-                'description': recipe_row[3],
-                'tips': recipe_row[4],
-                'original_text': recipe_row[5],
-                'modern_translation': recipe_row[6]
-            }
-            
-            # 材料取得
-            self.cur.execute("""
-                SELECT ingredient FROM recipe_ingredients 
-                WHERE recipe_id = %s ORDER BY sort_order;
-            """, (recipe_id,))
-            
-            ingredients = [row[0] for row in self.cur.fetchall()]
-            recipe_details['ingredients'] = ingredients
-            
-            # 手順取得
-            instruction_types = ['modern', 'translation', 'original']
-            for inst_type in instruction_types:
-                self.cur.execute("""
-                    SELECT instruction FROM recipe_instructions 
-                    WHERE recipe_id = %s AND instruction_type = %s 
-                    ORDER BY step_number;
-                """, (recipe_id, inst_type))
-                
-                instructions = [row[0] for row in self.cur.fetchall()]
-                recipe_details[f'{inst_type}_instructions'] = instructions
-            
-            return recipe_details
-            
+            return self._fetch_recipe_details([recipe_id]).get(recipe_id)
+        
         except Error as e:
             print(f"Error getting recipe details: {e}")
             return None
     
+    def get_recipes_details(self, recipe_ids: Iterable[int]) -> Optional[List[Dict]]:
+        """複数レシピの詳細情報を1ステートメントで一括取得（一覧表示用）
+        
+        Args:
+            recipe_ids: レシピIDのイテラブル
+        
+        Returns:
+            レシピ詳細情報の辞書リスト（指定順、重複と存在しないIDは除く）、失敗時はNone
+        """
+        ids = list(dict.fromkeys(recipe_ids))
+        if not ids:
+            return []
+        
+        try:
+            details_by_id = self._fetch_recipe_details(ids)
+            return [details_by_id[recipe_id] for recipe_id in ids if recipe_id in details_by_id]
+        
+        except Error as e:
+            print(f"Error getting recipes details: {e}")
+            return None
+    
     def get_random_recipes(self, count: int = 5) -> Optional[List[Tuple]]:
         """ランダムなレシピを取得
         
         Args:
             count: 取得件数
-            
+        
         Returns:
             (レシピID, レシピ名) のタプルリスト、失敗時はNone
         """
@@ -196,9 +501,11 @@ class RecipeSearchService:
             LIMIT %s;
             """
             
-            self.cur.execute(query, (count,))
-            return self.cur.fetchall()
-            
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(query, (count,))
+                    return cur.fetchall()
+        
         except Error as e:
             print(f"Error getting random recipes: {e}")
             return None
@@ -215,19 +522,47 @@ class RecipeSearchService:
             ORDER BY ingredient;
             """
             
-            self.cur.execute(query)
-            return [row[0] for row in self.cur.fetchall()]
-            
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(query)
+                    return [row[0] for row in cur.fetchall()]
+        
         except Error as e:
             print(f"Error getting all ingredients: {e}")
             return None
     
+    def iter_all_ingredients(self, itersize: Optional[int] = None) -> Iterator[str]:
+        """すべての材料をサーバーサイドカーソルでストリーミング取得
+        
+        get_all_ingredients と同じ結果を、全件をリスト化せずに itersize 件ずつ返す。
+        反復の終了時（途中で打ち切った場合も含む）にカーソルを閉じて接続を返却する。
+        
+        Args:
+            itersize: 1回のネットワーク往復で取得する行数（Noneの場合は DatabaseConfig.stream_itersize）
+        
+        Yields:
+            材料名（昇順・重複なし）
+        
+        Raises:
+            psycopg2.Error: 取得中にエラーが発生した場合（それまでの材料は返却済み）
+        """
+        try:
+            with self.pool.connection() as conn:
+                with conn.cursor(name='ingredients_stream') as cur:
+                    cur.itersize = itersize or self.db_config.stream_itersize
+                    cur.execute("""
+                        SELECT DISTINCT ingredient FROM recipe_ingredients 
+                        ORDER BY ingredient;
+                    """)
+                    for row in cur:
+                        yield row[0]
+        except Error as e:
+            print(f"Error streaming ingredients: {e}")
+            raise
+    
     def close(self) -> None:
-        """データベース接続を適切にクローズ"""
-        if self.cur:
-            self.cur.close()
-        if self.conn:
-            self.conn.close()
+        """プールへの参照を解放（共有プール自体は他のインスタンスが利用するため閉じない）"""
+        self.pool = None
     
     def __enter__(self):
         """コンテキストマネージャーのエントリー"""
@@ -0,0 +1,230 @@
+import queue
+import threading
+import time
+from typing import Optional, List, Dict, Iterable
+
+from .edo_recipe_manager import EdoRecipeManager
+from .json_recipe_loader import JsonRecipeLoader
+
+
+class RecipeSyncPipeline:
+    """取得したレシピを1件ずつデータベースへ差分反映するパイプライン（SRP準拠）
+    
+    submit() で受け取った元のレシピを extract_recipe_data で変換・バリデーションし、
+    上限付きキューを経由して書き込みスレッドに渡す。書き込みスレッドは batch_size 件、
+    または最初の1件から flush_interval 秒経過した時点で EdoRecipeManager.upsert_recipes を呼ぶ。
+    - キューが一杯の間 submit() は待機する（書き込みが追いつくまで取得側を減速させる）
+    - 内容のハッシュが保存済みのものと同じレシピは書き込まない
+    - 書き込みに失敗したバッチはロールバックされ、failed に計上して処理を続ける
+      （データベース以外の例外でも同様。書き込みスレッドが停止した場合、submit() と close() は待ち続けずに例外を送出する）
+    - submit_all() は変換・バリデーションを複数プロセスで並列に行う（大量のレシピの一括投入向け）
+    """
+    
+    # 書き込みスレッドへの終了通知
+    _STOP = object()
+    
+    # キューが一杯の間、書き込みスレッドが動いているか確認する間隔（秒）
+    _PUT_POLL_INTERVAL = 1.0
+    
+    def __init__(self, manager: EdoRecipeManager, queue_size: int = 100,
+                 batch_size: int = 50, flush_interval: float = 1.0):
+        """RecipeSyncPipelineを初期化
+        
+        Args:
+            manager: 書き込み先の EdoRecipeManager（テーブルは作成済みであること）
+            queue_size: 書き込み待ちのレシピ数の上限
+            batch_size: 1トランザクションで書き込むレシピ数
+            flush_interval: バッチが埋まらない場合に書き込むまでの最大待ち時間（秒）
+        """
+        if queue_size < 1 or batch_size < 1 or flush_interval <= 0:
+            raise ValueError(f"Invalid pipeline settings: queue_size={queue_size}, "
+                             f"batch_size={batch_size}, flush_interval={flush_interval}")
+        
+        self.manager = manager
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: 'queue.Queue' = queue.Queue(maxsize=queue_size)
+        self._writer: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stats = {
+            'submitted': 0, 'invalid': 0, 'queue_full_waits': 0,
+            'inserted': 0, 'updated': 0, 'unchanged': 0, 'failed': 0, 'batches': 0,
+        }
+    
+    def start(self) -> 'RecipeSyncPipeline':
+        """書き込みスレッドを開始"""
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._run, name='recipe-sync-writer', daemon=True)
+            self._writer.start()
+        return self
+    
+    def submit(self, recipe: Dict) -> bool:
+        """元のレシピを変換・バリデーションして書き込み待ちに追加（キューが一杯なら空くまで待機）
+        
+        Args:
+            recipe: スクレイピング結果・JSONファイルの元のレシピ辞書
+        
+        Returns:
+            追加した場合True、バリデーションに失敗した場合False
+        """
+        self._check_writer()
+        
+        recipe_data = JsonRecipeLoader.extract_recipe_data(recipe)
+        if not JsonRecipeLoader.validate_recipe_data(recipe_data):
+            self._reject(recipe)
+            return False
+        
+        self._enqueue(recipe_data)
+        return True
+    
+    def submit_all(self, recipes: Iterable[Dict], workers: Optional[int] = 1, chunk_size: int = 256) -> int:
+        """元のレシピをまとめて変換・バリデーションして書き込み待ちに追加
+        
+        Args:
+            recipes: 元のレシピ辞書のイテラブル（逐次読み込みのジェネレーターも可）
+            workers: 変換・バリデーションのプロセス数（None でCPUコア数、1 で呼び出し元のスレッドで処理）
+            chunk_size: 1回にプロセスへ渡すレシピ数
+        
+        Returns:
+            追加したレシピ数
+        """
+        self._check_writer()
+        
+        added = 0
+        for recipe_data in JsonRecipeLoader.iter_recipe_data_parallel(
+                recipes, workers=workers, chunk_size=chunk_size, on_invalid=self._reject):
+            self._enqueue(recipe_data)
+            added += 1
+        return added
+    
+    def _check_writer(self) -> None:
+        """書き込みスレッドが動いていることを確認（未開始・停止済みなら RuntimeError）"""
+        if self._writer is None:
+            raise RuntimeError("RecipeSyncPipeline is not started")
+        if not self._writer.is_alive():
+            raise RuntimeError("RecipeSyncPipeline writer thread has stopped")
+    
+    def _reject(self, recipe: Dict) -> None:
+        """バリデーションに失敗したレシピを計上"""
+        with self._lock:
+            self._stats['invalid'] += 1
+    
+    def _enqueue(self, recipe_data: Dict) -> None:
+        """変換済みのレシピを書き込み待ちに追加（キューが一杯なら空くまで待機）"""
+        try:
+            self._queue.put_nowait(recipe_data)
+        except queue.Full:
+            with self._lock:
+                self._stats['queue_full_waits'] += 1
+            self._put(recipe_data, self._writer)
+        
+        with self._lock:
+            self._stats['submitted'] += 1
+    
+    def _put(self, item: object, writer: threading.Thread) -> None:
+        """キューに追加（一杯なら空くまで待機）
+        
+        Raises:
+            RuntimeError: 待機中に書き込みスレッドが停止していた場合（キューが空かなくなるため）
+        """
+        while True:
+            try:
+                self._queue.put(item, timeout=self._PUT_POLL_INTERVAL)
+                return
+            except queue.Full:
+                if not writer.is_alive():
+                    raise RuntimeError("RecipeSyncPipeline writer thread has stopped")
+    
+    def _run(self) -> None:
+        """書き込みスレッド（予期しない例外で停止した場合も内容を表示する）"""
+        try:
+            self._write_batches()
+        except Exception as e:
+            print(f"Recipe sync writer stopped unexpectedly: {e}")
+            raise
+    
+    def _write_batches(self) -> None:
+        """キューからバッチを組み立てて upsert する"""
+        batch: List[Dict] = []
+        deadline = 0.0
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if batch else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._flush(batch)
+                batch = []
+                continue
+            
+            if item is self._STOP:
+                self._flush(batch)
+                return
+            
+            if not batch:
+                deadline = time.monotonic() + self.flush_interval
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                self._flush(batch)
+                batch = []
+    
+    def _flush(self, batch: List[Dict]) -> None:
+        """1バッチを書き込み、結果を集計"""
+        if not batch:
+            return
+        
+        try:
+            result = self.manager.upsert_recipes(batch, batch_size=len(batch))
+        except Exception as e:
+            # upsert_recipes が処理しない例外（ハッシュ計算の失敗、close() 後の呼び出しなど）
+            print(f"Error writing recipe batch: {e}")
+            result = None
+        with self._lock:
+            self._stats['batches'] += 1
+            if result is None:
+                self._stats['failed'] += len(batch)
+                return
+            for key in ('inserted', 'updated', 'unchanged'):
+                self._stats[key] += result[key]
+    
+    def stats(self) -> Dict[str, int]:
+        """submitted/invalid/queue_full_waits/inserted/updated/unchanged/failed/batches を取得"""
+        with self._lock:
+            return dict(self._stats, pending=self._queue.qsize())
+    
+    def close(self) -> Dict[str, int]:
+        """書き込み待ちのレシピをすべて書き込んでから書き込みスレッドを終了
+        
+        Returns:
+            最終的な集計（stats() と同じ形式）
+        """
+        writer = self._writer
+        if writer is not None:
+            self._writer = None
+            try:
+                self._put(self._STOP, writer)
+            except RuntimeError:
+                pass
+            writer.join()
+            
+            # 書き込みスレッドが途中で停止していた場合、残ったレシピは書き込まれていない
+            lost = 0
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not self._STOP:
+                    lost += 1
+            if lost:
+                print(f"Recipe sync writer had stopped; {lost} pending recipes were not written")
+                with self._lock:
+                    self._stats['failed'] += lost
+        return self.stats()
+    
+    def __enter__(self):
+        """コンテキストマネージャーのエントリー（書き込みスレッドを開始）"""
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """コンテキストマネージャーのイグジット"""
+        self.close()
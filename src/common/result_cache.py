@@ -0,0 +1,168 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .database_config import DatabaseConfig
+
+
+_MISSING = object()
+
+
+class ResultCache:
+    """検索結果のプロセス内キャッシュ（TTL + LRU、SRP準拠）
+    
+    - 各エントリは ttl 秒で失効する
+    - エントリ数が max_entries、または推定バイト数が max_bytes を超えると、最も古く使われたものから破棄する
+    - hits/misses/evictions/expirations/invalidations を計数する
+    - invalidate() で全エントリを破棄する。実行中だった読み込みの結果は破棄後に格納されない
+    スレッドセーフで、同じ接続先・名前空間のインスタンスは shared() で共有する。
+    """
+    
+    _shared_caches: Dict[Tuple, 'ResultCache'] = {}
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 16 * 1024 * 1024, ttl: float = 300.0):
+        """ResultCacheを初期化
+        
+        Args:
+            max_entries: 保持する最大エントリ数（0 の場合はキャッシュしない）
+            max_bytes: 保持する結果の推定バイト数の上限（0 の場合は無制限）
+            ttl: エントリの有効期間（秒、0 の場合は無期限）
+        """
+        if max_entries < 0 or max_bytes < 0 or ttl < 0:
+            raise ValueError(f"Invalid cache limits: max_entries={max_entries}, max_bytes={max_bytes}, ttl={ttl}")
+        
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        
+        # key -> (value, 推定バイト数, 失効時刻)
+        self._entries: 'OrderedDict[Hashable, Tuple[Any, int, float]]' = OrderedDict()
+        self._bytes = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'invalidations': 0}
+    
+    @classmethod
+    def from_config(cls, db_config: DatabaseConfig) -> 'ResultCache':
+        """DatabaseConfigのキャッシュ設定からキャッシュを生成"""
+        return cls(**db_config.to_cache_params())
+    
+    @classmethod
+    def shared(cls, namespace: str, db_config: DatabaseConfig) -> 'ResultCache':
+        """接続先・名前空間ごとに共有されるキャッシュを取得（未作成なら生成）
+        
+        書き込み側（例: EdoRecipeManager）と読み取り側（例: RecipeSearchService）が
+        同じインスタンスを参照するため、書き込み時の invalidate() が検索側に反映される。
+        
+        Args:
+            namespace: キャッシュの名前空間
+            db_config: データベース設定オブジェクト
+        
+        Returns:
+            共有される ResultCache
+        """
+        key = (namespace,) + tuple(sorted(db_config.to_connection_params().items()))
+        with cls._shared_lock:
+            cache = cls._shared_caches.get(key)
+            if cache is None:
+                cache = cls.from_config(db_config)
+                cls._shared_caches[key] = cache
+            return cache
+    
+    @property
+    def generation(self) -> int:
+        """invalidate() のたびに増える世代番号（読み込み開始時に取得して put に渡す）"""
+        return self._generation
+    
+    @staticmethod
+    def estimate_size(value: Any) -> int:
+        """結果の推定バイト数（タプル・リスト・辞書・文字列などを再帰的に合計）"""
+        size = sys.getsizeof(value)
+        if isinstance(value, (list, tuple, set, frozenset)):
+            size += sum(ResultCache.estimate_size(item) for item in value)
+        elif isinstance(value, dict):
+            size += sum(ResultCache.estimate_size(k) + ResultCache.estimate_size(v) for k, v in value.items())
+        return size
+    
+    def _remove(self, key: Hashable) -> None:
+        """エントリを削除（ロック保持中に呼ぶ）"""
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """キャッシュされた値を取得（失効済み・未登録の場合は default）"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl and entry[2] <= time.monotonic():
+                self._remove(key)
+                self._counters['expirations'] += 1
+                entry = None
+            if entry is None:
+                self._counters['misses'] += 1
+                return default
+            self._entries.move_to_end(key)
+            self._counters['hits'] += 1
+            return entry[0]
+    
+    def put(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        """値を格納し、上限を超えた分を LRU で破棄
+        
+        Args:
+            key: キャッシュキー
+            value: 格納する値
+            generation: 読み込み開始時の generation。以降に invalidate() された場合は格納しない
+        """
+        if self.max_entries == 0:
+            return
+        size = self.estimate_size(value)
+        if self.max_bytes and size > self.max_bytes:
+            return
+        
+        expires_at = time.monotonic() + self.ttl if self.ttl else float('inf')
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, expires_at)
+            self._bytes += size
+            
+            while (len(self._entries) > self.max_entries
+                   or (self.max_bytes and self._bytes > self.max_bytes)):
+                self._remove(next(iter(self._entries)))
+                self._counters['evictions'] += 1
+    
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """キャッシュにあれば返し、なければ loader() の結果を格納して返す
+        
+        loader() が None（失敗）を返した場合は格納しない。
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        
+        generation = self.generation
+        value = loader()
+        if value is not None:
+            self.put(key, value, generation)
+        return value
+    
+    def invalidate(self) -> None:
+        """全エントリを破棄（データ更新時に呼ぶ）"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._generation += 1
+            self._counters['invalidations'] += 1
+    
+    def stats(self) -> Dict[str, int]:
+        """キャッシュの利用状況を取得
+        
+        Returns:
+            hits/misses/evictions/expirations/invalidations/entries/bytes を含む辞書
+        """
+        with self._lock:
+            return dict(self._counters, entries=len(self._entries), bytes=self._bytes)
@@ -1,14 +1,33 @@
-import psycopg2
 from psycopg2 import Error
-from psycopg2.extensions import connection
-from typing import Optional, List, Tuple, Dict, Any
+from psycopg2.extras import execute_values
+from typing import Optional, List, Tuple, Dict, Any, Iterator, Iterable
 
 from .database_config import DatabaseConfig
+from .cache_invalidation import CacheInvalidation
+from .connection_pool import ConnectionPool
+from .page_token import PageToken
+from .prepared_statements import StatementRegistry
 
 
 class TaskManager:
     """タスクのCRUD操作を管理するクラス（SRP準拠）"""
     
+    # 変更時に CacheInvalidation.CHANNEL へ NOTIFY するテーブル
+    NOTIFY_TABLES: Tuple[str, ...] = ('tasks',)
+    
+    # 一括操作で1つの文に含める行数（execute_values のページサイズ）
+    BATCH_PAGE_SIZE = 1000
+    
+    # update_tasks で更新できる列
+    UPDATABLE_FIELDS: Tuple[str, ...] = ('title', 'description', 'status')
+    
+    # ID指定の読み取り（プリペアドステートメント）。SELECT * だと列の追加で
+    # PREPARE 済みの文の結果型が変わりエラーになるため、列を明示する
+    TASK_BY_ID_QUERY = """
+    SELECT id, title, description, status, created_at, updated_at, queue, attempts, locked_until
+    FROM tasks WHERE id = %s;
+    """
+    
     def __init__(self, db_config: DatabaseConfig):
         """TaskManagerを初期化
         
@@ -16,20 +35,16 @@ class TaskManager:
             db_config: データベース設定オブジェクト
         """
         self.db_config = db_config
-        self.conn: Optional[connection] = None
-        self.cur = None
+        self.pool: Optional[ConnectionPool] = None
+        self.statements = StatementRegistry.shared(db_config)
+        self.statements.register('task_by_id', self.TASK_BY_ID_QUERY, ('integer',))
         self._connect()
         self._create_table()
     
     def _connect(self) -> None:
-        """データベースに接続"""
-        try:
-            self.conn = psycopg2.connect(**self.db_config.to_connection_params())
-            self.cur = self.conn.cursor()
-            print(f"Connected to database: {self.db_config}")
-        except Error as e:
-            print(f"Error connecting to PostgreSQL: {e}")
-            raise
+        """共有コネクションプールを取得（接続は操作ごとに借用）"""
+        self.pool = ConnectionPool.shared(self.db_config)
+        print(f"Connected to database: {self.db_config}")
     
     def _create_table(self) -> None:
         """テーブルが存在しない場合、新規作成"""
@@ -43,12 +58,41 @@ class TaskManager:
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         );
         """
+        # 一覧のキーセットページネーション（created_at DESC, id DESC）用の複合インデックス
+        create_index_query = """
+        CREATE INDEX IF NOT EXISTS idx_tasks_created_at_id ON tasks (created_at, id);
+        """
+        # TaskQueue（作業キュー）用の列と部分インデックス
+        queue_queries = [
+            "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS queue VARCHAR(50) NOT NULL DEFAULT 'default';",
+            "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS attempts INTEGER NOT NULL DEFAULT 0;",
+            "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS locked_until TIMESTAMPTZ;",
+            # 取り出し待ちの行だけを持つため、処理済みの行が増えてもインデックスは小さいまま
+            "CREATE INDEX IF NOT EXISTS idx_tasks_pending ON tasks (queue, created_at, id) WHERE status = 'pending';",
+            # 可視性タイムアウト切れの検出用
+            "CREATE INDEX IF NOT EXISTS idx_tasks_in_progress_locked_until ON tasks (queue, locked_until) "
+            "WHERE status = 'in_progress';",
+        ]
         try:
-            self.cur.execute(create_table_query)
-            self.conn.commit()
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(create_table_query)
+                    cur.execute(create_index_query)
+                    # ALTER TABLE はテーブルを排他ロックするため、作成済みなら実行しない
+                    cur.execute("""
+                        SELECT EXISTS (
+                            SELECT FROM information_schema.columns
+                            WHERE table_name = 'tasks' AND column_name = 'locked_until'
+                        );
+                    """)
+                    if not cur.fetchone()[0]:
+                        for query in queue_queries:
+                            cur.execute(query)
+                    # 他プロセスのキャッシュ破棄用の通知トリガー（作成済みなら何もしない）
+                    CacheInvalidation.install(cur, self.NOTIFY_TABLES)
+                conn.commit()
         except Error as e:
             print(f"Error creating table: {e}")
-            self.conn.rollback()
             raise
     
     def create_task(self, title: str, description: str = "") -> Optional[int]:
@@ -67,14 +111,15 @@ class TaskManager:
         RETURNING id;
         """
         try:
-            self.cur.execute(insert_query, (title, description))
-            task_id = self.cur.fetchone()[0]
-            self.conn.commit()
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(insert_query, (title, description))
+                    task_id = cur.fetchone()[0]
+                conn.commit()
             print(f"Task created successfully with ID: {task_id}")
             return task_id
         except Error as e:
             print(f"Error creating task: {e}")
-            self.conn.rollback()
             return None
     
     def read_task(self, task_id: Optional[int] = None) -> Optional[List[Tuple]]:
@@ -87,17 +132,92 @@ class TaskManager:
             タスクデータのリスト、失敗時はNone
         """
         try:
-            if task_id:
-                self.cur.execute("SELECT * FROM tasks WHERE id = %s;", (task_id,))
-                result = self.cur.fetchone()
-                return [result] if result else []
-            else:
-                self.cur.execute("SELECT * FROM tasks ORDER BY created_at DESC;")
-                return self.cur.fetchall()
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    if task_id:
+                        self.statements.execute(cur, 'task_by_id', (task_id,))
+                        result = cur.fetchone()
+                        return [result] if result else []
+                    else:
+                        cur.execute("SELECT * FROM tasks ORDER BY created_at DESC;")
+                        return cur.fetchall()
         except Error as e:
             print(f"Error reading task(s): {e}")
             return None
     
+    def iter_tasks(self, itersize: Optional[int] = None) -> Iterator[Tuple]:
+        """全タスクをサーバーサイドカーソルでストリーミング読み取り
+        
+        名前付きカーソルで itersize 行ずつ取得するため、件数に関係なく
+        クライアント側のメモリ使用量は一定になる。読み取り中は接続を1本借用し続け、
+        反復の終了時（途中で打ち切った場合も含む）にカーソルを閉じて返却する。
+        
+        Args:
+            itersize: 1回のネットワーク往復で取得する行数（Noneの場合は DatabaseConfig.stream_itersize）
+            
+        Yields:
+            タスクデータのタプル（created_at の降順）
+            
+        Raises:
+            psycopg2.Error: 読み取り中にエラーが発生した場合（それまでの行は返却済み）
+        """
+        try:
+            with self.pool.connection() as conn:
+                with conn.cursor(name='tasks_stream') as cur:
+                    cur.itersize = itersize or self.db_config.stream_itersize
+                    cur.execute("SELECT * FROM tasks ORDER BY created_at DESC;")
+                    for row in cur:
+                        yield row
+        except Error as e:
+            print(f"Error streaming tasks: {e}")
+            raise
+    
+    def read_tasks_page(self, limit: int = 20,
+                        page_token: Optional[str] = None) -> Optional[Tuple[List[Tuple], Optional[str]]]:
+        """タスク一覧をページ単位で読み取り（(created_at, id) によるキーセットページネーション）
+        
+        前ページ最終行のキーより後ろを複合インデックスで直接たどるため、
+        深いページでも先頭ページと同じコストで取得できる。
+        
+        Args:
+            limit: 1ページの件数
+            page_token: 前ページの継続トークン（先頭ページはNone）
+            
+        Returns:
+            (タスクデータのリスト, 次ページの継続トークン) のタプル、失敗時はNone
+            （最終ページではトークンがNone）
+            
+        Raises:
+            ValueError: page_token が不正な場合
+        """
+        after = PageToken.decode('tasks', page_token, 2) if page_token else None
+        try:
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    if after is None:
+                        cur.execute("""
+                            SELECT * FROM tasks
+                            ORDER BY created_at DESC, id DESC
+                            LIMIT %s;
+                        """, (limit + 1,))
+                    else:
+                        cur.execute("""
+                            SELECT * FROM tasks
+                            WHERE (created_at, id) < (%s, %s)
+                            ORDER BY created_at DESC, id DESC
+                            LIMIT %s;
+                        """, (after[0], after[1], limit + 1))
+                    rows = cur.fetchall()
+        except Error as e:
+            print(f"Error reading tasks page: {e}")
+            return None
+        
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        # tasks の列順: id, title, description, status, created_at, updated_at, queue, attempts, locked_until
+        return rows, PageToken.encode('tasks', (rows[-1][4], rows[-1][0]))
+    
     def update_task(self, task_id: int, title: Optional[str] = None, 
                     description: Optional[str] = None, status: Optional[str] = None) -> bool:
         """タスクを更新
@@ -137,13 +257,14 @@ class TaskManager:
         """
         
         try:
-            self.cur.execute(update_query, values)
-            self.conn.commit()
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(update_query, values)
+                conn.commit()
             print(f"Task {task_id} updated successfully")
             return True
         except Error as e:
             print(f"Error updating task: {e}")
-            self.conn.rollback()
             return False
     
     def delete_task(self, task_id: int) -> bool:
@@ -156,21 +277,127 @@ class TaskManager:
             削除成功時はTrue、失敗時はFalse
         """
         try:
-            self.cur.execute("DELETE FROM tasks WHERE id = %s;", (task_id,))
-            self.conn.commit()
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("DELETE FROM tasks WHERE id = %s;", (task_id,))
+                conn.commit()
             print(f"Task {task_id} deleted successfully")
             return True
         except Error as e:
             print(f"Error deleting task: {e}")
-            self.conn.rollback()
             return False
     
+    def create_tasks(self, tasks: Iterable[Tuple[str, str]],
+                     page_size: int = BATCH_PAGE_SIZE) -> Optional[List[int]]:
+        """複数のタスクを1トランザクションで作成
+        
+        複数行の VALUES を持つ INSERT を page_size 行ごとに実行し、最後に1回だけコミットする。
+        
+        Args:
+            tasks: (タイトル, 説明) のタプルのイテラブル
+            page_size: 1つのINSERT文に含める行数
+            
+        Returns:
+            作成されたタスクIDのリスト（tasks の順）、失敗時はNone（すべてロールバック）
+        """
+        rows = [(title, description) for title, description in tasks]
+        if not rows:
+            return []
+        
+        insert_query = "INSERT INTO tasks (title, description) VALUES %s RETURNING id"
+        try:
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    returned = execute_values(cur, insert_query, rows, page_size=page_size, fetch=True)
+                conn.commit()
+        except Error as e:
+            print(f"Error creating tasks: {e}")
+            return None
+        
+        task_ids = [row[0] for row in returned]
+        print(f"{len(task_ids)} tasks created successfully")
+        return task_ids
+    
+    def update_tasks(self, updates: Iterable[Dict[str, Any]],
+                     page_size: int = BATCH_PAGE_SIZE) -> Optional[List[int]]:
+        """複数のタスクを1トランザクションで更新
+        
+        UPDATE ... FROM (VALUES ...) を page_size 行ごとに実行し、最後に1回だけコミットする。
+        update_task と同様に、値が空（None や空文字）の列は変更しない。
+        同じIDが複数回含まれる場合は、後の値を優先してまとめる。
+        
+        Args:
+            updates: 'id' と UPDATABLE_FIELDS のいずれかのキーを持つ辞書のイテラブル
+                     例: [{'id': 1, 'status': 'done'}, {'id': 2, 'title': '新しいタイトル'}]
+            page_size: 1つのUPDATE文に含める行数
+            
+        Returns:
+            更新されたタスクIDのリスト（存在しないIDは含まない）、失敗時はNone（すべてロールバック）
+        """
+        merged: Dict[int, Dict[str, Any]] = {}
+        for update in updates:
+            fields = merged.setdefault(update['id'], {})
+            fields.update((name, update[name]) for name in self.UPDATABLE_FIELDS if update.get(name))
+        rows = [(task_id,) + tuple(fields.get(name) for name in self.UPDATABLE_FIELDS)
+                for task_id, fields in merged.items() if fields]
+        if not rows:
+            return []
+        
+        update_query = """
+        UPDATE tasks AS t
+        SET title = COALESCE(v.title, t.title),
+            description = COALESCE(v.description, t.description),
+            status = COALESCE(v.status, t.status),
+            updated_at = CURRENT_TIMESTAMP
+        FROM (VALUES %s) AS v(id, title, description, status)
+        WHERE t.id = v.id
+        RETURNING t.id
+        """
+        # NULL を含む列でも型が決まるよう、プレースホルダーに列の型を明示する
+        template = "(%s::integer, %s::varchar, %s::text, %s::varchar)"
+        try:
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    returned = execute_values(cur, update_query, rows, template=template,
+                                              page_size=page_size, fetch=True)
+                conn.commit()
+        except Error as e:
+            print(f"Error updating tasks: {e}")
+            return None
+        
+        task_ids = [row[0] for row in returned]
+        print(f"{len(task_ids)} tasks updated successfully")
+        return task_ids
+    
+    def delete_tasks(self, task_ids: Iterable[int]) -> Optional[List[int]]:
+        """複数のタスクを1文（DELETE ... WHERE id = ANY(%s)）で削除
+        
+        Args:
+            task_ids: 削除するタスクIDのイテラブル
+            
+        Returns:
+            削除されたタスクIDのリスト（存在しないIDは含まない）、失敗時はNone
+        """
+        ids = list(dict.fromkeys(task_ids))
+        if not ids:
+            return []
+        
+        try:
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("DELETE FROM tasks WHERE id = ANY(%s) RETURNING id;", (ids,))
+                    deleted_ids = [row[0] for row in cur.fetchall()]
+                conn.commit()
+        except Error as e:
+            print(f"Error deleting tasks: {e}")
+            return None
+        
+        print(f"{len(deleted_ids)} tasks deleted successfully")
+        return deleted_ids
+    
     def close(self) -> None:
-        """データベース接続を適切にクローズ"""
-        if self.cur:
-            self.cur.close()
-        if self.conn:
-            self.conn.close()
+        """プールへの参照を解放（共有プール自体は他のインスタンスが利用するため閉じない）"""
+        self.pool = None
     
     def __enter__(self):
         """コンテキストマネージャーのエントリー"""
@@ -0,0 +1,260 @@
+from psycopg2 import Error
+from psycopg2.extras import execute_values
+from typing import Optional, List, Tuple, Dict, Iterable
+
+from .cache_invalidation import CacheInvalidation
+from .database_config import DatabaseConfig
+from .connection_pool import ConnectionPool
+from .task_manager import TaskManager
+
+
+class TaskQueue:
+    """tasks テーブルを作業キューとして使うクラス（SRP準拠）
+    
+    複数のワーカー（スレッド・プロセス）が同じキューから競合せずにタスクを取り出せる。
+    - claim: pending のタスクを FOR UPDATE SKIP LOCKED で選び、in_progress に変更して返す
+      （他のワーカーがロック中の行は待たずに読み飛ばす）
+    - ack: 処理済みのタスクを done にする
+    - nack: 処理に失敗したタスクを pending に戻す（試行回数が上限に達したら failed）
+    - 可視性タイムアウト（visibility_timeout 秒）内に ack されなかったタスクは、次の claim で pending に戻る
+    - ack/nack には claim が返した (id, attempts) をリースとして渡す。attempts は取り出しのたびに増えるため、
+      タイムアウト後に他のワーカーが取り出し直したタスクを、元のワーカーが完了・差し戻しすることはない
+    少なくとも1回（at-least-once）の配信のため、タスクの処理は冪等にしておくこと。
+    claim/ack/nack による状態遷移では tasks の通知トリガー（CacheInvalidation）を止める。
+    NOTIFY はコミットをクラスタ全体で直列化するため、通知するとキューのスループットがそこで頭打ちになる。
+    enqueue（タスクの追加）は従来どおり通知する。
+    """
+    
+    CLAIM_QUERY = """
+    WITH claimable AS (
+        SELECT id FROM tasks
+        WHERE queue = %(queue)s AND status = 'pending'
+        ORDER BY created_at, id
+        LIMIT %(batch_size)s
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE tasks AS t
+    SET status = 'in_progress',
+        attempts = t.attempts + 1,
+        locked_until = now() + %(visibility_timeout)s * interval '1 second',
+        updated_at = CURRENT_TIMESTAMP
+    FROM claimable
+    WHERE t.id = claimable.id
+    RETURNING t.id, t.title, t.description, t.attempts;
+    """
+    
+    # 可視性タイムアウトを過ぎた in_progress のタスクを pending（試行回数の上限到達時は failed）に戻す
+    RELEASE_EXPIRED_QUERY = """
+    WITH expired AS (
+        SELECT id FROM tasks
+        WHERE queue = %(queue)s AND status = 'in_progress' AND locked_until < now()
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE tasks AS t
+    SET status = CASE WHEN t.attempts >= %(max_attempts)s THEN 'failed' ELSE 'pending' END,
+        locked_until = NULL,
+        updated_at = CURRENT_TIMESTAMP
+    FROM expired
+    WHERE t.id = expired.id
+    RETURNING t.id, t.status;
+    """
+    
+    def __init__(self, db_config: DatabaseConfig, queue: str = 'default',
+                 visibility_timeout: float = 30.0, max_attempts: int = 3):
+        """TaskQueueを初期化（tasks テーブルと作業キュー用の列は TaskManager が作成）
+        
+        Args:
+            db_config: データベース設定オブジェクト
+            queue: キュー名（tasks.queue 列。別のキューのタスクは取り出さない）
+            visibility_timeout: claim してから ack されるまでの猶予（秒）
+            max_attempts: 取り出しの最大回数（超えたタスクは failed にする）
+        """
+        if visibility_timeout <= 0 or max_attempts < 1:
+            raise ValueError(f"Invalid queue settings: visibility_timeout={visibility_timeout}, "
+                             f"max_attempts={max_attempts}")
+        
+        self.db_config = db_config
+        self.queue = queue
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.task_manager = TaskManager(db_config)
+        self.pool: Optional[ConnectionPool] = self.task_manager.pool
+    
+    def enqueue(self, tasks: Iterable[Tuple[str, str]],
+                page_size: int = TaskManager.BATCH_PAGE_SIZE) -> Optional[List[int]]:
+        """タスクをこのキューに1トランザクションで追加
+        
+        Args:
+            tasks: (タイトル, 説明) のタプルのイテラブル
+            page_size: 1つのINSERT文に含める行数
+        
+        Returns:
+            追加したタスクIDのリスト、失敗時はNone
+        """
+        rows = [(title, description, self.queue) for title, description in tasks]
+        if not rows:
+            return []
+        
+        try:
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    returned = execute_values(
+                        cur, "INSERT INTO tasks (title, description, queue) VALUES %s RETURNING id",
+                        rows, page_size=page_size, fetch=True)
+                conn.commit()
+            return [row[0] for row in returned]
+        except Error as e:
+            print(f"Error enqueuing tasks: {e}")
+            return None
+    
+    def claim(self, batch_size: int = 10) -> Optional[List[Tuple]]:
+        """pending のタスクを最大 batch_size 件取り出し、in_progress に変更
+        
+        可視性タイムアウト切れのタスクを pending に戻してから取り出す。
+        他のワーカーが取り出し中の行はロック待ちせずに読み飛ばす。
+        
+        Args:
+            batch_size: 1回で取り出す最大件数
+        
+        Returns:
+            (id, title, description, attempts) のタプルリスト（空ならキューは空）、失敗時はNone
+            （ack/nack には (id, attempts) をリースとして渡す）
+        """
+        params = {
+            'queue': self.queue,
+            'batch_size': batch_size,
+            'visibility_timeout': self.visibility_timeout,
+            'max_attempts': self.max_attempts,
+        }
+        try:
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(CacheInvalidation.SUPPRESS_QUERY)
+                    cur.execute(self.RELEASE_EXPIRED_QUERY, params)
+                    cur.execute(self.CLAIM_QUERY, params)
+                    claimed = cur.fetchall()
+                conn.commit()
+            return claimed
+        except Error as e:
+            print(f"Error claiming tasks: {e}")
+            return None
+    
+    def ack(self, leases: Iterable[Tuple[int, int]]) -> Optional[List[int]]:
+        """処理済みのタスクを done にする
+        
+        Args:
+            leases: claim が返した (id, attempts) のタプルのイテラブル
+        
+        Returns:
+            done にしたタスクIDのリスト（リースが失効していたIDは含まない）、失敗時はNone
+        """
+        return self._finish(leases, """
+            UPDATE tasks AS t
+            SET status = 'done', locked_until = NULL, updated_at = CURRENT_TIMESTAMP
+            FROM unnest(%(ids)s::integer[], %(attempts)s::integer[]) AS lease(lease_id, lease_attempts)
+            WHERE t.id = lease.lease_id AND t.attempts = lease.lease_attempts
+              AND t.queue = %(queue)s AND t.status = 'in_progress'
+            RETURNING t.id;
+        """, 'acknowledging')
+    
+    def nack(self, leases: Iterable[Tuple[int, int]]) -> Optional[List[int]]:
+        """処理に失敗したタスクを pending に戻す（試行回数が max_attempts に達したものは failed）
+        
+        Args:
+            leases: claim が返した (id, attempts) のタプルのイテラブル
+        
+        Returns:
+            状態を戻したタスクIDのリスト（リースが失効していたIDは含まない）、失敗時はNone
+        """
+        return self._finish(leases, """
+            UPDATE tasks AS t
+            SET status = CASE WHEN t.attempts >= %(max_attempts)s THEN 'failed' ELSE 'pending' END,
+                locked_until = NULL, updated_at = CURRENT_TIMESTAMP
+            FROM unnest(%(ids)s::integer[], %(attempts)s::integer[]) AS lease(lease_id, lease_attempts)
+            WHERE t.id = lease.lease_id AND t.attempts = lease.lease_attempts
+              AND t.queue = %(queue)s AND t.status = 'in_progress'
+            RETURNING t.id;
+        """, 'rejecting')
+    
+    def _finish(self, leases: Iterable[Tuple[int, int]], query: str, action: str) -> Optional[List[int]]:
+        """ack/nack の共通処理（1文で、リースが一致する in_progress のタスクだけを更新）
+        
+        可視性タイムアウトで pending に戻された・他のワーカーに取り出し直されたタスクは更新せず、
+        そのIDを表示する。
+        """
+        # 同じタスクは最後に渡されたリースで判定する
+        lease_map = {task_id: attempts for task_id, attempts in leases}
+        if not lease_map:
+            return []
+        
+        params = {
+            'ids': list(lease_map),
+            'attempts': list(lease_map.values()),
+            'queue': self.queue,
+            'max_attempts': self.max_attempts,
+        }
+        try:
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(CacheInvalidation.SUPPRESS_QUERY)
+                    cur.execute(query, params)
+                    finished = [row[0] for row in cur.fetchall()]
+                conn.commit()
+        except Error as e:
+            print(f"Error {action} tasks: {e}")
+            return None
+        
+        if len(finished) < len(lease_map):
+            finished_ids = set(finished)
+            stale = [task_id for task_id in lease_map if task_id not in finished_ids]
+            print(f"Skipped {action} {len(stale)} tasks with expired leases: {stale}")
+        return finished
+    
+    def stats(self) -> Optional[Dict[str, int]]:
+        """このキューのステータスごとのタスク数を取得
+        
+        Returns:
+            ステータス → 件数 の辞書、失敗時はNone
+        """
+        try:
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("""
+                        SELECT status, COUNT(*) FROM tasks
+                        WHERE queue = %s
+                        GROUP BY status;
+                    """, (self.queue,))
+                    return dict(cur.fetchall())
+        except Error as e:
+            print(f"Error getting queue stats: {e}")
+            return None
+    
+    def purge(self) -> Optional[int]:
+        """このキューのタスクをすべて削除
+        
+        Returns:
+            削除した件数、失敗時はNone
+        """
+        try:
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("DELETE FROM tasks WHERE queue = %s;", (self.queue,))
+                    deleted = cur.rowcount
+                conn.commit()
+            return deleted
+        except Error as e:
+            print(f"Error purging queue: {e}")
+            return None
+    
+    def close(self) -> None:
+        """プールへの参照を解放（共有プール自体は他のインスタンスが利用するため閉じない）"""
+        self.task_manager.close()
+        self.pool = None
+    
+    def __enter__(self):
+        """コンテキストマネージャーのエントリー"""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """コンテキストマネージャーのイグジット"""
+        self.close()
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""個別レシピページの解析方式のベンチマーク
+
+保存済みのページを EdoRecipeScraper の各解析方式（PARSER_BACKENDS）で解析し、
+1秒あたりの解析ページ数を比較する。ネットワークにはアクセスしない。
+--parse-workers を指定すると、EdoRecipeScraper.parse_pages で複数の解析プロセスに割り振る
+（プロセスの起動時間も計測に含む）。
+
+- --pages: scrape_test.py --cache-dir で保存したキャッシュディレクトリ（*.body）、
+  または HTML ファイルを置いたディレクトリ
+- --verify: 各方式の解析結果が html.parser（従来の解析）と一致するか確認し、不一致があれば終了コード1
+- --golden: 解析結果の基準ファイルと全方式の結果を比較し、不一致があれば終了コード1
+  （--update-golden を付けると、現在の結果で基準ファイルを作成・更新する）
+- --check: リポジトリの parse_fixtures（保存済みのページと基準ファイル）で --golden の比較を行う
+
+基準ファイルは、ページごとの html.parser の結果（pages）と、方式ごとに html.parser と異なることが
+分かっている項目（differences）を持つ。構造が壊れたページでは、lxml（libxml2）と html.parser の
+木の組み立て方が異なるため、その差も基準ファイルに記録して比較する。
+
+Usage:
+    python parse_benchmark.py --check
+    python parse_benchmark.py --pages cache --verify
+    python parse_benchmark.py --pages cache --golden parse_golden.json --update-golden
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import contextlib
+
+from scrape_test import EdoRecipeScraper
+
+
+REFERENCE_BACKEND = 'html.parser'
+
+# --check で使う、リポジトリに含まれる保存済みのページと基準ファイル
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'parse_fixtures')
+FIXTURE_PAGES = os.path.join(FIXTURE_DIR, 'pages')
+FIXTURE_GOLDEN = os.path.join(FIXTURE_DIR, 'expected.json')
+
+
+def load_pages(directory):
+    """保存済みのページを読み込む
+    
+    Returns:
+        recipe_info（id/name/url）と本文のバイト列のタプルのリスト（ファイル名順）
+    """
+    names = sorted(os.listdir(directory))
+    bodies = [name for name in names if name.endswith('.body')]
+    pages = []
+    if bodies:
+        # ResponseCache のディレクトリ: URL は同じ名前の .json に保存されている
+        for name in bodies:
+            stem = name[:-len('.body')]
+            try:
+                with open(os.path.join(directory, stem + '.json'), encoding='utf-8') as f:
+                    url = json.load(f)['url']
+            except (OSError, ValueError, KeyError):
+                url = stem
+            with open(os.path.join(directory, name), 'rb') as f:
+                pages.append((url, f.read()))
+    else:
+        for name in names:
+            path = os.path.join(directory, name)
+            if os.path.isfile(path):
+                with open(path, 'rb') as f:
+                    pages.append((name, f.read()))
+    
+    # 一覧ページ（index）はレシピではないため除く
+    pages = [(url, body) for url, body in pages if not url.rstrip('/').endswith(('index.html', 'index.html.ja'))]
+    pages.sort(key=lambda page: page[0])
+    return [({'id': str(number), 'name': url.rstrip('/').rsplit('/', 1)[-1], 'url': url}, body)
+            for number, (url, body) in enumerate(pages, 1)]
+
+
+def parse_all(scraper, pages):
+    """全ページを解析（解析の経過表示は捨てる）
+    
+    Returns:
+        (URL -> 解析結果 の辞書, 所要時間（秒）)
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        recipes = scraper.parse_pages(pages)
+        elapsed = time.perf_counter() - started
+    return {recipe_info['url']: recipe_data for (recipe_info, _), recipe_data in zip(pages, recipes)}, elapsed
+
+
+def find_mismatches(expected, actual):
+    """解析結果が異なるURLと、最初に異なる項目の一覧"""
+    mismatches = []
+    for url, expected_data in expected.items():
+        actual_data = actual.get(url)
+        if actual_data == expected_data:
+            continue
+        if expected_data is None or actual_data is None:
+            mismatches.append((url, '解析結果の有無'))
+            continue
+        keys = [key for key in expected_data if expected_data.get(key) != actual_data.get(key)]
+        mismatches.append((url, ', '.join(keys) or '項目の構成'))
+    return mismatches
+
+
+def expected_results(golden, backend):
+    """基準ファイルから、方式ごとの期待する解析結果（URL -> 解析結果）を作成"""
+    expected = dict(golden['pages'])
+    for url, fields in golden.get('differences', {}).get(backend, {}).items():
+        if '__result__' in fields:
+            # 解析の成否が異なるページは、結果全体（失敗時はNone）を記録している
+            expected[url] = fields['__result__']
+        else:
+            expected[url] = dict(expected[url], **fields)
+    return expected
+
+
+def build_golden(results):
+    """全方式の解析結果から基準ファイルの内容を作成（html.parser と異なる項目を differences に記録）"""
+    reference = results[REFERENCE_BACKEND]
+    differences = {}
+    for backend, backend_results in results.items():
+        if backend == REFERENCE_BACKEND:
+            continue
+        for url, data in backend_results.items():
+            expected_data = reference[url]
+            if data == expected_data:
+                continue
+            if data is None or expected_data is None:
+                fields = {'__result__': data}
+            else:
+                fields = {key: data[key] for key in data if data[key] != expected_data.get(key)}
+            differences.setdefault(backend, {})[url] = fields
+    return {'pages': reference, 'differences': differences}
+
+
+def report_mismatches(backend, label, mismatches):
+    """不一致の一覧を表示"""
+    print(f"✗ {backend}: {label}と {len(mismatches)} ページが不一致")
+    for url, keys in mismatches[:10]:
+        print(f"    {url}: {keys}")
+    if len(mismatches) > 10:
+        print(f"    ...他 {len(mismatches) - 10} ページ")
+
+
+def run_benchmark(args):
+    """ベンチマークを実行
+    
+    Returns:
+        結果が一致した（または確認しなかった）場合True
+    """
+    pages = load_pages(args.pages)
+    if not pages:
+        print(f"解析するページがありません: {args.pages}")
+        return False
+    total_bytes = sum(len(content) for _, content in pages)
+    print(f"=== 解析方式のベンチマーク: {len(pages)} ページ（{total_bytes / 1024:.0f} KB）, {args.repeat} 回, "
+          f"解析プロセス数 {args.parse_workers} ===\n")
+    
+    backends = list(args.backends)
+    if (args.verify or args.golden) and REFERENCE_BACKEND not in backends:
+        backends.insert(0, REFERENCE_BACKEND)
+    
+    results = {}
+    timings = {}
+    for backend in backends:
+        scraper = EdoRecipeScraper(sleep_time=0, parser=backend, parse_workers=args.parse_workers)
+        best = None
+        for _ in range(args.repeat):
+            results[backend], elapsed = parse_all(scraper, pages)
+            best = elapsed if best is None else min(best, elapsed)
+        timings[backend] = best
+        failed = sum(1 for data in results[backend].values() if data is None)
+        print(f"{backend:12s}: {len(pages) / best:8.1f} ページ/秒（{best * 1000:.0f} ms, 解析失敗: {failed}）")
+    
+    if REFERENCE_BACKEND in timings:
+        print()
+        for backend in backends:
+            if backend != REFERENCE_BACKEND:
+                print(f"{backend} は {REFERENCE_BACKEND} の {timings[REFERENCE_BACKEND] / timings[backend]:.1f} 倍")
+    
+    ok = True
+    if args.verify:
+        print(f"\n=== {REFERENCE_BACKEND} との比較 ===")
+        for backend in backends:
+            if backend == REFERENCE_BACKEND:
+                continue
+            mismatches = find_mismatches(results[REFERENCE_BACKEND], results[backend])
+            if mismatches:
+                ok = False
+                report_mismatches(backend, REFERENCE_BACKEND, mismatches)
+            else:
+                print(f"✓ {backend}: 全ページ一致")
+    
+    if args.golden and args.update_golden:
+        with open(args.golden, 'w', encoding='utf-8') as f:
+            json.dump(build_golden(results), f, ensure_ascii=False, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"\n基準ファイルを保存しました: {args.golden}（差分を確認してからコミットすること）")
+    elif args.golden:
+        try:
+            with open(args.golden, encoding='utf-8') as f:
+                golden = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"\n基準ファイルを読み込めません: {e}（作成する場合は --update-golden を指定）")
+            return False
+        print(f"\n=== 基準ファイル（{args.golden}）との比較 ===")
+        missing = sorted(set(results[REFERENCE_BACKEND]) - set(golden['pages']))
+        if missing:
+            ok = False
+            print(f"✗ 基準ファイルに無いページ: {', '.join(missing)}")
+        for backend in backends:
+            mismatches = find_mismatches(expected_results(golden, backend), results[backend])
+            if mismatches:
+                ok = False
+                report_mismatches(backend, '基準ファイル', mismatches)
+            else:
+                print(f"✓ {backend}: 全ページ一致")
+    
+    return ok
+
+
+def parse_arguments():
+    """コマンドライン引数を解析"""
+    parser = argparse.ArgumentParser(description='個別レシピページの解析方式のベンチマーク')
+    
+    parser.add_argument('--pages', type=str, default=None,
+                      help='保存済みのページのディレクトリ（--cache-dir のキャッシュ、またはHTMLファイル）')
+    parser.add_argument('--backends', nargs='+', default=list(EdoRecipeScraper.PARSER_BACKENDS),
+                      choices=EdoRecipeScraper.PARSER_BACKENDS,
+                      help='比較する解析方式（デフォルト: すべて）')
+    parser.add_argument('--repeat', type=int, default=3,
+                      help='繰り返し回数（最速の回を表示、デフォルト: 3）')
+    parser.add_argument('--parse-workers', type=int, default=1,
+                      help='解析プロセス数（デフォルト: 1 = 呼び出し元のプロセスで解析）')
+    parser.add_argument('--verify', action='store_true', default=False,
+                      help=f'各方式の解析結果が {REFERENCE_BACKEND} と一致するか確認')
+    parser.add_argument('--golden', type=str, default=None,
+                      help='解析結果の基準ファイル（全方式の結果と比較）')
+    parser.add_argument('--update-golden', action='store_true', default=False,
+                      help='比較せずに、現在の結果で --golden の基準ファイルを作成・更新')
+    parser.add_argument('--check', action='store_true', default=False,
+                      help='parse_fixtures のページを全方式で解析し、基準ファイルと比較')
+    
+    args = parser.parse_args()
+    if args.check:
+        if args.pages is not None or args.golden is not None:
+            parser.error("--check は --pages・--golden と同時に指定できません")
+        args.pages = FIXTURE_PAGES
+        args.golden = FIXTURE_GOLDEN
+        args.backends = list(EdoRecipeScraper.PARSER_BACKENDS)
+        args.repeat = 1
+    if args.pages is None:
+        parser.error("--pages または --check を指定してください")
+    if args.update_golden and args.golden is None:
+        parser.error("--update-golden には --golden（または --check）の指定が必要です")
+    if args.repeat < 1:
+        parser.error("--repeat は1以上を指定してください")
+    return args
+
+
+def main():
+    """メイン実行関数"""
+    args = parse_arguments()
+    if not run_benchmark(args):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
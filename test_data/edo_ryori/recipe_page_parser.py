@@ -0,0 +1,284 @@
+"""lxml による個別レシピページの高速解析
+
+EdoRecipeScraper.parse_recipe_detail（BeautifulSoup + html.parser）と同じ結果を、
+文書を1回だけ走査して求める。
+
+- 走査時に全テキストノードを文書順のリストに集め、要素ごとにその範囲（開始・終了位置）を記録する。
+  要素の get_text() は範囲のテキストを連結するだけで求まり、部分木を何度もたどらない
+- h2・table・main・body も同じ走査で集めるため、find/find_all による文書全体の再検索をしない
+- BeautifulSoup の get_text() と同じく、コメントと script/style/template/rt/rp 内のテキストは含めない
+- 解析の途中経過は表示しない
+- libxml2 はテキスト中の CR を LF に置き換えるが、html.parser は CR を残すため、
+  タグの間のテキストの CR は文字参照（&#13;）にしてから解析する
+
+HTMLの構造が壊れたページでは、lxml（libxml2）と html.parser の木の組み立て方が異なり、
+結果が一致しない場合がある（parse_fixtures/pages/malformed.html）。
+parse_benchmark.py --check で、parse_fixtures のページの結果を基準ファイルと比較できる。
+"""
+
+import re
+
+import lxml.etree
+import lxml.html
+from bs4 import UnicodeDammit
+
+
+# BeautifulSoup の get_text() が対象外とするテキストを持つ要素（Script/Stylesheet/RubyText などの文字列になる）
+EXCLUDED_TEXT_TAGS = frozenset(['script', 'style', 'template', 'rt', 'rp'])
+
+# 「手順」見出しの後でテーブルより先に現れたら、手順テーブルの探索を打ち切る見出し
+SECTION_BREAK_TAGS = ('h3', 'h4')
+
+# CR を含む、タグの間のテキスト
+TEXT_WITH_CR = re.compile(r'(?<=>)[^<]*\r[^<]*')
+
+# body の開始タグ（libxml2 は省略された body を補うが、html.parser は補わない）
+BODY_START_TAG = re.compile(r'<body[\s/>]', re.IGNORECASE)
+
+
+class LxmlRecipePageParser:
+    """lxml で個別レシピページを1回の走査で解析するクラス"""
+    
+    def parse(self, recipe_info, content):
+        """個別レシピページ（バイト列）から詳細情報を抽出（parse_recipe_detail と同じ形式）"""
+        text = UnicodeDammit(content, is_html=True).unicode_markup
+        if '\r' in text:
+            text = TEXT_WITH_CR.sub(lambda match: match.group(0).replace('\r', '&#13;'), text)
+        try:
+            root = lxml.html.document_fromstring(text)
+        except lxml.etree.ParserError:
+            # 空の文書（html.parser では何も抽出されない）
+            root = lxml.html.Element('html')
+        document = _IndexedDocument(root)
+        
+        recipe_data = {
+            'id': recipe_info['id'],
+            'name': recipe_info['name'],
+            'url': recipe_info['url'],
+            'original_text': [],
+            'modern_translation': [],
+            'modern_recipe': {
+                'description': [],
+                'ingredients': [],
+                'modern_instructions': [],
+                'tips': ''
+            },
+            'modern_translation_instructions': [],
+            'original_instructions': [],
+            'usage': '',
+            'tools': '',
+            'raw_content': ''
+        }
+        
+        # lxml の要素は子が無いと偽になるため、None で判定する
+        main_content = document.first('main')
+        if main_content is None and BODY_START_TAG.search(text):
+            main_content = document.first('body')
+        if main_content is not None:
+            recipe_data['raw_content'] = '\n'.join(document.stripped_strings(main_content))
+        
+        # 翻刻テキスト・現代語訳（見出しのテキストが1つの文字列の h2 のみ対象）
+        for key, pattern in (('original_text', '翻刻テキスト'), ('modern_translation', '現代語訳')):
+            section = document.find_h2_with_string(pattern)
+            if section is not None:
+                parts = [document.text(current, strip=True)
+                         for current in _section_siblings(section)
+                         if current.tag in ('h4', 'p', 'div', 'table')]
+                if parts:
+                    recipe_data[key] = _split_lines('\n'.join(parts))
+        
+        # 現代レシピ（説明・コツ・リスト形式の作り方）
+        recipe_section = document.find_h2_with_string('現代レシピ')
+        if recipe_section is not None:
+            recipe_parts = []
+            for current in _section_siblings(recipe_section):
+                if current.tag == 'h3':
+                    recipe_parts.append(document.text(current, strip=True))
+                elif current.tag == 'p':
+                    prev_h4 = next(current.itersiblings('h4', preceding=True), None)
+                    if prev_h4 is not None and any(keyword in document.text(prev_h4) for keyword in ['コツ', 'ポイント']):
+                        recipe_data['modern_recipe']['tips'] = document.text(current, strip=True)
+                    else:
+                        recipe_parts.append(document.text(current, strip=True))
+                elif current.tag == 'ol':
+                    recipe_data['modern_recipe']['modern_instructions'].extend(
+                        document.text(li, strip=True) for li in current.iterdescendants('li'))
+            if recipe_parts:
+                recipe_data['modern_recipe']['description'] = _split_lines('\n'.join(recipe_parts))
+        
+        # 材料テーブル：ヘッダーに「材料」と「分量」が含まれているテーブル
+        for table in document.tables:
+            thead = next(table.iterdescendants('thead'), None)
+            tbody = next(table.iterdescendants('tbody'), None)
+            if thead is None or tbody is None:
+                continue
+            thead_text = document.text(thead)
+            if '材料' in thead_text and '分量' in thead_text:
+                for row in tbody.iterdescendants('tr'):
+                    cells = list(row.iterdescendants('td', 'th'))
+                    if len(cells) >= 2:
+                        ingredient_name = document.text(cells[0], strip=True)
+                        ingredient_amount = document.text(cells[1], strip=True)
+                        if ingredient_name and ingredient_amount and ingredient_name != '材料':
+                            recipe_data['modern_recipe']['ingredients'].append(
+                                f"{ingredient_name}: {ingredient_amount}")
+        
+        # 各セクションの手順テーブル
+        for h2 in document.h2s:
+            h2_text = document.text(h2)
+            if '現代レシピ' in h2_text:
+                steps = recipe_data['modern_recipe']['modern_instructions']
+            elif '現代語訳' in h2_text:
+                steps = recipe_data['modern_translation_instructions']
+            elif '翻刻テキスト' in h2_text:
+                steps = recipe_data['original_instructions']
+            else:
+                continue
+            self._extract_section_instructions(document, h2, steps)
+        
+        self._extract_flexible_content(document, recipe_data)
+        return recipe_data
+    
+    @staticmethod
+    def _extract_section_instructions(document, section_header, steps):
+        """セクション内の最初の「手順」見出しに続くテーブルから手順を抽出"""
+        for current in _section_siblings(section_header):
+            if current.tag != 'h4' or '手順' not in document.text(current):
+                continue
+            
+            for next_element in _section_siblings(current):
+                table = None
+                if next_element.tag == 'table':
+                    table = next_element
+                elif next_element.tag == 'div':
+                    table = next(next_element.iterdescendants('table'), None)
+                
+                if table is not None:
+                    tbody = next(table.iterdescendants('tbody'), None)
+                    rows = (tbody if tbody is not None else table).iterdescendants('tr')
+                    for row in rows:
+                        cells = list(row.iterdescendants('td', 'th'))
+                        if len(cells) >= 2:
+                            step_number = document.text(cells[0], strip=True)
+                            step_text = document.text(cells[-1], strip=True)
+                            if (step_text and step_number.isdigit() and
+                                    step_text != '手順' and len(step_text) > 5):
+                                steps.append(f"{step_number}: {step_text}")
+                    break
+                if next_element.tag in SECTION_BREAK_TAGS:
+                    break
+            break
+    
+    @staticmethod
+    def _extract_flexible_content(document, recipe_data):
+        """文書全体の行をキーワードでセクションに分類して、翻刻テキスト・現代語訳に追加"""
+        lines = _split_lines('\n'.join(document.stripped_strings()))
+        
+        current_section = ""
+        for line in lines:
+            if any(keyword in line for keyword in ['翻刻テキスト', '原文', '古文']):
+                current_section = "original"
+            elif any(keyword in line for keyword in ['現代語訳', '現代語']):
+                current_section = "translation"
+            elif any(keyword in line for keyword in ['現代レシピ', 'レシピ']):
+                current_section = "recipe"
+            elif any(keyword in line for keyword in ['材料']):
+                current_section = "ingredients"
+            elif any(keyword in line for keyword in ['作り方', '手順']):
+                current_section = "instructions"
+            elif any(keyword in line for keyword in ['使い方', '用途']):
+                current_section = "usage"
+            
+            if current_section == "original" and not any(keyword in line for keyword in ['翻刻テキスト', '原文']):
+                recipe_data['original_text'].append(line)
+            elif current_section == "translation" and not any(keyword in line for keyword in ['現代語訳', '現代語']):
+                recipe_data['modern_translation'].append(line)
+
+
+class _IndexedDocument:
+    """1回の走査で作成した、テキストノードと要素の索引"""
+    
+    def __init__(self, root):
+        self.strings = []   # get_text() の対象となるテキストノード（文書順）
+        self.spans = {}     # 要素 -> strings 内の (開始, 終了) 位置
+        self.h2s = []
+        self.tables = []
+        self._firsts = {}   # main/body -> 文書順で最初の要素
+        self._index(root, False)
+    
+    def _index(self, element, excluded):
+        """要素の部分木を文書順にたどり、テキストノードと要素の範囲を記録"""
+        tag = element.tag
+        if tag == 'h2':
+            self.h2s.append(element)
+        elif tag == 'table':
+            self.tables.append(element)
+        elif tag in ('main', 'body'):
+            self._firsts.setdefault(tag, element)
+        
+        excluded = excluded or tag in EXCLUDED_TEXT_TAGS
+        start = len(self.strings)
+        if element.text and not excluded:
+            self.strings.append(element.text)
+        for child in element:
+            # コメント・処理命令は本文に含めない（後続のテキストは含める）
+            if isinstance(child.tag, str):
+                self._index(child, excluded)
+            if child.tail and not excluded:
+                self.strings.append(child.tail)
+        # 自身の後続テキスト（tail）は親が追加するため、範囲に含まれない
+        self.spans[element] = (start, len(self.strings))
+    
+    def first(self, tag):
+        """文書順で最初の main/body 要素"""
+        return self._firsts.get(tag)
+    
+    def text(self, element, strip=False):
+        """BeautifulSoup の element.get_text() / get_text(strip=True) と同じテキスト"""
+        start, end = self.spans[element]
+        strings = self.strings[start:end]
+        if not strip:
+            return ''.join(strings)
+        return ''.join(stripped for stripped in (s.strip() for s in strings) if stripped)
+    
+    def stripped_strings(self, element=None):
+        """前後の空白を除いた空でないテキストノード（element 省略時は文書全体）"""
+        start, end = self.spans[element] if element is not None else (0, len(self.strings))
+        return [stripped for stripped in (s.strip() for s in self.strings[start:end]) if stripped]
+    
+    def find_h2_with_string(self, pattern):
+        """テキストが1つの文字列で、pattern を含む最初の h2（soup.find('h2', string=re.compile(pattern)) と同じ）"""
+        regex = re.compile(pattern)
+        for h2 in self.h2s:
+            string = _single_string(h2)
+            if string is not None and regex.search(string):
+                return h2
+        return None
+
+
+def _single_string(element):
+    """BeautifulSoup の Tag.string 相当（子が1つだけの場合にその文字列、それ以外はNone）"""
+    children = list(element)
+    if not children:
+        return element.text
+    if len(children) == 1 and not element.text and not children[0].tail:
+        child = children[0]
+        if not isinstance(child.tag, str):
+            return child.text
+        return _single_string(child)
+    return None
+
+
+def _section_siblings(element):
+    """element の後ろにある兄弟要素を、次の h2 の手前まで返す（コメントは除く）"""
+    for sibling in element.itersiblings():
+        if not isinstance(sibling.tag, str):
+            continue
+        if sibling.tag == 'h2':
+            return
+        yield sibling
+
+
+def _split_lines(text):
+    """改行で分割し、前後の空白を除いた空でない行のリストにする"""
+    return [line.strip() for line in text.split('\n') if line.strip()]
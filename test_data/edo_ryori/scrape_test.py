@@ -1,29 +1,295 @@
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import pandas as pd
 import time
 import json
-from urllib.parse import urljoin
+import os
+import random
+import hashlib
+import tempfile
+import io
+import threading
+import contextlib
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from urllib.parse import urljoin, urlsplit
 import re
 import argparse
 
+DEFAULT_BASE_URL = "https://codh.rois.ac.jp/edo-cooking/tamago-hyakuchin/recipe/"
+
+
+class TokenBucketRateLimiter:
+    """ホストごとのトークンバケットによるリクエスト間隔の制御
+    
+    ホストごとに毎秒 rate 個のトークンが補充され（最大 burst 個）、1リクエストで1個消費する。
+    トークンが無い場合は、補充されるまで呼び出し元のスレッドを待たせる。
+    """
+    
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._buckets = {}  # ホスト -> [トークン数, 最終補充時刻]
+        self._lock = threading.Lock()
+    
+    def acquire(self, url):
+        """URLのホストのトークンを1個消費（必要なら補充まで待機）"""
+        if not self.rate or self.rate <= 0:
+            return
+        
+        host = urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._buckets.setdefault(host, [float(self.burst), now])
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            # 先にトークンを予約し（負になり得る）、不足分が補充されるまで待つ
+            bucket[0] -= 1
+            wait = -bucket[0] / self.rate if bucket[0] < 0 else 0.0
+        
+        if wait > 0:
+            time.sleep(wait)
+
+
+class ResponseCache:
+    """URLごとのHTTPレスポンスのディスクキャッシュ
+    
+    URLのハッシュをファイル名として、本文（.body）、ETag・Last-Modified（.json）、
+    解析結果（.parsed.json）を保存する。書き込みは一時ファイルからの置き換えで行う（並行取得でも安全）。
+    """
+    
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+    
+    def _path(self, url, suffix):
+        return os.path.join(self.directory, hashlib.sha256(url.encode('utf-8')).hexdigest() + suffix)
+    
+    def _write(self, path, data):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    
+    def _read_json(self, path):
+        try:
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def get(self, url):
+        """キャッシュ済みのレスポンス（url/etag/last_modified/body を含む辞書）、無ければNone"""
+        meta = self._read_json(self._path(url, '.json'))
+        if meta is None:
+            return None
+        try:
+            with open(self._path(url, '.body'), 'rb') as f:
+                meta['body'] = f.read()
+        except OSError:
+            return None
+        return meta
+    
+    @staticmethod
+    def conditional_headers(entry):
+        """キャッシュ済みのレスポンスに対する条件付きリクエストのヘッダー"""
+        headers = {}
+        if entry is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def store(self, url, response):
+        """レスポンスの本文と検証用ヘッダーを保存（以前の解析結果は破棄）"""
+        try:
+            os.remove(self._path(url, '.parsed.json'))
+        except FileNotFoundError:
+            pass
+        self._write(self._path(url, '.body'), response.content)
+        meta = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'fetched_at': time.time(),
+        }
+        self._write(self._path(url, '.json'), json.dumps(meta, ensure_ascii=False).encode('utf-8'))
+    
+    def get_parsed(self, url, parser_version):
+        """保存済みの解析結果（parser_version が一致する場合のみ）、無ければNone"""
+        parsed = self._read_json(self._path(url, '.parsed.json'))
+        if parsed is None or parsed.get('parser_version') != parser_version:
+            return None
+        return parsed['data']
+    
+    def store_parsed(self, url, parser_version, data):
+        """解析結果を保存"""
+        payload = {'parser_version': parser_version, 'data': data}
+        self._write(self._path(url, '.parsed.json'), json.dumps(payload, ensure_ascii=False).encode('utf-8'))
+
+
+# 解析プロセス内で使い回すスクレイパー（解析方式ごと）
+_worker_scrapers = {}
+
+
+def _parse_page_chunk(parser, pages):
+    """解析プロセスで複数ページを解析（ProcessPoolExecutor から呼ばれる）
+    
+    Args:
+        parser: 解析方式（EdoRecipeScraper.PARSER_BACKENDS のいずれか）
+        pages: (recipe_info, 本文のバイト列) のリスト
+    
+    Returns:
+        (解析結果のリスト, 解析中の表示内容) のタプル（表示が混ざらないよう、呼び出し側でまとめて表示する）
+    """
+    scraper = _worker_scrapers.get(parser)
+    if scraper is None:
+        scraper = _worker_scrapers[parser] = EdoRecipeScraper(sleep_time=0, parser=parser)
+    
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        results = [scraper.parse_recipe_detail(recipe_info, content) for recipe_info, content in pages]
+    return results, output.getvalue()
+
+
 class EdoRecipeScraper:
-    def __init__(self, sleep_time=1):
-        self.base_url = "https://codh.rois.ac.jp/edo-cooking/tamago-hyakuchin/recipe/"
+    # 解析処理（parse_recipe_detail）のバージョン。変更したら上げると、キャッシュ済みの解析結果を使わなくなる
+    PARSER_VERSION = 2
+    
+    # 個別レシピページの解析方式
+    # - html.parser: BeautifulSoup + 標準ライブラリのパーサー（従来どおり、解析の経過を表示する）
+    # - lxml: BeautifulSoup + lxml のパーサー（木の組み立てだけを高速化）
+    # - lxml-direct: recipe_page_parser.LxmlRecipePageParser（lxml の木を1回だけ走査、経過は表示しない）
+    PARSER_BACKENDS = ('html.parser', 'lxml', 'lxml-direct')
+    
+    # 再試行するHTTPステータス（レート制限・一時的なサーバーエラー）
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    
+    def __init__(self, sleep_time=1, base_url=DEFAULT_BASE_URL, workers=1, rate=None,
+                 max_retries=3, backoff=1.0, timeout=30.0, cache_dir=None, offline=False,
+                 parser='html.parser', parse_workers=1, parse_chunk_size=8):
+        """
+        Args:
+            sleep_time: 逐次取得時の各リクエスト前のスリープ時間（秒）
+            base_url: レシピ一覧ページのURL（保存したページを配信するローカルサーバーも指定可能）
+            workers: 並行取得のワーカー数（1の場合は従来どおり逐次取得）
+            rate: 並行取得時のホストごとの最大リクエスト数/秒（None の場合は 1 / sleep_time）
+            max_retries: 接続エラー・一時的なエラー時の再試行回数
+            backoff: 再試行の待機時間の基準（秒、試行ごとに2倍）
+            timeout: 1リクエストのタイムアウト（秒）
+            cache_dir: レスポンスキャッシュのディレクトリ（指定時は条件付きリクエストで再取得する）
+            offline: True の場合はネットワークにアクセスせず、キャッシュ済みのページだけを解析し直す
+            parser: 個別レシピページの解析方式（PARSER_BACKENDS のいずれか）
+            parse_workers: 解析プロセス数（2以上の場合、ページの解析をプロセスプールで並列に行う）
+            parse_chunk_size: 解析プロセスへ1回に渡すページ数
+        """
+        if offline and cache_dir is None:
+            raise ValueError("オフライン再生にはキャッシュディレクトリの指定が必要です")
+        if parser not in self.PARSER_BACKENDS:
+            raise ValueError(f"不明な解析方式です: {parser}（{', '.join(self.PARSER_BACKENDS)}）")
+        self.parser = parser
+        self.parse_workers = max(1, parse_workers)
+        self.parse_chunk_size = max(1, parse_chunk_size)
+        self.page_parser = None
+        if parser == 'lxml-direct':
+            # lxml が必要なため、指定された場合だけ読み込む
+            from recipe_page_parser import LxmlRecipePageParser
+            self.page_parser = LxmlRecipePageParser()
+        self.base_url = base_url
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         self.recipes = []
         self.sleep_time = sleep_time
+        self.workers = max(1, workers)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.cache = ResponseCache(cache_dir) if cache_dir else None
+        self.offline = offline
+        self.cache_stats = {'fetched': 0, 'not_modified': 0, 'replayed': 0, 'reused_parse': 0}
+        self._stats_lock = threading.Lock()
+        
+        if offline:
+            # キャッシュだけを読むため、リクエスト間隔の制御は不要
+            self.sleep_time = 0
+            rate = 0
+        elif rate is None:
+            rate = 1.0 / sleep_time if sleep_time > 0 else 0
+        self.rate_limiter = TokenBucketRateLimiter(rate, burst=1)
+        
+        # 全リクエストで1つのセッションを共有し、接続を使い回す（keep-alive）
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+    
+    def _count(self, key):
+        with self._stats_lock:
+            self.cache_stats[key] += 1
+    
+    def _fetch(self, url):
+        """URLの本文（バイト列）を取得"""
+        return self._fetch_with_cache(url)[0]
+    
+    def _fetch_with_cache(self, url):
+        """URLの本文を取得（キャッシュ指定時は条件付きリクエスト）
+        
+        Returns:
+            (本文のバイト列, 304 Not Modified でキャッシュの本文を返したか) のタプル
+        """
+        if self.cache is None:
+            return self._request(url).content, False
+        
+        entry = self.cache.get(url)
+        if self.offline:
+            if entry is None:
+                raise LookupError(f"キャッシュにありません（オフライン）: {url}")
+            self._count('replayed')
+            return entry['body'], False
+        
+        response = self._request(url, self.cache.conditional_headers(entry))
+        if response.status_code == 304 and entry is not None:
+            self._count('not_modified')
+            return entry['body'], True
+        
+        self.cache.store(url, response)
+        self._count('fetched')
+        return response.content, False
+    
+    def _request(self, url, headers=None):
+        """URLを取得してレスポンスを返す
+        
+        接続エラー・タイムアウト・RETRY_STATUSES の場合は指数バックオフ（ジッター付き）で再試行する。
+        Retry-After ヘッダーがあればその秒数だけ待つ。
+        """
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+                if response.status_code not in self.RETRY_STATUSES or attempt == self.max_retries:
+                    response.raise_for_status()
+                    return response
+                retry_after = response.headers.get('Retry-After')
+                error = f"HTTP {response.status_code}"
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.max_retries:
+                    raise
+                error = e
+            
+            delay = self.backoff * (2 ** attempt)
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            delay += random.uniform(0, delay / 2)
+            print(f"再試行 {attempt + 1}/{self.max_retries}（{delay:.1f}秒後）: {url} - {error}")
+            time.sleep(delay)
         
     def get_recipe_list(self):
         """レシピ一覧ページから個別レシピのURLを取得"""
         try:
-            response = requests.get(self.base_url, headers=self.headers)
-            response.raise_for_status()
-            response.encoding = 'utf-8'
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(self._fetch(self.base_url), 'html.parser')
             
             # デバッグ情報を追加
             print(f"ページタイトル: {soup.title.text if soup.title else 'タイトルなし'}")
@@ -85,18 +351,103 @@ class EdoRecipeScraper:
 
     def scrape_recipe_detail(self, recipe_info):
         """個別レシピページの詳細情報を取得"""
+        print(f"レシピ '{recipe_info['name']}' を取得中...")
+        
+        # サーバー負荷軽減のためのスリープ
+        if self.sleep_time > 0:
+            time.sleep(self.sleep_time)
+        
+        page = self.fetch_recipe_page(recipe_info)
+        if page is None:
+            return None
+        return self.parse_fetched_page(recipe_info, *page)
+    
+    def fetch_recipe_page(self, recipe_info):
+        """個別レシピページを取得
+        
+        Returns:
+            (本文のバイト列, 304 Not Modified だったか) のタプル、失敗時はNone
+        """
         try:
-            print(f"レシピ '{recipe_info['name']}' を取得中...")
-            
-            # サーバー負荷軽減のためのスリープ
-            if self.sleep_time > 0:
-                time.sleep(self.sleep_time)
-            
-            response = requests.get(recipe_info['url'], headers=self.headers)
-            response.raise_for_status()
-            response.encoding = 'utf-8'
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+            return self._fetch_with_cache(recipe_info['url'])
+        except Exception as e:
+            print(f"レシピ '{recipe_info['name']}' の取得に失敗: {e}")
+            return None
+    
+    def parse_fetched_page(self, recipe_info, content, not_modified=False):
+        """取得したページを解析（304 で未変更のページは保存済みの解析結果を再利用）"""
+        cached = self._reuse_parsed(recipe_info, not_modified)
+        if cached is not None:
+            return cached
+        
+        recipe_data = self.parse_recipe_detail(recipe_info, content)
+        self._store_parsed(recipe_info, recipe_data)
+        return recipe_data
+    
+    def _reuse_parsed(self, recipe_info, not_modified):
+        """304 で未変更のページの保存済みの解析結果（無ければNone）"""
+        if not not_modified:
+            return None
+        cached = self.cache.get_parsed(recipe_info['url'], self.PARSER_VERSION)
+        if cached is None:
+            return None
+        self._count('reused_parse')
+        # 一覧側の番号・名前が変わっている場合に備えて上書きする
+        return dict(cached, id=recipe_info['id'], name=recipe_info['name'], url=recipe_info['url'])
+    
+    def _store_parsed(self, recipe_info, recipe_data):
+        """解析結果をキャッシュに保存（キャッシュ未使用・解析失敗時は何もしない）"""
+        if recipe_data is not None and self.cache is not None:
+            self.cache.store_parsed(recipe_info['url'], self.PARSER_VERSION, recipe_data)
+    
+    def _submit_chunk(self, pool, pages):
+        """解析プロセスに複数ページの解析を依頼"""
+        return pool.submit(_parse_page_chunk, self.parser, pages)
+    
+    @staticmethod
+    def _chunk_results(future, size):
+        """解析プロセスの結果を受け取り、解析中の表示をまとめて出力"""
+        try:
+            results, output = future.result()
+        except Exception as e:
+            # 解析プロセスの異常終了など（個々のページの解析エラーは parse_recipe_detail が処理する）
+            print(f"解析プロセスでの解析に失敗: {e}")
+            return [None] * size
+        print(output, end='')
+        return results
+    
+    def parse_pages(self, pages, chunk_size=None):
+        """取得済みの複数ページを解析（結果は pages の順）
+        
+        parse_workers が2以上の場合は、chunk_size ページずつ解析プロセスに割り振って並列に解析する。
+        キャッシュの解析結果は使わない・保存しない。
+        
+        Args:
+            pages: (recipe_info, 本文のバイト列) のリスト
+            chunk_size: 1回に解析プロセスへ渡すページ数（None の場合は parse_chunk_size）
+        
+        Returns:
+            解析結果（失敗したページはNone）のリスト
+        """
+        if self.parse_workers <= 1:
+            return [self.parse_recipe_detail(recipe_info, content) for recipe_info, content in pages]
+        
+        chunk_size = chunk_size or self.parse_chunk_size
+        chunks = [pages[i:i + chunk_size] for i in range(0, len(pages), chunk_size)]
+        recipes = []
+        with ProcessPoolExecutor(max_workers=self.parse_workers) as pool:
+            futures = [self._submit_chunk(pool, chunk) for chunk in chunks]
+            for chunk, future in zip(chunks, futures):
+                recipes.extend(self._chunk_results(future, len(chunk)))
+        return recipes
+    
+    def parse_recipe_detail(self, recipe_info, content):
+        """取得済みの個別レシピページ（バイト列）から詳細情報を抽出"""
+        if self.page_parser is not None:
+            return self._parse_with_page_parser(recipe_info, content)
+        
+        try:
+            soup = BeautifulSoup(content, self.parser)
             
             recipe_data = {
                 'id': recipe_info['id'],
@@ -177,7 +528,7 @@ class EdoRecipeScraper:
                     elif current.name == 'ol':
                         # 作り方（リスト形式）
                         instructions = [li.get_text(strip=True) for li in current.find_all('li')]
-                        recipe_data['modern_recipe']['instructions'].extend(instructions)
+                        recipe_data['modern_recipe']['modern_instructions'].extend(instructions)
                     current = current.find_next_sibling()
                 
                 if recipe_parts:
@@ -242,7 +593,15 @@ class EdoRecipeScraper:
             return recipe_data
             
         except Exception as e:
-            print(f"レシピ '{recipe_info['name']}' の取得に失敗: {e}")
+            print(f"レシピ '{recipe_info['name']}' の解析に失敗: {e}")
+            return None
+    
+    def _parse_with_page_parser(self, recipe_info, content):
+        """lxml-direct: LxmlRecipePageParser で解析（結果は parse_recipe_detail と同じ形式）"""
+        try:
+            return self.page_parser.parse(recipe_info, content)
+        except Exception as e:
+            print(f"レシピ '{recipe_info['name']}' の解析に失敗: {e}")
             return None
 
     def _extract_instructions_for_section(self, soup, section_header, recipe_data, section_type):
@@ -377,8 +736,14 @@ class EdoRecipeScraper:
             print(f"レシピ #{recipe_number} の取得に失敗しました")
             return []
     
-    def scrape_recipes(self, num_recipes=None):
-        """指定された数のレシピを取得"""
+    def scrape_recipes(self, num_recipes=None, on_recipe=None):
+        """指定された数のレシピを取得
+        
+        Args:
+            num_recipes: 取得するレシピ数（Noneで全件）
+            on_recipe: 解析が完了したレシピを1件ずつ受け取るコールバック
+                （全件の取得を待たずに呼ばれる。並行取得時は解析スレッドから、解析が完了した順に呼ばれる）
+        """
         print("=== 江戸料理レシピスクレイピング開始 ===")
         
         # レシピ一覧を取得
@@ -396,17 +761,111 @@ class EdoRecipeScraper:
             selected_recipes = recipe_list[:num_recipes]
             print(f"{len(selected_recipes)} 件のレシピを取得します")
         
-        scraped_recipes = []
-        for i, recipe_info in enumerate(selected_recipes, 1):
-            print(f"\n[{i}/{len(selected_recipes)}] 処理中...")
-            
-            recipe_data = self.scrape_recipe_detail(recipe_info)
-            if recipe_data:
-                scraped_recipes.append(recipe_data)
-                self._print_recipe_summary(recipe_data)
+        if self.workers > 1 or self.parse_workers > 1:
+            scraped_recipes = self.scrape_recipes_concurrently(selected_recipes, on_recipe)
+        else:
+            scraped_recipes = []
+            for i, recipe_info in enumerate(selected_recipes, 1):
+                print(f"\n[{i}/{len(selected_recipes)}] 処理中...")
+                
+                recipe_data = self.scrape_recipe_detail(recipe_info)
+                if recipe_data:
+                    scraped_recipes.append(recipe_data)
+                    self._print_recipe_summary(recipe_data)
+                    if on_recipe is not None:
+                        on_recipe(recipe_data)
         
         print(f"\n=== 完了: {len(scraped_recipes)} 件のレシピを取得 ===")
         return scraped_recipes
+    
+    def scrape_recipes_concurrently(self, recipe_infos, on_recipe=None):
+        """複数レシピを並行取得（結果はレシピ一覧の順）
+        
+        workers 個のスレッドがホストごとのレート制限の範囲で並行してページを取得し、
+        解析は取得が完了したページから専用スレッドで行う（取得スレッドは解析を待たずに次のページへ進む）。
+        parse_workers が2以上の場合は、取得済みのページを parse_chunk_size 件ずつまとめて解析プロセスに渡し
+        （最後の端数は取得の完了後に渡す）、GIL に妨げられずに複数のCPUコアで解析する。
+        解析プロセスの結果は1つの集約スレッドが受け取り、キャッシュへの保存と on_recipe の呼び出しを行う。
+        """
+        started = time.perf_counter()
+        print(f"並行取得: ワーカー数 {self.workers}, 最大 {self.rate_limiter.rate or '無制限'} リクエスト/秒, "
+              f"解析プロセス数 {self.parse_workers}")
+        
+        def fetch(recipe_info):
+            self.rate_limiter.acquire(recipe_info['url'])
+            return self.fetch_recipe_page(recipe_info)
+        
+        def parse(recipe_info, content, not_modified):
+            recipe_data = self.parse_fetched_page(recipe_info, content, not_modified)
+            if recipe_data and on_recipe is not None:
+                on_recipe(recipe_data)
+            return recipe_data
+        
+        def finish(i, recipe_data):
+            if recipe_data and on_recipe is not None:
+                on_recipe(recipe_data)
+            parsed[i] = recipe_data
+        
+        def collect(indices, future):
+            # 集約スレッドで解析プロセスの結果を受け取り、キャッシュへ保存
+            for i, recipe_data in zip(indices, self._chunk_results(future, len(indices))):
+                self._store_parsed(recipe_infos[i], recipe_data)
+                finish(i, recipe_data)
+        
+        def flush_chunk():
+            if pending:
+                future = self._submit_chunk(parse_pool, [(recipe_infos[i], content) for i, content in pending])
+                collect_futures.append(collect_executor.submit(collect, [i for i, _ in pending], future))
+                pending.clear()
+        
+        parsed = {}
+        parse_futures = {}
+        collect_futures = []
+        pending = []
+        parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers) if self.parse_workers > 1 else None
+        with contextlib.ExitStack() as stack:
+            if parse_pool is not None:
+                stack.enter_context(parse_pool)
+                collect_executor = stack.enter_context(
+                    ThreadPoolExecutor(max_workers=1, thread_name_prefix='parse-collect'))
+            else:
+                parse_executor = stack.enter_context(
+                    ThreadPoolExecutor(max_workers=self.parse_workers, thread_name_prefix='parse'))
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='fetch') as fetch_executor:
+                fetch_futures = {fetch_executor.submit(fetch, recipe_info): i
+                                 for i, recipe_info in enumerate(recipe_infos)}
+                for future in as_completed(fetch_futures):
+                    i = fetch_futures[future]
+                    page = future.result()
+                    if page is None:
+                        continue
+                    if parse_pool is None:
+                        parse_futures[i] = parse_executor.submit(parse, recipe_infos[i], *page)
+                        continue
+                    
+                    content, not_modified = page
+                    reused = self._reuse_parsed(recipe_infos[i], not_modified)
+                    if reused is not None:
+                        collect_futures.append(collect_executor.submit(finish, i, reused))
+                        continue
+                    pending.append((i, content))
+                    if len(pending) >= self.parse_chunk_size:
+                        flush_chunk()
+            flush_chunk()
+            
+            for future in collect_futures:
+                # 集約スレッドでの例外（on_recipe の失敗など）を呼び出し元に伝える
+                future.result()
+            for i, future in parse_futures.items():
+                parsed[i] = future.result()
+            scraped_recipes = [parsed[i] for i in sorted(parsed) if parsed[i]]
+        
+        for recipe_data in scraped_recipes:
+            self._print_recipe_summary(recipe_data)
+        
+        elapsed = time.perf_counter() - started
+        print(f"\n並行取得: {len(scraped_recipes)}/{len(recipe_infos)} 件, {elapsed:.1f} 秒")
+        return scraped_recipes
 
     def _print_recipe_summary(self, recipe_data):
         """レシピデータの概要を表示"""
@@ -492,6 +951,24 @@ def parse_arguments():
                       help='HTTP取得前のスリープ時間（秒、デフォルト: 1.0）')
     parser.add_argument('--output', type=str, default='edo_recipes',
                       help='出力ファイル名のベース（デフォルト: edo_recipes）')
+    parser.add_argument('--base-url', type=str, default=DEFAULT_BASE_URL,
+                      help='レシピ一覧ページのURL（保存したページを配信するローカルサーバーなど）')
+    parser.add_argument('--workers', type=int, default=1,
+                      help='並行取得のワーカー数（デフォルト: 1 = 逐次取得）')
+    parser.add_argument('--rate', type=float, default=None,
+                      help='並行取得時のホストごとの最大リクエスト数/秒（デフォルト: 1 / --sleep-time、0で無制限）')
+    parser.add_argument('--max-retries', type=int, default=3,
+                      help='接続エラー・一時的なエラー時の再試行回数（デフォルト: 3）')
+    parser.add_argument('--cache-dir', type=str, default=None,
+                      help='レスポンスキャッシュのディレクトリ（ETag/Last-Modified による条件付きリクエスト）')
+    parser.add_argument('--offline', action='store_true', default=False,
+                      help='ネットワークにアクセスせず、--cache-dir のページを解析し直す')
+    parser.add_argument('--parse-workers', type=int, default=1,
+                      help='解析プロセス数（デフォルト: 1 = 解析スレッドのみ）')
+    parser.add_argument('--parse-chunk-size', type=int, default=8,
+                      help='解析プロセスへ1回に渡すページ数（デフォルト: 8）')
+    parser.add_argument('--parser', type=str, default='html.parser', choices=EdoRecipeScraper.PARSER_BACKENDS,
+                      help='個別レシピページの解析方式（デフォルト: html.parser）')
     
     args = parser.parse_args()
     
@@ -499,6 +976,12 @@ def parse_arguments():
     if args.get_recipe is not None and args.num_recipes != 5:
         parser.error("--get-recipe と --num-recipes は同時に指定できません")
     
+    if args.offline and args.cache_dir is None:
+        parser.error("--offline には --cache-dir の指定が必要です")
+    
+    if args.parse_chunk_size < 1:
+        parser.error("--parse-chunk-size は1以上を指定してください")
+    
     return args
 
 def main():
@@ -506,7 +989,10 @@ def main():
     args = parse_arguments()
     
     # スクレイパーを初期化
-    scraper = EdoRecipeScraper(sleep_time=args.sleep_time)
+    scraper = EdoRecipeScraper(sleep_time=args.sleep_time, base_url=args.base_url, workers=args.workers,
+                               rate=args.rate, max_retries=args.max_retries,
+                               cache_dir=args.cache_dir, offline=args.offline, parser=args.parser,
+                               parse_workers=args.parse_workers, parse_chunk_size=args.parse_chunk_size)
     
     # レシピ数のみ表示して終了
     if args.count_only:
@@ -559,6 +1045,11 @@ def main():
         print(f"   出力ファイル: {json_filename}, {csv_filename}")
     else:
         print("❌ レシピデータの取得に失敗しました")
+    
+    if scraper.cache is not None:
+        stats = scraper.cache_stats
+        print(f"\nキャッシュ: 取得 {stats['fetched']} 件, 未変更(304) {stats['not_modified']} 件, "
+              f"オフライン再生 {stats['replayed']} 件, 解析結果の再利用 {stats['reused_parse']} 件")
 
 if __name__ == "__main__":
     main()